@@ -1,4 +1,5 @@
 import os
+import re
 import json
 import base64
 from pathlib import Path
@@ -10,6 +11,17 @@ from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 from ..exceptions import ConfigurationError
 
+# Maximum number of decrypted values remembered per ConfigManager
+_DECRYPT_CACHE_SIZE = 256
+
+# KEY=value lines of a .env file, skipping blank and comment lines
+_DOTENV_PATTERN = re.compile(r'^[ \t]*([^#=\s][^=\r\n]*?)[ \t]*=[ \t]*(.*?)[^\S\n]*$', re.MULTILINE)
+
+# Lowercased strings parsed as booleans and None
+_TRUE_VALUES = frozenset(('true', 'yes', '1'))
+_FALSE_VALUES = frozenset(('false', 'no', '0'))
+_NONE_VALUES = frozenset(('null', 'none'))
+
 class ConfigManager:
     """
     Manages application configuration from multiple sources with security features.
@@ -37,6 +49,7 @@ class ConfigManager:
         # Set up encryption
         self._encryption_key = encryption_key or os.environ.get('PYTHON_CONFIG_KEY')
         self._cipher = None
+        self._decrypted = {}
         
         if self._encryption_key:
             self._setup_encryption()
@@ -65,6 +78,9 @@ class ConfigManager:
             # Generate the Fernet key
             key = base64.urlsafe_b64encode(kdf.derive(key_bytes))
             self._cipher = Fernet(key)
+            
+            # Values decrypted with a previous key are no longer valid
+            self._decrypted = {}
         except Exception as e:
             raise ConfigurationError(f"Failed to set up encryption: {str(e)}")
     
@@ -156,34 +172,26 @@ class ConfigManager:
         try:
             file_path = Path(file_path)
             
-            if not file_path.exists():
+            try:
+                text = file_path.read_text()
+            except FileNotFoundError:
                 return False
                 
-            with open(file_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
+            # Parse all key-value pairs in one pass over the file
+            for match in _DOTENV_PATTERN.finditer(text):
+                key, value = match.groups()
+                
+                # Remove quotes if present
+                if value and value[0] == value[-1] and value[0] in ('"', "'"):
+                    value = value[1:-1]
                     
-                    # Skip comments and empty lines
-                    if not line or line.startswith('#'):
-                        continue
-                        
-                    # Parse key-value pairs
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip()
-                        
-                        # Remove quotes if present
-                        if value and value[0] == value[-1] and value[0] in ('"', "'"):
-                            value = value[1:-1]
-                            
-                        # Set environment variable and config
-                        os.environ[key] = value
-                        
-                        # Convert environment variable name to config key
-                        # e.g., APP_NAME -> app.name
-                        config_key = key.lower().replace('_', '.')
-                        self.set(config_key, self._parse_value(value))
+                # Set environment variable and config
+                os.environ[key] = value
+                
+                # Convert environment variable name to config key
+                # e.g., APP_NAME -> app.name
+                config_key = key.lower().replace('_', '.')
+                self.set(config_key, self._parse_value(value))
                         
             return True
         except Exception as e:
@@ -224,14 +232,16 @@ class ConfigManager:
         Returns:
             Parsed value with appropriate type.
         """
+        lowered = value.lower()
+        
         # Boolean values
-        if value.lower() in ('true', 'yes', '1'):
+        if lowered in _TRUE_VALUES:
             return True
-        elif value.lower() in ('false', 'no', '0'):
+        elif lowered in _FALSE_VALUES:
             return False
             
         # None values
-        if value.lower() in ('null', 'none'):
+        if lowered in _NONE_VALUES:
             return None
             
         # Try numeric values
@@ -290,6 +300,18 @@ class ConfigManager:
         # Set the value
         current[parts[-1]] = value
     
+    def update_many(self, values: Dict[str, Any]) -> None:
+        """
+        Merge a nested dictionary of configuration values in one pass.
+        
+        Nested dictionaries are merged into existing sections, so
+        update_many({"app": {"name": "App"}}) only replaces app.name.
+        
+        Args:
+            values: Nested configuration values to merge.
+        """
+        self._merge_config(values)
+    
     def is_test_environment(self) -> bool:
         """
         Check if current environment is a test environment.
@@ -343,6 +365,9 @@ class ConfigManager:
         """
         Decrypt a sensitive configuration value.
         
+        Decrypted values are remembered per ciphertext, so repeated reads of
+        the same encrypted setting skip the decryption.
+        
         Args:
             encrypted_value: Encrypted value as a base64 string.
             
@@ -358,19 +383,27 @@ class ConfigManager:
                 "CONFIG-007"
             )
             
+        decrypted = self._decrypted.get(encrypted_value)
+        if decrypted is not None:
+            return decrypted
+            
         try:
             # Decode from base64
             encrypted_bytes = base64.urlsafe_b64decode(encrypted_value)
             
             # Decrypt the value
-            decrypted = self._cipher.decrypt(encrypted_bytes)
-            
-            return decrypted.decode()
+            decrypted = self._cipher.decrypt(encrypted_bytes).decode()
         except Exception as e:
             raise ConfigurationError(
                 f"Decryption failed: {str(e)}",
                 "CONFIG-008"
             )
+            
+        if len(self._decrypted) >= _DECRYPT_CACHE_SIZE:
+            self._decrypted.clear()
+        self._decrypted[encrypted_value] = decrypted
+        
+        return decrypted
     
     def get_encrypted(self, key: str, default: Any = None) -> str:
         """
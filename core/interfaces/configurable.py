@@ -7,6 +7,9 @@ class Configurable:
     Provides standard methods for configuration management.
     """
     
+    # Empty so subclasses that declare __slots__ get no instance __dict__
+    __slots__ = ()
+    
     def configure(self, config=None):
         """
         Configure the component.
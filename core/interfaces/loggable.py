@@ -7,6 +7,9 @@ class Loggable:
     Provides standard methods for logger initialization and access.
     """
     
+    # Holds no state itself, so it does not force a __dict__ on subclasses
+    __slots__ = ()
+    
     def initialize_logger(self, name, log_file=None, level=None, format_str=None):
         """
         Initialize a logger for this component.
@@ -0,0 +1,387 @@
+"""
+Asynchronous PostgreSQL database client implementation.
+"""
+
+import re
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+from ...core.base.base_client import BaseClient
+from ...core.interfaces.configurable import Configurable
+from ...core.interfaces.loggable import Loggable
+from ...core.exceptions import DatabaseError, ConnectionError
+from .database_client import _split_insert_values
+
+# Unquoted target table and columns of an INSERT prefix, for COPY
+_COPY_TARGET_PATTERN = re.compile(r"^\s*INSERT\s+INTO\s+([\w.]+)\s*\(([\w\s,]+)\)\s+VALUES$", re.IGNORECASE)
+
+class AsyncPostgreSQLClient(BaseClient, Configurable, Loggable):
+    """
+    Asynchronous client for PostgreSQL database operations.
+    
+    Built on asyncpg, so many queries can be in flight at once on a single
+    event loop. Queries use asyncpg's $1, $2, ... placeholders, and rows are
+    returned as asyncpg Records, which support record["column"] access and
+    dict(record).
+    """
+    
+    def __init__(self, config=None):
+        """
+        Initialize the AsyncPostgreSQLClient.
+        
+        Args:
+            config: Configuration for the client.
+        """
+        self.configure(config)
+        self.initialize_logger("async_postgresql_client")
+        
+        self._host = self.config.get("services.database.postgresql.host", "localhost")
+        self._port = self.config.get("services.database.postgresql.port", 5432)
+        self._database = self.config.get("services.database.postgresql.database")
+        self._user = self.config.get("services.database.postgresql.user")
+        self._password = self.config.get("services.database.postgresql.password")
+        self._application_name = self.config.get("services.database.postgresql.application_name", "python_library")
+        self._copy_threshold = self.config.get("services.database.postgresql.copy_threshold", 5000)
+        
+        # Connection pool settings
+        self._min_connections = self.config.get("services.database.postgresql.pool.min_connections", 1)
+        self._max_connections = self.config.get("services.database.postgresql.pool.max_connections", 5)
+        self._pool = None
+        self._pool_lock = None
+        
+        # Per-task transaction (connection, lock); tasks created inside a
+        # transaction inherit it and take the lock to use the connection
+        self._transaction = ContextVar(f"async_postgresql_transaction_{id(self)}", default=None)
+        
+        # Check if asyncpg is available, keeping the module for later calls
+        try:
+            import asyncpg
+            self._asyncpg = asyncpg
+            self._asyncpg_available = True
+        except ImportError:
+            self._asyncpg = None
+            self._asyncpg_available = False
+            self.logger.warning("asyncpg not available. Please install with: pip install asyncpg")
+    
+    async def connect(self):
+        """
+        Get the connection pool, creating it on first use.
+        
+        Returns:
+            Pool: asyncpg connection pool.
+        
+        Raises:
+            ConnectionError: If connection fails.
+            ImportError: If asyncpg is not installed.
+        """
+        if self._pool is not None:
+            return self._pool
+        
+        if not self._asyncpg_available:
+            raise ImportError("asyncpg module not found. Please install it with: pip install asyncpg")
+        
+        if self._pool_lock is None:
+            self._pool_lock = asyncio.Lock()
+        
+        async with self._pool_lock:
+            if self._pool is None:
+                try:
+                    self._pool = await self._asyncpg.create_pool(
+                        host=self._host,
+                        port=self._port,
+                        database=self._database,
+                        user=self._user,
+                        password=self._password,
+                        min_size=self._min_connections,
+                        max_size=self._max_connections,
+                        server_settings={"application_name": self._application_name}
+                    )
+                except Exception as e:
+                    self.logger.error(f"PostgreSQL connection error: {str(e)}")
+                    raise ConnectionError(
+                        "AsyncPostgreSQLClient",
+                        f"Failed to connect to PostgreSQL database: {str(e)}",
+                        "POSTGRES-001"
+                    )
+                
+                self.logger.info(f"Connected to PostgreSQL database: {self._host}:{self._port}/{self._database}")
+        
+        return self._pool
+    
+    @asynccontextmanager
+    async def _acquire(self):
+        """
+        Yield the current transaction's connection, or one from the pool.
+        
+        The transaction connection is held under the transaction's lock,
+        since an asyncpg connection runs one operation at a time.
+        
+        Yields:
+            Connection: asyncpg connection.
+        """
+        scope = self._transaction.get()
+        if scope is not None:
+            connection, lock = scope
+            async with lock:
+                yield connection
+            return
+        
+        pool = await self.connect()
+        async with pool.acquire() as connection:
+            yield connection
+    
+    async def close(self):
+        """
+        Close all pooled database connections.
+        """
+        if self._pool is not None:
+            try:
+                await self._pool.close()
+                self._pool = None
+                self.logger.info("PostgreSQL connection closed")
+            except Exception as e:
+                self.logger.error(f"Error closing PostgreSQL connection: {str(e)}")
+    
+    async def execute(self, query, parameters=None):
+        """
+        Execute a query that doesn't return results.
+        
+        Args:
+            query: SQL query string.
+            parameters: Query parameters.
+        
+        Returns:
+            int: Number of affected rows.
+        
+        Raises:
+            DatabaseError: If query execution fails.
+        """
+        try:
+            async with self._acquire() as connection:
+                self.logger.debug("Executing query: %s", query)
+                status = await connection.execute(query, *(parameters or ()))
+            
+            # The command tag ends with the row count, e.g. "UPDATE 3"
+            affected_rows = status.rpartition(" ")[2]
+            return int(affected_rows) if affected_rows.isdigit() else 0
+        except Exception as e:
+            self.logger.error(f"Query execution error: {str(e)}")
+            raise DatabaseError(
+                f"Query execution failed: {str(e)}",
+                query=query,
+                error_code="POSTGRES-002"
+            )
+    
+    async def query(self, query, parameters=None):
+        """
+        Execute a query that returns results.
+        
+        Args:
+            query: SQL query string.
+            parameters: Query parameters.
+        
+        Returns:
+            list: Query results as a list of Records.
+        
+        Raises:
+            DatabaseError: If query execution fails.
+        """
+        try:
+            async with self._acquire() as connection:
+                self.logger.debug("Executing query: %s", query)
+                return await connection.fetch(query, *(parameters or ()))
+        except Exception as e:
+            self.logger.error(f"Query execution error: {str(e)}")
+            raise DatabaseError(
+                f"Query execution failed: {str(e)}",
+                query=query,
+                error_code="POSTGRES-003"
+            )
+    
+    async def query_one(self, query, parameters=None):
+        """
+        Execute a query and return a single result.
+        
+        Args:
+            query: SQL query string.
+            parameters: Query parameters.
+        
+        Returns:
+            Record: First row of results or None if no results.
+        
+        Raises:
+            DatabaseError: If query execution fails.
+        """
+        try:
+            async with self._acquire() as connection:
+                self.logger.debug("Executing query: %s", query)
+                return await connection.fetchrow(query, *(parameters or ()))
+        except Exception as e:
+            self.logger.error(f"Query execution error: {str(e)}")
+            raise DatabaseError(
+                f"Query execution failed: {str(e)}",
+                query=query,
+                error_code="POSTGRES-003"
+            )
+    
+    async def executemany(self, query, parameters_list):
+        """
+        Execute a query multiple times with different parameters.
+        
+        A single-row INSERT INTO table (cols) VALUES ($1, ...) with at least
+        copy_threshold parameter sets is loaded with binary COPY instead.
+        asyncpg does not report row counts for executemany, so the count is
+        the number of parameter sets sent.
+        
+        Args:
+            query: SQL query string.
+            parameters_list: List of parameter sets.
+        
+        Returns:
+            int: Number of affected rows.
+        
+        Raises:
+            DatabaseError: If query execution fails.
+        """
+        if not parameters_list:
+            return 0
+        
+        try:
+            async with self._acquire() as connection:
+                self.logger.debug("Executing batch query: %s with %d parameter sets", query, len(parameters_list))
+                
+                copy_target = self._copy_target(query, len(parameters_list))
+                if copy_target:
+                    schema, table, columns = copy_target
+                    await connection.copy_records_to_table(
+                        table,
+                        records=parameters_list,
+                        columns=columns,
+                        schema_name=schema
+                    )
+                else:
+                    # Runs atomically, in a transaction of its own if needed
+                    await connection.executemany(query, parameters_list)
+            
+            return len(parameters_list)
+        except Exception as e:
+            self.logger.error(f"Batch query execution error: {str(e)}")
+            raise DatabaseError(
+                f"Batch query execution failed: {str(e)}",
+                query=query,
+                error_code="POSTGRES-004"
+            )
+    
+    def _copy_target(self, query, row_count):
+        """
+        Get the COPY target for a bulk insert, if COPY should be used.
+        
+        Args:
+            query: SQL query string.
+            row_count: Number of parameter sets to insert.
+        
+        Returns:
+            tuple: (schema, table, columns) or None to use executemany.
+        """
+        if row_count < self._copy_threshold:
+            return None
+        
+        insert_parts = _split_insert_values(query)
+        if not insert_parts:
+            return None
+        
+        prefix, template = insert_parts
+        match = _COPY_TARGET_PATTERN.match(prefix)
+        if not match:
+            return None
+        
+        # Rows can only be copied as-is if the placeholders are $1..$n in order
+        table, columns = match.groups()
+        columns = [column.strip() for column in columns.split(",")]
+        placeholders = [placeholder.strip() for placeholder in template[1:-1].split(",")]
+        if placeholders != [f"${i}" for i in range(1, len(columns) + 1)]:
+            return None
+        
+        schema, _, table = table.rpartition(".")
+        return schema or None, table, columns
+    
+    @asynccontextmanager
+    async def transaction(self):
+        """
+        Create a transaction context.
+        
+        Nested transactions become savepoints, so an inner failure only
+        rolls back the inner block. Tasks started inside the block, e.g.
+        with asyncio.gather, share its connection and run their statements
+        on it one at a time.
+        
+        Usage:
+            async with db_client.transaction():
+                await db_client.execute("INSERT INTO ...")
+                await db_client.execute("UPDATE ...")
+        
+        Raises:
+            DatabaseError: If transaction operations fail.
+        """
+        scope = self._transaction.get()
+        if scope is not None:
+            async with self._transaction_scope(*scope):
+                yield
+            return
+            
+        pool = await self.connect()
+        async with pool.acquire() as connection:
+            async with self._transaction_scope(connection, asyncio.Lock()):
+                yield
+    
+    @asynccontextmanager
+    async def _transaction_scope(self, connection, lock):
+        """
+        Run a transaction, or a savepoint if one is already open, on a connection.
+        
+        Args:
+            connection: asyncpg connection.
+            lock: Lock serializing use of the connection.
+        
+        Raises:
+            DatabaseError: If starting, committing or rolling back fails.
+        """
+        transaction = connection.transaction()
+        await self._transaction_step(lock, transaction.start, "start")
+        self.logger.debug("Starting transaction")
+        
+        token = self._transaction.set((connection, lock))
+        try:
+            yield
+        except BaseException as e:
+            self._transaction.reset(token)
+            await self._transaction_step(lock, transaction.rollback, "rollback")
+            self.logger.debug("Transaction rolled back: %s", e)
+            raise
+            
+        self._transaction.reset(token)
+        await self._transaction_step(lock, transaction.commit, "commit")
+        self.logger.debug("Transaction committed")
+    
+    async def _transaction_step(self, lock, step, action):
+        """
+        Run one transaction control statement under the connection lock.
+        
+        Args:
+            lock: Lock serializing use of the connection.
+            step: Coroutine function such as transaction.commit.
+            action: Name of the step, for error messages.
+        
+        Raises:
+            DatabaseError: If the statement fails.
+        """
+        try:
+            async with lock:
+                await step()
+        except Exception as e:
+            self.logger.error(f"Transaction {action} error: {str(e)}")
+            raise DatabaseError(
+                f"Transaction {action} failed: {str(e)}",
+                error_code="POSTGRES-006"
+            )
@@ -1,9 +1,15 @@
+import re
 import sqlite3
+import asyncio
 from typing import List, Dict, Any, Optional, Union, Tuple, Iterator, ContextManager
 from contextlib import contextmanager
+from functools import lru_cache, partial
+from itertools import chain, islice
 import time
 import threading
-from queue import Queue, Empty
+import weakref
+from pathlib import Path
+from collections import deque
 
 from core.base.base_client import BaseClient
 from core.interfaces.configurable import Configurable
@@ -11,15 +17,128 @@ from core.interfaces.loggable import Loggable
 from core.interfaces.database import Database
 from core.exceptions import DatabaseError, ConnectionError
 
+# Leading keyword of a SQL statement, used to classify queries
+_STATEMENT_PATTERN = re.compile(r"^\s*(SELECT|INSERT|UPDATE|DELETE|WITH)\b", re.IGNORECASE)
+
+# Matches a single-row "INSERT INTO table (cols) VALUES (...)" statement so it
+# can be rewritten into one multi-row VALUES statement for PostgreSQL and SQLite.
+_INSERT_VALUES_PATTERN = re.compile(
+    r"^\s*(INSERT\s+INTO\s+\S+\s*\([^)]+\)\s+VALUES)\s*(\([^)]+\))\s*;?\s*$",
+    re.IGNORECASE
+)
+
+# A VALUES template made only of anonymous "?" placeholders, the one shape
+# that can be repeated per row without renumbering parameters
+_POSITIONAL_TEMPLATE_PATTERN = re.compile(r"^\(\s*\?(?:\s*,\s*\?)*\s*\)$")
+
+# Plain, optionally schema-qualified identifier accepted by bulk_load
+_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_]\w*(\.[A-Za-z_]\w*)?$", re.ASCII)
+
+# Default cap on bound parameters per SQLite statement (999 before 3.32)
+_SQLITE_MAX_VARIABLES = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+
+# Row-limiting clauses that make appending LIMIT 1 unnecessary
+_ROW_LIMIT_PATTERN = re.compile(r"\b(LIMIT|FETCH\s+(FIRST|NEXT))\b", re.IGNORECASE)
+
+@lru_cache(maxsize=512)
+def _classify_query(query):
+    """
+    Classify a SQL statement by its leading keyword.
+    
+    Results are cached per query string, so repeated statements skip the
+    regex match entirely.
+    
+    Args:
+        query: SQL query string.
+        
+    Returns:
+        str: "SELECT", "INSERT", "UPDATE", "DELETE", "WITH" or "OTHER".
+    """
+    match = _STATEMENT_PATTERN.match(query)
+    return match.group(1).upper() if match else "OTHER"
+
+@lru_cache(maxsize=512)
+def _split_insert_values(query):
+    """
+    Split a single-row INSERT statement into its prefix and VALUES template.
+    
+    Args:
+        query: SQL query string.
+        
+    Returns:
+        tuple: (prefix, template) or None if the query is not a plain
+        INSERT ... VALUES statement.
+    """
+    if _classify_query(query) != "INSERT":
+        return None
+        
+    match = _INSERT_VALUES_PATTERN.match(query)
+    return match.groups() if match else None
+
+@lru_cache(maxsize=512)
+def _limit_one(query):
+    """
+    Append LIMIT 1 to a SELECT that has no row limit of its own.
+    
+    Args:
+        query: SQL query string.
+        
+    Returns:
+        str: The limited query, or the original query if it is not a
+        SELECT/WITH statement or already limits its rows.
+    """
+    if _classify_query(query) not in ("SELECT", "WITH") or _ROW_LIMIT_PATTERN.search(query):
+        return query
+        
+    return f"{query.rstrip().rstrip(';')} LIMIT 1"
+
+class _ReaderConnection(sqlite3.Connection):
+    """
+    Read-only SQLite connection.
+    
+    sqlite3.Connection itself cannot be weakly referenced; the subclass
+    can, so per-thread readers can be tracked without keeping them alive.
+    """
+
+
+class _TransactionState(threading.local):
+    """
+    Per-thread transaction and reader connection state.
+    
+    Class attributes provide the defaults, so every thread starts with no
+    transaction or reader connection without needing a hasattr check first.
+    """
+    
+    connection = None
+    transaction_level = 0
+    reader = None
+
+
 class ConnectionPool:
     """
     Connection pool for database connections.
     
     Manages a pool of reusable database connections to improve performance.
+    Idle connections are handed out last-in first-out, so the most recently
+    used connection (with its warm statement cache) is reused first.
+    
+    Idle connections sit in a deque, whose append and pop are atomic, so
+    borrowing an idle connection and returning one skip the pool lock. The
+    lock is only taken to grow the pool, wait for a connection, wake a
+    waiter or reap idle connections.
     """
     
+    __slots__ = (
+        "_create_connection", "_min_connections", "_max_connections",
+        "_timeout", "_validation_interval", "_max_failures", "_retry_backoff",
+        "_validate_connections", "_idle_timeout", "_pool",
+        "_active_connections", "_lock", "_available", "_waiters",
+        "_consecutive_failures", "_next_attempt_time", "_last_error"
+    )
+    
     def __init__(self, create_connection_func, min_connections=1, max_connections=5, 
-                timeout=30, validation_interval=30):
+                timeout=30, validation_interval=30, max_failures=3, retry_backoff=0.5,
+                validate_connections=True, idle_timeout=300):
         """
         Initialize the connection pool.
         
@@ -29,16 +148,34 @@ class ConnectionPool:
             max_connections: Maximum number of connections allowed in the pool.
             timeout: Timeout in seconds when waiting for a connection.
             validation_interval: Time in seconds between connection validation.
+            max_failures: Consecutive connection failures before giving up.
+            retry_backoff: Base delay in seconds between connection attempts,
+                doubled after each consecutive failure.
+            validate_connections: Whether to probe idle connections with
+                SELECT 1 before handing them out.
+            idle_timeout: Time in seconds after which idle connections above
+                min_connections are closed.
         """
         self._create_connection = create_connection_func
         self._min_connections = min_connections
         self._max_connections = max_connections
         self._timeout = timeout
         self._validation_interval = validation_interval
+        self._max_failures = max_failures
+        self._retry_backoff = retry_backoff
+        self._validate_connections = validate_connections
+        self._idle_timeout = idle_timeout
         
-        self._pool = Queue()
+        self._pool = deque()
         self._active_connections = 0
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._waiters = 0
+        
+        # Connection failure tracking for backoff
+        self._consecutive_failures = 0
+        self._next_attempt_time = 0
+        self._last_error = None
         
         # Initialize the minimum number of connections
         self._initialize_connections()
@@ -46,26 +183,80 @@ class ConnectionPool:
     def _initialize_connections(self):
         """Initialize the connection pool with minimum connections."""
         for _ in range(self._min_connections):
-            self._add_connection()
+            if not self._add_connection():
+                break
     
     def _add_connection(self):
         """
-        Add a new connection to the pool.
+        Open a new connection and add it to the pool.
+        
+        Must be called without the pool lock held; the lock is only taken to
+        reserve a slot and to publish the connection, not while connecting.
         
         Returns:
             bool: True if a connection was added, False otherwise.
         """
         with self._lock:
-            if self._active_connections >= self._max_connections:
+            if not self._reserve_slot():
                 return False
                 
-            try:
-                connection = self._create_connection()
-                self._pool.put((connection, time.time()))
-                self._active_connections += 1
-                return True
-            except:
-                return False
+        connection = self._open_reserved()
+        if connection is None:
+            return False
+            
+        with self._available:
+            self._pool.append((connection, time.monotonic()))
+            self._available.notify()
+        return True
+    
+    def _reserve_slot(self):
+        """
+        Reserve a slot for a new connection.
+        
+        Must be called with the pool lock held. A successful reservation
+        must be followed by _open_reserved() once the lock is released.
+        
+        Returns:
+            bool: True if a slot was reserved, False otherwise.
+        """
+        if self._active_connections >= self._max_connections:
+            return False
+            
+        # Back off after a failed attempt instead of hammering the server
+        if time.monotonic() < self._next_attempt_time:
+            return False
+            
+        self._active_connections += 1
+        return True
+    
+    def _open_reserved(self):
+        """
+        Open a connection for a slot reserved by _reserve_slot().
+        
+        Must be called without the pool lock held, so a slow connect does not
+        block borrowers and returns. The slot is released if connecting fails.
+        
+        Returns:
+            Connection object, or None if connecting failed.
+        """
+        try:
+            connection = self._create_connection()
+        except Exception as e:
+            with self._available:
+                self._active_connections -= 1
+                self._consecutive_failures += 1
+                self._last_error = e
+                self._next_attempt_time = time.monotonic() + min(
+                    self._retry_backoff * 2 ** (self._consecutive_failures - 1), 30
+                )
+                # The freed slot may let a waiter retry once the backoff passes
+                self._available.notify()
+            return None
+            
+        with self._lock:
+            self._consecutive_failures = 0
+            self._last_error = None
+        return connection
     
     def get_connection(self):
         """
@@ -77,36 +268,89 @@ class ConnectionPool:
         Raises:
             ConnectionError: If unable to get a connection.
         """
-        start_time = time.time()
+        deadline = time.monotonic() + self._timeout
         
-        while time.time() - start_time < self._timeout:
-            # Try to get a connection from the pool
+        while True:
+            # Take an idle connection without the lock when there is one
             try:
-                connection, last_used = self._pool.get(block=False)
+                connection, last_used = self._pool.pop()
+            except IndexError:
+                connection, last_used = self._wait_for_connection(deadline)
                 
-                # Validate the connection
-                if time.time() - last_used > self._validation_interval:
-                    if self._validate_connection(connection):
-                        return connection
-                    else:
-                        # Connection is invalid, create a new one
-                        with self._lock:
-                            self._active_connections -= 1
-                        
-                        if not self._add_connection():
-                            continue
-                else:
-                    return connection
-            except Empty:
-                # Pool is empty, try to create a new connection
-                if self._add_connection():
-                    continue
-                    
-                # Wait a bit before trying again
-                time.sleep(0.1)
+            # Validate connections that have been idle for a while
+            if not self._validate_connections or time.monotonic() - last_used <= self._validation_interval:
+                return connection
+                
+            if self._validate_connection(connection):
+                return connection
                 
-        # Timeout reached
-        raise ConnectionError("DatabaseClient", "Timeout waiting for database connection")
+            # Connection is invalid, drop it and let the loop replace it
+            self.discard_connection(connection)
+    
+    def _wait_for_connection(self, deadline):
+        """
+        Grow the pool or wait for a returned connection.
+        
+        Args:
+            deadline: time.monotonic() value after which to give up.
+            
+        Returns:
+            tuple: (connection, last_used) taken from the pool or newly opened.
+            
+        Raises:
+            ConnectionError: If connecting keeps failing or the deadline passes.
+        """
+        while True:
+            with self._available:
+                while True:
+                    # Take an idle connection, or reserve a slot to open one
+                    if self._pool:
+                        try:
+                            return self._pool.pop()
+                        except IndexError:
+                            # A lock-free borrower took it first
+                            continue
+                            
+                    if self._reserve_slot():
+                        break
+                        
+                    # Fail fast when the database keeps refusing connections
+                    if self._consecutive_failures >= self._max_failures:
+                        raise ConnectionError(
+                            "DatabaseClient",
+                            f"Giving up after {self._consecutive_failures} failed connection attempts: {str(self._last_error)}",
+                            details={"cause": str(self._last_error)}
+                        ) from self._last_error
+                        
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        details = {"cause": str(self._last_error)} if self._last_error else None
+                        raise ConnectionError(
+                            "DatabaseClient",
+                            "Timeout waiting for database connection",
+                            details=details
+                        ) from self._last_error
+                        
+                    # Block until a connection is returned, waking early if a
+                    # backed-off connection attempt becomes due
+                    wait = remaining
+                    if self._last_error is not None and self._active_connections < self._max_connections:
+                        wait = min(wait, max(self._next_attempt_time - time.monotonic(), 0.01))
+                        
+                    # Register before the final check, so a connection returned
+                    # after the check sees the waiter and takes the lock to notify
+                    self._waiters += 1
+                    try:
+                        if not self._pool:
+                            self._available.wait(wait)
+                    finally:
+                        self._waiters -= 1
+                        
+            # Connect outside the lock and hand the new connection straight
+            # to this borrower; on failure go back to waiting
+            connection = self._open_reserved()
+            if connection is not None:
+                return connection, time.monotonic()
     
     def _validate_connection(self, connection):
         """
@@ -123,12 +367,15 @@ class ConnectionPool:
             if hasattr(connection, 'cursor'):
                 cursor = connection.cursor()
                 cursor.execute("SELECT 1")
+                # mysql-connector won't close a cursor with unread rows
+                cursor.fetchall()
                 cursor.close()
                 return True
                 
             # For other databases, may need different validation
             return True
-        except:
+        except Exception:
+            # Any driver error means the connection can't be reused
             return False
     
     def return_connection(self, connection):
@@ -138,24 +385,159 @@ class ConnectionPool:
         Args:
             connection: Connection to return.
         """
-        self._pool.put((connection, time.time()))
+        now = time.monotonic()
+        self._pool.append((connection, now))
+        
+        # Only lock to wake a waiter or when there may be idle connections
+        # above the minimum to reap
+        if not self._waiters and self._active_connections <= self._min_connections:
+            return
+            
+        with self._available:
+            self._available.notify()
+            expired = self._reap_idle_connections(now)
+            
+        for connection in expired:
+            try:
+                connection.close()
+            except Exception:
+                pass
+    
+    def _reap_idle_connections(self, now):
+        """
+        Remove connections that have sat idle longer than idle_timeout.
+        
+        The pool hands out connections last-in first-out, so the idle
+        ones collect at the left end of the deque. Must be called with
+        the pool lock held; lock-free borrowers may still pop from the
+        right end meanwhile.
+        
+        Args:
+            now: Current time.monotonic() value.
+            
+        Returns:
+            list: Removed connections for the caller to close.
+        """
+        expired = []
+        
+        while self._active_connections > self._min_connections:
+            try:
+                connection, last_used = self._pool.popleft()
+            except IndexError:
+                break
+                
+            if now - last_used <= self._idle_timeout:
+                self._pool.appendleft((connection, last_used))
+                break
+                
+            self._active_connections -= 1
+            expired.append(connection)
+            
+        return expired
+    
+    def discard_connection(self, connection):
+        """
+        Close a broken connection and remove it from the pool's accounting.
+        
+        Args:
+            connection: Connection to discard. It must not be returned to
+                the pool afterwards.
+        """
+        # Wake a waiter so it can open a replacement in the freed slot
+        with self._available:
+            self._active_connections -= 1
+            self._available.notify()
+            
+        try:
+            connection.close()
+        except Exception:
+            # The connection is already unusable; closing is best effort
+            pass
     
     def close_all(self):
         """Close all connections in the pool."""
         with self._lock:
-            while not self._pool.empty():
+            while True:
                 try:
-                    connection, _ = self._pool.get(block=False)
-                    try:
-                        connection.close()
-                    except:
-                        pass
-                except Empty:
+                    connection, _ = self._pool.pop()
+                except IndexError:
                     break
+                    
+                try:
+                    connection.close()
+                except Exception:
+                    pass
             
             self._active_connections = 0
 
 
+class SharedConnection:
+    """
+    Single shared connection with the same interface as ConnectionPool.
+    
+    Used for in-memory SQLite, where every connection would otherwise get
+    its own private database. Checkouts are serialized across threads but
+    re-entrant within one, so a thread can hold the connection for a
+    transaction and still run statements on it.
+    """
+    
+    __slots__ = ("_connection", "_timeout", "_lock")
+    
+    def __init__(self, create_connection_func, timeout=30):
+        """
+        Initialize the shared connection.
+        
+        Args:
+            create_connection_func: Function to create the connection.
+            timeout: Timeout in seconds when waiting for another thread.
+        """
+        self._connection = create_connection_func()
+        self._timeout = timeout
+        self._lock = threading.RLock()
+    
+    def get_connection(self):
+        """
+        Take the shared connection, waiting while another thread holds it.
+        
+        Returns:
+            Connection object.
+            
+        Raises:
+            ConnectionError: If the connection is not released in time.
+        """
+        if not self._lock.acquire(timeout=self._timeout):
+            raise ConnectionError(
+                "DatabaseClient",
+                "Timeout waiting for database connection"
+            )
+            
+        return self._connection
+    
+    def return_connection(self, connection):
+        """
+        Hand the shared connection back.
+        
+        Args:
+            connection: Connection to return.
+        """
+        self._lock.release()
+    
+    def discard_connection(self, connection):
+        """
+        Hand the shared connection back after an error.
+        
+        The connection is kept, since closing it would drop the database.
+        
+        Args:
+            connection: Connection to discard.
+        """
+        self._lock.release()
+    
+    def close_all(self):
+        """Close the shared connection."""
+        self._connection.close()
+
+
 class DatabaseClient(BaseClient, Configurable, Loggable):
     """
     Client for database operations.
@@ -164,6 +546,13 @@ class DatabaseClient(BaseClient, Configurable, Loggable):
     Uses connection pooling for improved performance.
     """
     
+    # Connect, single-statement and batch methods per database type
+    _DISPATCH = {
+        "sqlite": ("_connect_sqlite", "_execute_sqlite_cursor", "_execute_sqlite_batch"),
+        "postgresql": ("_connect_postgresql", "_execute_cursor", "_execute_postgresql_batch"),
+        "mysql": ("_connect_mysql", "_execute_cursor", "_execute_batch"),
+    }
+    
     def __init__(self, config=None):
         """
         Initialize the DatabaseClient.
@@ -176,44 +565,173 @@ class DatabaseClient(BaseClient, Configurable, Loggable):
         
         self._db_type = self.config.get("services.database.type", "sqlite").lower()
         self._batch_size = self.config.get("services.database.batch_size", 100)
+        self._query_one_limit = self.config.get("services.database.query_one_limit", False)
         
         # Connection pool settings
         self._min_connections = self.config.get("services.database.pool.min_connections", 1)
         self._max_connections = self.config.get("services.database.pool.max_connections", 5)
         self._connection_timeout = self.config.get("services.database.pool.timeout", 30)
+        self._idle_timeout = self.config.get("services.database.pool.idle_timeout", 300)
+        self._connect_timeout = self.config.get("services.database.connect_timeout", 5)
+        
+        # SQLite per-connection settings, applied once at connection creation
+        self._sqlite_pragmas = (
+            ("journal_mode", self.config.get("services.database.sqlite.journal_mode", "WAL")),
+            ("synchronous", self.config.get("services.database.sqlite.synchronous", "NORMAL")),
+            ("temp_store", self.config.get("services.database.sqlite.temp_store", "MEMORY")),
+            ("mmap_size", self.config.get("services.database.sqlite.mmap_size", 268435456)),
+            ("cache_size", self.config.get("services.database.sqlite.cache_size", -64000)),
+        )
+        
+        # Size of each SQLite connection's prepared statement cache, keyed
+        # by SQL text, so repeated statements skip parsing and codegen
+        self._sqlite_cached_statements = self.config.get("services.database.sqlite.cached_statements", 256)
+        
+        # Optionally give each thread its own SQLite reader connection; WAL
+        # lets them read concurrently without borrowing from the read pool.
+        # Connections are tracked weakly so close() can reach the live ones
+        # while a finished thread's connection is freed with it.
+        self._thread_readers = self.config.get("services.database.sqlite.thread_readers", False)
+        self._thread_connections = weakref.WeakSet()
         
         # Initialize connection pool
         self._pool = None
+        self._read_pool = None
         self._initialize_pool()
         
         # Thread-local storage for transactions
-        self._local = threading.local()
-        self._local.connection = None
-        self._local.transaction_level = 0
+        self._local = _TransactionState()
+        
+        # Async calls are bounded per event loop, created on first use
+        self._async_semaphore = None
+        self._async_loop = None
     
     def _initialize_pool(self):
         """Initialize the connection pool."""
-        if self._db_type == "sqlite":
-            create_func = self._connect_sqlite
-        elif self._db_type == "postgresql":
-            create_func = self._connect_postgresql
-        elif self._db_type == "mysql":
-            create_func = self._connect_mysql
-        else:
+        try:
+            connect, execute_cursor, execute_batch = self._DISPATCH[self._db_type]
+        except KeyError:
             raise DatabaseError(
                 f"Unsupported database type: {self._db_type}",
                 error_code="DB-002"
             )
             
-        self._pool = ConnectionPool(
-            create_func,
-            min_connections=self._min_connections,
-            max_connections=self._max_connections,
-            timeout=self._connection_timeout
-        )
+        # Bind the per-database methods once so hot paths don't branch on type
+        create_func = getattr(self, connect)
+        self._execute_cursor = getattr(self, execute_cursor)
+        self._execute_batch = getattr(self, execute_batch)
+        self._is_sqlite = self._db_type == "sqlite"
+        
+        # SQLite connections are in-process and cannot drop, so skip the
+        # liveness probe; network connections are also recycled on failure
+        self._needs_liveness_check = not self._is_sqlite
+        self._disconnect_errors = self._get_disconnect_errors()
+        
+        # File-backed SQLite gets one writer connection plus a pool of
+        # read-only connections, so readers never queue behind the writer
+        self._read_pool = None
+        if self._is_sqlite and self._is_sqlite_memory():
+            self._pool = SharedConnection(create_func, timeout=self._connection_timeout)
+        elif self._is_sqlite and self._use_sqlite_readers():
+            self._pool = ConnectionPool(
+                create_func,
+                min_connections=1,
+                max_connections=1,
+                timeout=self._connection_timeout,
+                validate_connections=False,
+                idle_timeout=self._idle_timeout
+            )
+            self._read_pool = ConnectionPool(
+                lambda: self._connect_sqlite(read_only=True),
+                min_connections=self._min_connections,
+                max_connections=self._max_connections,
+                timeout=self._connection_timeout,
+                validate_connections=False,
+                idle_timeout=self._idle_timeout
+            )
+        else:
+            self._pool = ConnectionPool(
+                create_func,
+                min_connections=self._min_connections,
+                max_connections=self._max_connections,
+                timeout=self._connection_timeout,
+                validate_connections=self._needs_liveness_check,
+                idle_timeout=self._idle_timeout
+            )
         
         self.logger.info(f"Initialized connection pool for {self._db_type} database")
     
+    def _is_sqlite_memory(self):
+        """
+        Check whether the SQLite database lives only in memory.
+        
+        Returns:
+            bool: True for ":memory:", temporary ("") and in-memory URI
+            ("file::memory:" or mode=memory) databases.
+        """
+        connection_string = self.config.get("services.database.connection") or ""
+        if connection_string.startswith("file:"):
+            return connection_string.startswith("file::memory:") or "mode=memory" in connection_string
+            
+        return connection_string in ("", ":memory:")
+    
+    def _use_sqlite_readers(self):
+        """
+        Check whether SQLite reads should use a separate read-only pool.
+        
+        In-memory and URI databases are excluded because read-only
+        connections cannot attach to them by path.
+        
+        Returns:
+            bool: True if a reader pool should be created.
+        """
+        if not self.config.get("services.database.sqlite.separate_readers", True):
+            return False
+            
+        connection_string = self.config.get("services.database.connection") or ""
+        return connection_string not in ("", ":memory:") and not connection_string.startswith("file:")
+    
+    def _get_disconnect_errors(self):
+        """
+        Get the driver exceptions that indicate a dropped connection.
+        
+        Returns:
+            tuple: Exception classes; empty for SQLite or missing drivers.
+        """
+        try:
+            if self._db_type == "postgresql":
+                import psycopg2
+                return (psycopg2.OperationalError, psycopg2.InterfaceError)
+            if self._db_type == "mysql":
+                import mysql.connector
+                return (mysql.connector.errors.OperationalError, mysql.connector.errors.InterfaceError)
+        except ImportError:
+            pass
+            
+        return ()
+    
+    def _is_disconnect(self, connection, error):
+        """
+        Check whether a disconnect-class driver error really dropped the connection.
+        
+        psycopg2 also raises OperationalError for statements the server
+        cancelled, such as statement_timeout and lock timeouts. Those carry
+        a SQLSTATE and leave the connection open, so retrying them would
+        discard a healthy connection and run the statement twice.
+        
+        Args:
+            connection: Connection the statement ran on.
+            error: Exception from _disconnect_errors.
+            
+        Returns:
+            bool: True if the connection should be discarded and the
+            statement retried.
+        """
+        if self._db_type == "postgresql":
+            return bool(connection.closed) or getattr(error, "pgcode", None) is None
+            
+        return True
+    
     def connect(self):
         """
         Get a connection from the pool.
@@ -225,12 +743,27 @@ class DatabaseClient(BaseClient, Configurable, Loggable):
             ConnectionError: If connection fails.
         """
         # If already in a transaction, return the existing connection
-        if hasattr(self._local, 'connection') and self._local.connection is not None:
-            return self._local.connection
+        connection = self._local.connection
+        if connection is not None:
+            return connection
+            
+        return self._acquire(self._pool)
+    
+    def _acquire(self, pool):
+        """
+        Borrow a connection from a specific pool.
+        
+        Args:
+            pool: ConnectionPool to borrow from.
+            
+        Returns:
+            Connection object.
             
+        Raises:
+            ConnectionError: If connection fails.
+        """
         try:
-            # Get a connection from the pool
-            connection = self._pool.get_connection()
+            connection = pool.get_connection()
             self.logger.debug("Obtained database connection from pool")
             return connection
         except Exception as e:
@@ -241,6 +774,45 @@ class DatabaseClient(BaseClient, Configurable, Loggable):
                 "DB-003"
             )
     
+    def get_thread_connection(self):
+        """
+        Get the calling thread's dedicated SQLite reader connection.
+        
+        The connection is read-only and created on first use. It is not
+        pooled, so there is nothing to release; close() closes it.
+        
+        Returns:
+            Connection object.
+            
+        Raises:
+            DatabaseError: If the database has no reader pool (not a
+                file-backed SQLite database).
+            ConnectionError: If connection fails.
+        """
+        connection = self._local.reader
+        if connection is not None:
+            return connection
+            
+        if self._read_pool is None:
+            raise DatabaseError(
+                "Thread reader connections require a file-backed SQLite database",
+                error_code="DB-012"
+            )
+            
+        try:
+            connection = self._connect_sqlite(read_only=True)
+        except Exception as e:
+            self.logger.error(f"Database connection error: {str(e)}")
+            raise ConnectionError(
+                "DatabaseClient",
+                f"Failed to connect to {self._db_type} database: {str(e)}",
+                "DB-003"
+            )
+            
+        self._thread_connections.add(connection)
+        self._local.reader = connection
+        return connection
+    
     def release(self, connection):
         """
         Release a connection back to the pool.
@@ -249,7 +821,7 @@ class DatabaseClient(BaseClient, Configurable, Loggable):
             connection: Connection to release.
         """
         # Don't release if in a transaction
-        if hasattr(self._local, 'transaction_level') and self._local.transaction_level > 0:
+        if self._local.transaction_level > 0:
             return
             
         try:
@@ -265,49 +837,211 @@ class DatabaseClient(BaseClient, Configurable, Loggable):
         if self._pool:
             try:
                 self._pool.close_all()
+                if self._read_pool:
+                    self._read_pool.close_all()
+                for connection in list(self._thread_connections):
+                    connection.close()
+                self._thread_connections.clear()
+                self._local.reader = None
                 self.logger.info("Closed all database connections")
             except Exception as e:
                 self.logger.error(f"Error closing database connections: {str(e)}")
     
-    def execute(self, query, parameters=None):
+    def _checkout(self, read_only=False):
         """
-        Execute a query that doesn't return results.
+        Get a connection and cursor for a single statement.
+        
+        Uses the transaction connection if one is active, otherwise borrows
+        a connection from the pool. Read-only statements use the SQLite
+        reader pool when one is configured, or the thread's own reader
+        connection with thread_readers enabled. SQLite gets no cursor here,
+        since connection.execute() creates its own.
         
         Args:
-            query: SQL query string.
-            parameters: Query parameters.
+            read_only: Whether the statement only reads data.
             
         Returns:
-            int: Number of affected rows.
+            tuple: (connection, cursor, pool) where pool is the pool the
+            connection was borrowed from, or None for the transaction or
+            thread reader connection.
             
         Raises:
-            DatabaseError: If query execution fails.
+            ConnectionError: If no connection can be obtained.
         """
-        connection = None
-        
-        try:
-            # Get connection (from transaction or pool)
-            if hasattr(self._local, 'connection') and self._local.connection is not None:
-                connection = self._local.connection
-            else:
-                connection = self.connect()
-                
-            self.logger.debug(f"Executing query: {query}")
+        connection = self._local.connection
+        if connection is not None:
+            return connection, self._open_cursor(connection), None
             
-            cursor = connection.cursor()
-            if parameters:
-                cursor.execute(query, parameters)
-            else:
-                cursor.execute(query)
+        if read_only and self._read_pool:
+            if self._thread_readers:
+                return self.get_thread_connection(), None, None
                 
-            affected_rows = cursor.rowcount
-            cursor.close()
+            pool = self._read_pool
+        else:
+            pool = self._pool
             
-            # Only commit if not in a transaction
-            if not hasattr(self._local, 'transaction_level') or self._local.transaction_level == 0:
-                connection.commit()
-                
-            return affected_rows
+        connection = self._acquire(pool)
+        
+        try:
+            return connection, self._open_cursor(connection), pool
+        except Exception:
+            pool.return_connection(connection)
+            raise
+    
+    def _open_cursor(self, connection):
+        """
+        Open a cursor for the next statement.
+        
+        Args:
+            connection: Database connection.
+            
+        Returns:
+            Cursor object, or None for SQLite.
+        """
+        if self._is_sqlite:
+            return None
+            
+        return connection.cursor()
+    
+    def _checkin(self, connection, cursor, pool):
+        """
+        Close a cursor and return its connection to the pool if borrowed.
+        
+        Args:
+            connection: Connection returned by _checkout, or None if it
+                was already discarded.
+            cursor: Cursor the statement ran on, if any.
+            pool: Pool returned by _checkout.
+        """
+        if connection is None:
+            return
+            
+        try:
+            if cursor is not None:
+                cursor.close()
+        finally:
+            if pool is not None:
+                pool.return_connection(connection)
+    
+    def _discard(self, connection, cursor, pool, error):
+        """
+        Drop a pooled connection that failed mid-statement.
+        
+        Args:
+            connection: Broken connection.
+            cursor: Cursor opened on the connection, if any.
+            pool: Pool the connection was borrowed from.
+            error: Driver error that signalled the disconnect.
+        """
+        self.logger.warning(f"Discarding dropped database connection: {str(error)}")
+        
+        try:
+            if cursor is not None:
+                cursor.close()
+        except Exception:
+            # The cursor died with its connection; closing is best effort
+            pass
+            
+        pool.discard_connection(connection)
+    
+    def _commit(self, connection):
+        """
+        Commit a statement that ran outside a transaction.
+        
+        SQLite only has something to commit when the statement opened a
+        write transaction, so reads and other no-op statements skip it.
+        Other databases always commit, which also ends the implicit
+        transaction the driver opens for reads.
+        
+        Args:
+            connection: Connection the statement ran on.
+        """
+        if self._is_sqlite and not connection.in_transaction:
+            return
+            
+        connection.commit()
+    
+    def _execute_cursor(self, connection, cursor, query, parameters):
+        """
+        Execute a single statement on a cursor.
+        
+        psycopg2 and mysql.connector apply %-formatting whenever parameters
+        are passed, even empty ones, so the query is sent bare when there
+        are none.
+        
+        Args:
+            connection: Database connection.
+            cursor: Open database cursor.
+            query: SQL query string.
+            parameters: Query parameters.
+            
+        Returns:
+            The cursor holding the results.
+        """
+        if parameters:
+            cursor.execute(query, parameters)
+        else:
+            cursor.execute(query)
+            
+        return cursor
+    
+    def _execute_sqlite_cursor(self, connection, cursor, query, parameters):
+        """
+        Execute a single statement on a SQLite connection.
+        
+        connection.execute() creates, binds and steps its cursor in C, and
+        sqlite3 accepts an empty parameter sequence, so there is no need to
+        branch on whether parameters were given.
+        
+        Args:
+            connection: Database connection.
+            cursor: Unused; SQLite checkouts carry no cursor.
+            query: SQL query string.
+            parameters: Query parameters.
+            
+        Returns:
+            sqlite3.Cursor: The cursor holding the results.
+        """
+        return connection.execute(query, parameters or ())
+    
+    def execute(self, query, parameters=None):
+        """
+        Execute a query that doesn't return results.
+        
+        Args:
+            query: SQL query string.
+            parameters: Query parameters.
+            
+        Returns:
+            int: Number of affected rows.
+            
+        Raises:
+            ConnectionError: If no connection can be obtained.
+            DatabaseError: If query execution fails.
+        """
+        connection, cursor, pool = self._checkout()
+        
+        try:
+            self.logger.debug("Executing query: %s", query)
+            
+            try:
+                cursor = self._execute_cursor(connection, cursor, query, parameters)
+            except self._disconnect_errors as e:
+                # Recycle a dropped pooled connection and retry once
+                if pool is None or not self._is_disconnect(connection, e):
+                    raise
+                self._discard(connection, cursor, pool, e)
+                connection = None
+                connection, cursor, pool = self._checkout()
+                cursor = self._execute_cursor(connection, cursor, query, parameters)
+                
+            affected_rows = cursor.rowcount
+            
+            # Only commit if not in a transaction
+            if pool is not None:
+                self._commit(connection)
+                
+            return affected_rows
         except Exception as e:
             self.logger.error(f"Query execution error: {str(e)}")
             raise DatabaseError(
@@ -316,52 +1050,60 @@ class DatabaseClient(BaseClient, Configurable, Loggable):
                 error_code="DB-004"
             )
         finally:
-            # Release connection if not in a transaction
-            if connection and (not hasattr(self._local, 'transaction_level') or self._local.transaction_level == 0):
-                self.release(connection)
+            self._checkin(connection, cursor, pool)
     
-    def executemany(self, query, parameters_list):
+    def executemany(self, query, parameters_list, batch_size=None):
         """
         Execute a query multiple times with different parameters.
         
+        On PostgreSQL a single-row INSERT INTO table (cols) VALUES (%s, ...)
+        is written the usual way; it is rewritten to a multi-row INSERT via
+        execute_values, so callers never pass a bare VALUES %s template.
+        Other statements go through execute_batch, for which psycopg2 only
+        reports the row count of the last statement in each page, so those
+        batches count one row per parameter set instead. SQLite rewrites
+        INSERT INTO table (cols) VALUES (?, ...) the same way. All batches
+        are committed together once the last one has run.
+        
         Args:
             query: SQL query string.
-            parameters_list: List of parameter sets.
+            parameters_list: Iterable of parameter sets. A generator is
+                consumed batch by batch without being materialized.
+            batch_size: Parameter sets per batch. Defaults to the
+                services.database.batch_size setting.
             
         Returns:
-            int: Number of affected rows.
+            int: Number of affected rows, or of parameter sets sent where
+                the driver cannot report per-statement row counts.
             
         Raises:
+            ConnectionError: If no connection can be obtained.
             DatabaseError: If query execution fails.
         """
         if not parameters_list:
             return 0
             
-        connection = None
-        total_affected = 0
+        # A one-shot iterator cannot be replayed after a dropped connection
+        replayable = iter(parameters_list) is not parameters_list
+        connection, cursor, pool = self._checkout()
         
         try:
-            # Get connection (from transaction or pool)
-            if hasattr(self._local, 'connection') and self._local.connection is not None:
-                connection = self._local.connection
-            else:
-                connection = self.connect()
-                
-            self.logger.debug(f"Executing batch query: {query} with {len(parameters_list)} parameter sets")
-            
-            cursor = connection.cursor()
+            self.logger.debug("Executing batch query: %s", query)
             
-            # Process in batches
-            for i in range(0, len(parameters_list), self._batch_size):
-                batch = parameters_list[i:i + self._batch_size]
-                cursor.executemany(query, batch)
-                total_affected += cursor.rowcount
+            try:
+                total_affected = self._execute_batches(connection, cursor, query, parameters_list, batch_size)
+            except self._disconnect_errors as e:
+                # Recycle a dropped pooled connection and retry once
+                if pool is None or not replayable or not self._is_disconnect(connection, e):
+                    raise
+                self._discard(connection, cursor, pool, e)
+                connection = None
+                connection, cursor, pool = self._checkout()
+                total_affected = self._execute_batches(connection, cursor, query, parameters_list, batch_size)
                 
-            cursor.close()
-            
             # Only commit if not in a transaction
-            if not hasattr(self._local, 'transaction_level') or self._local.transaction_level == 0:
-                connection.commit()
+            if pool is not None:
+                self._commit(connection)
                 
             return total_affected
         except Exception as e:
@@ -372,69 +1114,292 @@ class DatabaseClient(BaseClient, Configurable, Loggable):
                 error_code="DB-005"
             )
         finally:
-            # Release connection if not in a transaction
-            if connection and (not hasattr(self._local, 'transaction_level') or self._local.transaction_level == 0):
-                self.release(connection)
+            self._checkin(connection, cursor, pool)
+    
+    def _execute_batches(self, connection, cursor, query, parameters_list, batch_size=None):
+        """
+        Execute a parameter list on a cursor in batch_size chunks.
+        
+        Args:
+            connection: Database connection.
+            cursor: Open database cursor, or None for SQLite.
+            query: SQL query string.
+            parameters_list: Iterable of parameter sets.
+            batch_size: Parameter sets per batch, or None for the default.
+            
+        Returns:
+            int: Number of affected rows.
+        """
+        batch_size = batch_size or self._batch_size
+        total_affected = 0
+        batches = 0
+        parameters = iter(parameters_list)
+        
+        while True:
+            batch = list(islice(parameters, batch_size))
+            if not batch:
+                break
+            total_affected += self._execute_batch(connection, cursor, query, batch)
+            batches += 1
+            
+        self.logger.debug("Executed %d batches of up to %d parameter sets", batches, batch_size)
+        return total_affected
+    
+    def _execute_batch(self, connection, cursor, query, batch):
+        """
+        Execute one batch of parameter sets on a cursor.
+        
+        Args:
+            connection: Database connection.
+            cursor: Open database cursor.
+            query: SQL query string.
+            batch: List of parameter sets.
+            
+        Returns:
+            int: Number of affected rows reported by the driver.
+        """
+        cursor.executemany(query, batch)
+        return cursor.rowcount
+    
+    def _execute_sqlite_batch(self, connection, cursor, query, batch):
+        """
+        Execute one batch of parameter sets on a SQLite connection.
+        
+        A plain INSERT ... VALUES (?, ...) with sequence parameters is sent
+        as multi-row INSERTs, kept under SQLite's bound parameter limit,
+        which runs one statement per chunk instead of one per row. Other
+        statements and named parameters go through executemany.
+        
+        Args:
+            connection: Database connection.
+            cursor: Unused; SQLite checkouts carry no cursor.
+            query: SQL query string.
+            batch: List of parameter sets.
+            
+        Returns:
+            int: Number of affected rows reported by the driver.
+        """
+        insert_parts = _split_insert_values(query)
+        if insert_parts is None or not _POSITIONAL_TEMPLATE_PATTERN.match(insert_parts[1]):
+            return connection.executemany(query, batch).rowcount
+            
+        prefix, template = insert_parts
+        width = template.count("?")
+        
+        # Flattening needs every row to be a sequence of the template's width
+        if not all(isinstance(row, (list, tuple)) and len(row) == width for row in batch):
+            return connection.executemany(query, batch).rowcount
+            
+        rows_per_statement = max(_SQLITE_MAX_VARIABLES // width, 1)
+        total_affected = 0
+        
+        for start in range(0, len(batch), rows_per_statement):
+            rows = batch[start:start + rows_per_statement]
+            statement = f"{prefix} {','.join([template] * len(rows))}"
+            total_affected += connection.execute(statement, list(chain.from_iterable(rows))).rowcount
+            
+        return total_affected
+    
+    def _execute_postgresql_batch(self, connection, cursor, query, batch):
+        """
+        Execute one batch of parameter sets on a PostgreSQL cursor.
+        
+        Batches go through psycopg2's execute_values (for plain
+        INSERT ... VALUES statements) or execute_batch, which send the whole
+        batch in one round trip instead of one per row.
+        
+        Args:
+            connection: Database connection.
+            cursor: Open database cursor.
+            query: SQL query string.
+            batch: List of parameter sets.
+            
+        Returns:
+            int: Number of affected rows, or the batch size for statements
+                sent through execute_batch.
+        """
+        from psycopg2.extras import execute_values, execute_batch
+        
+        insert_parts = _split_insert_values(query)
+        if insert_parts:
+            prefix, template = insert_parts
+            execute_values(
+                cursor,
+                f"{prefix} %s",
+                batch,
+                template=template,
+                page_size=len(batch)
+            )
+            return cursor.rowcount
+            
+        # rowcount only covers the last statement of the page
+        execute_batch(cursor, query, batch, page_size=len(batch))
+        return len(batch)
+    
+    def bulk_load(self, table, columns, rows, chunk_size=10000):
+        """
+        Insert many rows into a table in large multi-row batches.
+        
+        Builds INSERT INTO table (columns) VALUES (...) for the database's
+        placeholder style and sends it through executemany, so SQLite and
+        PostgreSQL write each chunk as multi-row INSERTs and the whole load
+        is committed once.
+        
+        Args:
+            table: Table name, optionally schema-qualified.
+            columns: Column names, in the order of each row's values.
+            rows: Iterable of row sequences. A generator is consumed chunk
+                by chunk without being materialized.
+            chunk_size: Rows per batch.
+            
+        Returns:
+            int: Number of rows inserted.
+            
+        Raises:
+            ConnectionError: If no connection can be obtained.
+            DatabaseError: If a name is not a plain identifier or the load fails.
+        """
+        invalid = [name for name in (table, *columns) if not _IDENTIFIER_PATTERN.match(name)]
+        if invalid or not columns:
+            raise DatabaseError(
+                f"Invalid bulk load target: {', '.join(map(repr, invalid)) or 'no columns given'}",
+                error_code="DB-011"
+            )
+            
+        placeholder = "?" if self._is_sqlite else "%s"
+        query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join([placeholder] * len(columns))})"
+        
+        return self.executemany(query, rows, batch_size=chunk_size)
                 
     def query(self, query, parameters=None):
-       """
-       Execute a query that returns results.
-       
-       Args:
-           query: SQL query string.
-           parameters: Query parameters.
-           
-       Returns:
-           list: Query results as a list of dictionaries.
-           
-       Raises:
-           DatabaseError: If query execution fails.
-       """
-       connection = None
-       
-       try:
-           # Get connection (from transaction or pool)
-           if hasattr(self._local, 'connection') and self._local.connection is not None:
-               connection = self._local.connection
-           else:
-               connection = self.connect()
-               
-           self.logger.debug(f"Executing query: {query}")
-           
-           cursor = connection.cursor()
-           if parameters:
-               cursor.execute(query, parameters)
-           else:
-               cursor.execute(query)
-               
-           # Get column names
-           columns = [column[0] for column in cursor.description]
-           
-           # Fetch all rows and convert to dictionaries
-           rows = cursor.fetchall()
-           result = []
-           
-           for row in rows:
-               result.append(dict(zip(columns, row)))
-               
-           cursor.close()
-           return result
-       except Exception as e:
-           self.logger.error(f"Query execution error: {str(e)}")
-           raise DatabaseError(
-               f"Query execution failed: {str(e)}",
-               query=query,
-               error_code="DB-006"
-           )
-       finally:
-           # Release connection if not in a transaction
-           if connection and (not hasattr(self._local, 'transaction_level') or self._local.transaction_level == 0):
-               self.release(connection)
-   
+        """
+        Execute a query that returns results.
+        
+        Args:
+            query: SQL query string.
+            parameters: Query parameters.
+            
+        Returns:
+            list: Query results as a list of dictionaries.
+            
+        Raises:
+            ConnectionError: If no connection can be obtained.
+            DatabaseError: If query execution fails.
+        """
+        # Plain SELECTs can run on the SQLite reader pool
+        read_only = _classify_query(query) == "SELECT"
+        connection, cursor, pool = self._checkout(read_only)
+        
+        try:
+            self.logger.debug("Executing query: %s", query)
+            
+            try:
+                cursor = self._execute_cursor(connection, cursor, query, parameters)
+            except self._disconnect_errors as e:
+                # Recycle a dropped pooled connection and retry once
+                if pool is None or not self._is_disconnect(connection, e):
+                    raise
+                self._discard(connection, cursor, pool, e)
+                connection = None
+                connection, cursor, pool = self._checkout(read_only)
+                cursor = self._execute_cursor(connection, cursor, query, parameters)
+                
+            # Get column names
+            columns = tuple(column[0] for column in cursor.description)
+            
+            # Convert rows to dictionaries straight off the cursor; map keeps
+            # the per-row zip and dict construction out of the interpreter loop
+            result = list(map(dict, map(partial(zip, columns), cursor)))
+            
+            # Commit writes such as INSERT ... RETURNING outside a transaction
+            if pool is not None and not read_only:
+                self._commit(connection)
+                
+            return result
+        except Exception as e:
+            self.logger.error(f"Query execution error: {str(e)}")
+            raise DatabaseError(
+                f"Query execution failed: {str(e)}",
+                query=query,
+                error_code="DB-006"
+            )
+        finally:
+            self._checkin(connection, cursor, pool)
+    
+    def query_chunks(self, query, parameters=None, chunk_size=10000, as_arrow=False):
+        """
+        Execute a query and stream the results as column-oriented chunks.
+        
+        Rows are fetched chunk_size at a time and transposed into one
+        sequence per column, so analytics code can skip building a
+        dictionary per row and reshaping it again afterwards.
+        
+        Args:
+            query: SQL query string.
+            parameters: Query parameters.
+            chunk_size: Number of rows fetched per chunk.
+            as_arrow: Yield pyarrow.RecordBatch objects instead of dictionaries.
+            
+        Yields:
+            dict: Column name to tuple of values for each chunk, or a
+            pyarrow.RecordBatch if as_arrow is True.
+            
+        Raises:
+            ImportError: If as_arrow is True and pyarrow is not installed.
+            ConnectionError: If no connection can be obtained.
+            DatabaseError: If query execution fails.
+        """
+        if as_arrow:
+            try:
+                import pyarrow
+            except ImportError:
+                raise ImportError("pyarrow module not found. Please install it with: pip install pyarrow")
+                
+        # Plain SELECTs can run on the SQLite reader pool
+        read_only = _classify_query(query) == "SELECT"
+        connection, cursor, pool = self._checkout(read_only)
+        
+        try:
+            self.logger.debug("Executing chunked query: %s", query)
+            
+            try:
+                cursor = self._execute_cursor(connection, cursor, query, parameters)
+            except self._disconnect_errors as e:
+                # Recycle a dropped pooled connection and retry once
+                if pool is None or not self._is_disconnect(connection, e):
+                    raise
+                self._discard(connection, cursor, pool, e)
+                connection = None
+                connection, cursor, pool = self._checkout(read_only)
+                cursor = self._execute_cursor(connection, cursor, query, parameters)
+                
+            columns = [column[0] for column in cursor.description]
+            
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                    
+                chunk = dict(zip(columns, zip(*rows)))
+                yield pyarrow.RecordBatch.from_pydict(chunk) if as_arrow else chunk
+        except Exception as e:
+            self.logger.error(f"Chunked query execution error: {str(e)}")
+            raise DatabaseError(
+                f"Query execution failed: {str(e)}",
+                query=query,
+                error_code="DB-010"
+            )
+        finally:
+            self._checkin(connection, cursor, pool)
+    
     def query_one(self, query, parameters=None):
         """
         Execute a query and return a single result.
         
+        Only the first row is fetched. With services.database.query_one_limit
+        enabled, LIMIT 1 is also appended to SELECTs without a row limit,
+        so the server stops after one row.
+        
         Args:
             query: SQL query string.
             parameters: Query parameters.
@@ -443,60 +1408,235 @@ class DatabaseClient(BaseClient, Configurable, Loggable):
             dict: First row of results as a dictionary or None if no results.
             
         Raises:
+            ConnectionError: If no connection can be obtained.
             DatabaseError: If query execution fails.
         """
-        results = self.query(query, parameters)
-        return results[0] if results else None
+        if self._query_one_limit:
+            query = _limit_one(query)
+            
+        # Plain SELECTs can run on the SQLite reader pool
+        read_only = _classify_query(query) == "SELECT"
+        connection, cursor, pool = self._checkout(read_only)
+        
+        try:
+            self.logger.debug("Executing query: %s", query)
+            
+            try:
+                cursor = self._execute_cursor(connection, cursor, query, parameters)
+            except self._disconnect_errors as e:
+                # Recycle a dropped pooled connection and retry once
+                if pool is None or not self._is_disconnect(connection, e):
+                    raise
+                self._discard(connection, cursor, pool, e)
+                connection = None
+                connection, cursor, pool = self._checkout(read_only)
+                cursor = self._execute_cursor(connection, cursor, query, parameters)
+                
+            row = cursor.fetchone()
+            result = None if row is None else dict(zip((column[0] for column in cursor.description), row))
+            
+            # mysql-connector refuses to close a cursor with unread rows
+            if self._db_type == "mysql":
+                cursor.fetchall()
+                
+            # Commit writes such as INSERT ... RETURNING outside a transaction
+            if pool is not None and not read_only:
+                self._commit(connection)
+                
+            return result
+        except Exception as e:
+            self.logger.error(f"Query execution error: {str(e)}")
+            raise DatabaseError(
+                f"Query execution failed: {str(e)}",
+                query=query,
+                error_code="DB-006"
+            )
+        finally:
+            self._checkin(connection, cursor, pool)
+    
+    async def _run_async(self, func, *args):
+        """
+        Run a blocking client method in a worker thread.
+        
+        Concurrency is capped at max_connections per event loop, so callers
+        wait on the semaphore instead of tying up threads that would only
+        block on pool checkout.
+        
+        Args:
+            func: Client method to call.
+            *args: Arguments for the method.
+            
+        Returns:
+            The method's return value.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            self._async_semaphore = asyncio.Semaphore(self._max_connections)
+            self._async_loop = loop
+            
+        async with self._async_semaphore:
+            return await asyncio.to_thread(func, *args)
+    
+    async def async_execute(self, query, parameters=None):
+        """
+        Execute a query without returning results, from async code.
+        
+        Async calls run in worker threads, so they never join a transaction
+        opened with transaction() on the calling thread.
+        
+        Args:
+            query: SQL query string.
+            parameters: Query parameters.
+            
+        Returns:
+            int: Number of affected rows.
+            
+        Raises:
+            ConnectionError: If no connection can be obtained.
+            DatabaseError: If query execution fails.
+        """
+        return await self._run_async(self.execute, query, parameters)
+    
+    async def async_executemany(self, query, parameters_list, batch_size=None):
+        """
+        Execute a query multiple times with different parameters, from async code.
+        
+        Args:
+            query: SQL query string.
+            parameters_list: Iterable of parameter sets.
+            batch_size: Parameter sets per batch, or None for the default.
+            
+        Returns:
+            int: Number of affected rows.
+            
+        Raises:
+            ConnectionError: If no connection can be obtained.
+            DatabaseError: If query execution fails.
+        """
+        return await self._run_async(self.executemany, query, parameters_list, batch_size)
+    
+    async def async_query(self, query, parameters=None):
+        """
+        Execute a query that returns results, from async code.
+        
+        Args:
+            query: SQL query string.
+            parameters: Query parameters.
+            
+        Returns:
+            list: Query results as a list of dictionaries.
+            
+        Raises:
+            ConnectionError: If no connection can be obtained.
+            DatabaseError: If query execution fails.
+        """
+        return await self._run_async(self.query, query, parameters)
+    
+    async def async_query_one(self, query, parameters=None):
+        """
+        Execute a query and return a single result, from async code.
+        
+        Args:
+            query: SQL query string.
+            parameters: Query parameters.
+            
+        Returns:
+            dict: First row of results as a dictionary or None if no results.
+            
+        Raises:
+            DatabaseError: If query execution fails.
+        """
+        return await self._run_async(self.query_one, query, parameters)
    
     @contextmanager
     def transaction(self):
-            """
-            Create a transaction context.
+        """
+        Create a transaction context.
+        
+        Nested transactions are backed by savepoints, so an inner block that
+        fails only rolls back its own work while the outer transaction
+        carries on.
+        
+        Usage:
+            with db_client.transaction():
+                db_client.execute("INSERT INTO ...")
+                db_client.execute("UPDATE ...")
+                
+        Raises:
+            DatabaseError: If transaction operations fail.
+        """
+        connection = self._local.connection
+        if connection is None:
+            connection = self._local.connection = self.connect()
+            self._local.transaction_level = 0
             
-            Usage:
-                with db_client.transaction():
-                    db_client.execute("INSERT INTO ...")
-                    db_client.execute("UPDATE ...")
-                    
-            Raises:
-                DatabaseError: If transaction operations fail.
-            """
-            if not hasattr(self._local, 'connection') or self._local.connection is None:
-                self._local.connection = self.connect()
-                self._local.transaction_level = 0
+        
+        # Increment transaction level (for nested transactions)
+        self._local.transaction_level += 1
+        level = self._local.transaction_level
+        savepoint = f"sp_{level}"
+        
+        self.logger.debug("Starting transaction (level %d)", level)
+        
+        try:
+            if level == 1:
+                # SQLite only opens a transaction implicitly before DML, so
+                # begin explicitly to keep savepoints inside the outer scope;
+                # IMMEDIATE takes the write lock up front, so a transaction
+                # that reads before writing cannot fail with SQLITE_BUSY
+                # when it upgrades to a writer
+                if self._is_sqlite:
+                    self._execute_statement(connection, "BEGIN IMMEDIATE")
+            else:
+                self._execute_statement(connection, f"SAVEPOINT {savepoint}")
                 
-            # Increment transaction level (for nested transactions)
-            self._local.transaction_level += 1
+            yield
             
-            self.logger.debug(f"Starting transaction (level {self._local.transaction_level})")
+            if level == 1:
+                connection.commit()
+                self.logger.debug("Transaction committed")
+            else:
+                self._execute_statement(connection, f"RELEASE SAVEPOINT {savepoint}")
+                self.logger.debug("Savepoint %s released", savepoint)
+        except Exception as e:
+            if level == 1:
+                connection.rollback()
+                self.logger.debug("Transaction rolled back: %s", e)
+            else:
+                self._execute_statement(connection, f"ROLLBACK TO SAVEPOINT {savepoint}")
+                self._execute_statement(connection, f"RELEASE SAVEPOINT {savepoint}")
+                self.logger.debug("Rolled back to savepoint %s: %s", savepoint, e)
+            raise
+        finally:
+            # Decrement transaction level
+            self._local.transaction_level -= 1
             
-            try:
-                yield
-                
-                # Only commit if this is the outermost transaction
-                if self._local.transaction_level == 1:
-                    self._local.connection.commit()
-                    self.logger.debug("Transaction committed")
-            except Exception as e:
-                # Rollback on error
-                if self._local.transaction_level == 1:
-                    self._local.connection.rollback()
-                    self.logger.debug(f"Transaction rolled back: {str(e)}")
-                raise
-            finally:
-                # Decrement transaction level
-                self._local.transaction_level -= 1
-                
-                # Release connection if this is the outermost transaction
-                if self._local.transaction_level == 0:
-                    connection = self._local.connection
-                    self._local.connection = None
-                    self.release(connection)
+            # Release connection if this is the outermost transaction
+            if self._local.transaction_level == 0:
+                self._local.connection = None
+                self.release(connection)
+    
+    def _execute_statement(self, connection, statement):
+        """
+        Execute a transaction control statement on a connection.
+        
+        Args:
+            connection: Connection to execute on.
+            statement: SQL statement without parameters.
+        """
+        cursor = connection.cursor()
+        try:
+            cursor.execute(statement)
+        finally:
+            cursor.close()
 
-    def _connect_sqlite(self):
+    def _connect_sqlite(self, read_only=False):
         """
         Connect to SQLite database.
         
+        Args:
+            read_only: Open the database file in read-only mode.
+            
         Returns:
             sqlite3.Connection: Database connection.
             
@@ -506,10 +1646,35 @@ class DatabaseClient(BaseClient, Configurable, Loggable):
         try:
             connection_string = self.config.get("services.database.connection")
             
+            # The pool hands each connection to one thread at a time, so
+            # connections may safely move between threads
+            if read_only:
+                uri = f"{Path(connection_string).resolve().as_uri()}?mode=ro"
+                connection = sqlite3.connect(
+                    uri,
+                    uri=True,
+                    check_same_thread=False,
+                    cached_statements=self._sqlite_cached_statements,
+                    factory=_ReaderConnection
+                )
+            else:
+                connection = sqlite3.connect(
+                    connection_string,
+                    uri=connection_string.startswith("file:"),
+                    check_same_thread=False,
+                    cached_statements=self._sqlite_cached_statements
+                )
+            
             # Enable dictionary access for rows
-            connection = sqlite3.connect(connection_string)
             connection.row_factory = sqlite3.Row
             
+            # WAL lets readers run alongside a writer and halves commit fsyncs;
+            # the journal mode is a property of the file, set by the writer
+            for pragma, value in self._sqlite_pragmas:
+                if read_only and pragma == "journal_mode":
+                    continue
+                connection.execute(f"PRAGMA {pragma}={value}")
+            
             return connection
         except Exception as e:
             raise DatabaseError(f"SQLite connection failed: {str(e)}", error_code="DB-007")
@@ -544,7 +1709,8 @@ class DatabaseClient(BaseClient, Configurable, Loggable):
                 port=port,
                 database=database,
                 user=user,
-                password=password
+                password=password,
+                connect_timeout=self._connect_timeout
             )
             
             # Enable dictionary access for rows
@@ -582,7 +1748,8 @@ class DatabaseClient(BaseClient, Configurable, Loggable):
                 port=port,
                 database=database,
                 user=user,
-                password=password
+                password=password,
+                connection_timeout=self._connect_timeout
             )
             
             return connection
@@ -4,9 +4,11 @@ MySQL database client implementation.
 """
 
 import time
+import logging
 import threading
+from itertools import chain
 from typing import List, Dict, Any, Optional, Union, Tuple, Iterator, ContextManager
-from contextlib import contextmanager
+from contextlib import closing, contextmanager
 
 from ...core.base.base_client import BaseClient
 from ...core.interfaces.configurable import Configurable
@@ -14,6 +16,7 @@ from ...core.interfaces.loggable import Loggable
 from ...core.interfaces.database import DatabaseInterface
 from ...core.exceptions import DatabaseError, ConnectionError
 from ...core.data import ConnectionInfo, QueryResult, DatabaseType
+from .database_client import ConnectionPool, _limit_one, _split_insert_values, _TransactionState
 
 class MySQLClient(DatabaseInterface):
     """
@@ -37,24 +40,37 @@ class MySQLClient(DatabaseInterface):
         self._database = self.config.get("services.database.mysql.database")
         self._user = self.config.get("services.database.mysql.user")
         self._password = self.config.get("services.database.mysql.password")
-        self._connection = None
+        
+        # Connection pool settings
+        self._min_connections = self.config.get("services.database.mysql.pool.min_connections", 1)
+        self._max_connections = self.config.get("services.database.mysql.pool.max_connections", 5)
+        self._pool_timeout = self.config.get("services.database.mysql.pool.timeout", 30)
+        self._idle_timeout = self.config.get("services.database.mysql.pool.idle_timeout", 300)
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        
+        # Append LIMIT 1 to unlimited SELECTs in query_one
+        self._query_one_limit = self.config.get("services.database.mysql.query_one_limit", False)
         
         # Thread-local storage for transactions
-        self._local = threading.local()
-        self._local.connection = None
-        self._local.transaction_level = 0
+        self._local = _TransactionState()
         
-        # Check if mysql-connector-python is available
+        # Check if mysql-connector-python is available, keeping the module
+        # for later calls
         try:
             import mysql.connector
+            self._mysql_connector = mysql.connector
             self._mysql_available = True
         except ImportError:
+            self._mysql_connector = None
             self._mysql_available = False
             self.logger.warning("mysql-connector-python not available. Please install with: pip install mysql-connector-python")
     
     def connect(self):
         """
-        Connect to the MySQL database.
+        Get a connection to the MySQL database from the pool.
+        
+        Connections must be handed back with release().
         
         Returns:
             Connection: Database connection.
@@ -64,25 +80,14 @@ class MySQLClient(DatabaseInterface):
             ImportError: If mysql-connector-python is not installed.
         """
         # If already in a transaction, return the existing connection
-        if hasattr(self._local, 'connection') and self._local.connection is not None:
+        if self._local.connection is not None:
             return self._local.connection
             
         if not self._mysql_available:
             raise ImportError("mysql-connector-python module not found. Please install it with: pip install mysql-connector-python")
             
         try:
-            import mysql.connector
-            
-            connection = mysql.connector.connect(
-                host=self._host,
-                port=self._port,
-                database=self._database,
-                user=self._user,
-                password=self._password
-            )
-            
-            self.logger.info(f"Connected to MySQL database: {self._host}:{self._port}/{self._database}")
-            return connection
+            return self._get_pool().get_connection()
         except Exception as e:
             self.logger.error(f"MySQL connection error: {str(e)}")
             raise ConnectionError(
@@ -91,14 +96,94 @@ class MySQLClient(DatabaseInterface):
                 "MYSQL-001"
             )
     
+    def _create_connection(self):
+        """
+        Open a new connection for the pool.
+        
+        Returns:
+            Connection: Database connection.
+        """
+        return self._mysql_connector.connect(
+            host=self._host,
+            port=self._port,
+            database=self._database,
+            user=self._user,
+            password=self._password,
+            # The server commits standalone statements itself;
+            # transactions are opened explicitly
+            autocommit=True,
+            use_pure=False
+        )
+    
+    def _get_pool(self):
+        """
+        Get the connection pool, creating it on first use.
+        
+        Returns:
+            ConnectionPool: Pool of MySQL connections.
+        """
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    # Borrowers wait up to pool.timeout when every connection
+                    # is in use; idle connections are kept until they have
+                    # sat unused for pool.idle_timeout
+                    self._pool = ConnectionPool(
+                        self._create_connection,
+                        min_connections=self._min_connections,
+                        max_connections=self._max_connections,
+                        timeout=self._pool_timeout,
+                        idle_timeout=self._idle_timeout
+                    )
+                    
+                    self.logger.info(f"Connected to MySQL database: {self._host}:{self._port}/{self._database}")
+                    
+        return self._pool
+    
+    def _acquire(self):
+        """
+        Get the connection for the next statement.
+        
+        Returns:
+            tuple: (connection, owned), where owned is True if the
+            connection was borrowed from the pool and must be released.
+        """
+        connection = self._local.connection
+        if connection is not None:
+            return connection, False
+            
+        return self.connect(), True
+    
+    def release(self, connection):
+        """
+        Return a connection to the pool.
+        
+        Connections held by an active transaction are kept until the
+        transaction ends.
+        
+        Args:
+            connection: Connection to release.
+        """
+        if connection is None or connection is self._local.connection:
+            return
+            
+        try:
+            # Roll back anything left open, so the next borrower starts clean
+            if connection.in_transaction:
+                connection.rollback()
+            self._pool.return_connection(connection)
+        except Exception as e:
+            self.logger.error(f"Error releasing MySQL connection: {str(e)}")
+            self._pool.discard_connection(connection)
+    
     def close(self):
         """
-        Close the database connection.
+        Close all pooled database connections.
         """
-        if self._connection is not None:
+        if self._pool is not None:
             try:
-                self._connection.close()
-                self._connection = None
+                self._pool.close_all()
+                self._pool = None
                 self.logger.info("MySQL connection closed")
             except Exception as e:
                 self.logger.error(f"Error closing MySQL connection: {str(e)}")
@@ -117,30 +202,22 @@ class MySQLClient(DatabaseInterface):
         Raises:
             DatabaseError: If query execution fails.
         """
-        connection = None
+        connection, owned = None, False
         
         try:
-            # Get connection (from transaction or new)
-            if hasattr(self._local, 'connection') and self._local.connection is not None:
-                connection = self._local.connection
-            else:
-                connection = self.connect()
-                self._connection = connection
+            # Transaction connection, or one borrowed from the pool
+            connection, owned = self._acquire()
                 
-            self.logger.debug(f"Executing query: {query}")
+            self.logger.debug("Executing query: %s", query)
             
-            cursor = connection.cursor()
-            if parameters:
-                cursor.execute(query, parameters)
-            else:
-                cursor.execute(query)
-                
-            affected_rows = cursor.rowcount
-            cursor.close()
-            
-            # Only commit if not in a transaction
-            if not hasattr(self._local, 'transaction_level') or self._local.transaction_level == 0:
-                connection.commit()
+            # Outside a transaction autocommit applies the statement
+            with closing(connection.cursor()) as cursor:
+                if parameters:
+                    cursor.execute(query, parameters)
+                else:
+                    cursor.execute(query)
+                    
+                affected_rows = cursor.rowcount
                 
             return affected_rows
         except Exception as e:
@@ -150,6 +227,9 @@ class MySQLClient(DatabaseInterface):
                 query=query,
                 error_code="MYSQL-002"
             )
+        finally:
+            if owned:
+                self.release(connection)
     
     def query(self, query, parameters=None):
         """
@@ -165,31 +245,27 @@ class MySQLClient(DatabaseInterface):
         Raises:
             DatabaseError: If query execution fails.
         """
-        connection = None
-        start_time = time.time()
+        connection, owned = None, False
+        # Only time queries when the timing will actually be logged
+        start_time = time.perf_counter() if self.logger.isEnabledFor(logging.DEBUG) else None
         
         try:
-            # Get connection (from transaction or new)
-            if hasattr(self._local, 'connection') and self._local.connection is not None:
-                connection = self._local.connection
-            else:
-                connection = self.connect()
-                self._connection = connection
+            # Transaction connection, or one borrowed from the pool
+            connection, owned = self._acquire()
                 
-            self.logger.debug(f"Executing query: {query}")
+            self.logger.debug("Executing query: %s", query)
             
-            cursor = connection.cursor(dictionary=True)
-            if parameters:
-                cursor.execute(query, parameters)
-            else:
-                cursor.execute(query)
-                
-            # Fetch all rows
-            rows = cursor.fetchall()
-            cursor.close()
+            with closing(connection.cursor(dictionary=True)) as cursor:
+                if parameters:
+                    cursor.execute(query, parameters)
+                else:
+                    cursor.execute(query)
+                    
+                # Fetch all rows
+                rows = cursor.fetchall()
             
-            execution_time = time.time() - start_time
-            self.logger.debug(f"Query executed in {execution_time:.4f} seconds")
+            if start_time is not None:
+                self.logger.debug("Query executed in %.4f seconds", time.perf_counter() - start_time)
             
             return rows
         except Exception as e:
@@ -199,11 +275,82 @@ class MySQLClient(DatabaseInterface):
                 query=query,
                 error_code="MYSQL-003"
             )
+        finally:
+            if owned:
+                self.release(connection)
+    
+    def query_iter(self, query, parameters=None, chunk_size=1000):
+        """
+        Execute a query and stream the results one row at a time.
+        
+        Rows are pulled from an unbuffered cursor chunk_size at a time, so large result
+        sets are never held in memory all at once. Closing the generator early
+        reads off the remaining rows before the connection goes back to the pool.
+        
+        Args:
+            query: SQL query string.
+            parameters: Query parameters.
+            chunk_size: Number of rows to fetch per round trip.
+            
+        Yields:
+            dict: Each result row as a dictionary.
+            
+        Raises:
+            DatabaseError: If query execution fails.
+        """
+        connection, owned = None, False
+        cursor = None
+        
+        try:
+            # Transaction connection, or one borrowed from the pool
+            connection, owned = self._acquire()
+            
+            self.logger.debug("Executing streaming query: %s", query)
+            
+            # An unbuffered cursor reads rows off the wire as they are fetched
+            cursor = connection.cursor(dictionary=True, buffered=False)
+            if parameters:
+                cursor.execute(query, parameters)
+            else:
+                cursor.execute(query)
+                
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield from rows
+        except Exception as e:
+            self.logger.error(f"Streaming query execution error: {str(e)}")
+            raise DatabaseError(
+                f"Query execution failed: {str(e)}",
+                query=query,
+                error_code="MYSQL-005"
+            )
+        finally:
+            clean = True
+            if cursor is not None:
+                try:
+                    # Read off any rows the caller stopped before, or the
+                    # connection is left with an unread result
+                    connection.consume_results()
+                    cursor.close()
+                except Exception as e:
+                    self.logger.error(f"Error closing streaming cursor: {str(e)}")
+                    clean = False
+            if owned:
+                if clean:
+                    self.release(connection)
+                else:
+                    self._pool.discard_connection(connection)
     
     def query_one(self, query, parameters=None):
         """
         Execute a query and return a single result.
         
+        Only the first row is turned into a dictionary. With query_one_limit
+        enabled, LIMIT 1 is also appended to SELECTs without a row limit,
+        so the server sends a single row.
+        
         Args:
             query: SQL query string.
             parameters: Query parameters.
@@ -214,13 +361,45 @@ class MySQLClient(DatabaseInterface):
         Raises:
             DatabaseError: If query execution fails.
         """
-        results = self.query(query, parameters)
-        return results[0] if results else None
+        if self._query_one_limit:
+            query = _limit_one(query)
+            
+        connection, owned = None, False
+        
+        try:
+            # Transaction connection, or one borrowed from the pool
+            connection, owned = self._acquire()
+                
+            self.logger.debug("Executing query: %s", query)
+            
+            # Buffered, so the cursor can be closed with rows left unread
+            with closing(connection.cursor(dictionary=True, buffered=True)) as cursor:
+                if parameters:
+                    cursor.execute(query, parameters)
+                else:
+                    cursor.execute(query)
+                    
+                return cursor.fetchone()
+        except Exception as e:
+            self.logger.error(f"Query execution error: {str(e)}")
+            raise DatabaseError(
+                f"Query execution failed: {str(e)}",
+                query=query,
+                error_code="MYSQL-003"
+            )
+        finally:
+            if owned:
+                self.release(connection)
     
     def executemany(self, query, parameters_list):
         """
         Execute a query multiple times with different parameters.
         
+        A single-row INSERT INTO table (cols) VALUES (%s, ...) with sequence
+        rows is rewritten to one multi-row INSERT per batch, so each batch
+        is a single round trip. Other statements, including named
+        %(name)s parameters, fall back to cursor.executemany.
+        
         Args:
             query: SQL query string.
             parameters_list: List of parameter sets.
@@ -234,34 +413,52 @@ class MySQLClient(DatabaseInterface):
         if not parameters_list:
             return 0
             
-        connection = None
-        batch_size = self.config.get("services.database.mysql.batch_size", 100)
+        connection, owned = None, False
+        in_transaction = self._local.transaction_level > 0
+        batch_size = self.config.get("services.database.mysql.batch_size", 1000)
         total_affected = 0
         
         try:
-           # Get connection (from transaction or new)
-           if hasattr(self._local, 'connection') and self._local.connection is not None:
-               connection = self._local.connection
-           else:
-               connection = self.connect()
-               self._connection = connection
+           # Transaction connection, or one borrowed from the pool
+           connection, owned = self._acquire()
                
-           self.logger.debug(f"Executing batch query: {query} with {len(parameters_list)} parameter sets")
+           self.logger.debug("Executing batch query: %s with %d parameter sets", query, len(parameters_list))
            
-           cursor = connection.cursor()
+           insert_parts = _split_insert_values(query)
            
-           # Process in batches
-           for i in range(0, len(parameters_list), batch_size):
-               batch = parameters_list[i:i + batch_size]
+           # Only positional rows can be flattened into one extended INSERT;
+           # named %(name)s templates and mapping rows go to executemany
+           if insert_parts and (
+               "%(" in insert_parts[1]
+               or not all(isinstance(row, (list, tuple)) for row in parameters_list)
+           ):
+               insert_parts = None
                
-               # Use executemany for MySQL
-               cursor.executemany(query, batch)
-               total_affected += cursor.rowcount
+           # A single extended INSERT commits atomically by itself; anything
+           # sent as several statements is wrapped in one transaction
+           explicit_transaction = not in_transaction and (
+               not insert_parts or len(parameters_list) > batch_size
+           )
+           if explicit_transaction:
+               connection.start_transaction()
                
-           cursor.close()
+           with closing(connection.cursor()) as cursor:
+               # Process in batches
+               for i in range(0, len(parameters_list), batch_size):
+                   batch = parameters_list[i:i + batch_size]
+                   
+                   if insert_parts:
+                       # Send the batch as one extended INSERT
+                       prefix, template = insert_parts
+                       cursor.execute(
+                           f"{prefix} {','.join([template] * len(batch))}",
+                           list(chain.from_iterable(batch))
+                       )
+                   else:
+                       cursor.executemany(query, batch)
+                   total_affected += cursor.rowcount
            
-           # Only commit if not in a transaction
-           if not hasattr(self._local, 'transaction_level') or self._local.transaction_level == 0:
+           if explicit_transaction:
                connection.commit()
                
            return total_affected
@@ -273,6 +470,9 @@ class MySQLClient(DatabaseInterface):
                query=query,
                error_code="MYSQL-004"
            )
+        finally:
+           if owned:
+               self.release(connection)
    
     @contextmanager
     def transaction(self):
@@ -287,14 +487,15 @@ class MySQLClient(DatabaseInterface):
       Raises:
           DatabaseError: If transaction operations fail.
       """
-      if not hasattr(self._local, 'connection') or self._local.connection is None:
+      if self._local.connection is None:
           self._local.connection = self.connect()
-          self._local.transaction_level = 0
+          # Pooled connections run in autocommit mode
+          self._local.connection.start_transaction()
           
       # Increment transaction level (for nested transactions)
       self._local.transaction_level += 1
       
-      self.logger.debug(f"Starting transaction (level {self._local.transaction_level})")
+      self.logger.debug("Starting transaction (level %d)", self._local.transaction_level)
       
       try:
           yield
@@ -307,7 +508,7 @@ class MySQLClient(DatabaseInterface):
           # Rollback on error
           if self._local.transaction_level == 1:
               self._local.connection.rollback()
-              self.logger.debug(f"Transaction rolled back: {str(e)}")
+              self.logger.debug("Transaction rolled back: %s", e)
           raise
       finally:
           # Decrement transaction level
@@ -315,4 +516,6 @@ class MySQLClient(DatabaseInterface):
           
           # Release connection if this is the outermost transaction
           if self._local.transaction_level == 0:
-              self._local.connection = None
\ No newline at end of file
+              connection = self._local.connection
+              self._local.connection = None
+              self.release(connection)
\ No newline at end of file
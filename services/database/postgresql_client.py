@@ -2,10 +2,21 @@
 PostgreSQL database client implementation.
 """
 
+import io
+import re
 import time
+import logging
+import hashlib
 import threading
+import uuid
+import weakref
+from collections import OrderedDict
+from datetime import date, time as datetime_time
+from decimal import Decimal
+from itertools import count
 from typing import List, Dict, Any, Optional, Union, Tuple, Iterator, ContextManager
 from contextlib import contextmanager
+from functools import partial
 
 from ...core.base.base_client import BaseClient
 from ...core.interfaces.configurable import Configurable
@@ -13,6 +24,23 @@ from ...core.interfaces.loggable import Loggable
 from ...core.interfaces.database import DatabaseInterface
 from ...core.exceptions import DatabaseError, ConnectionError
 from ...core.data import ConnectionInfo, QueryResult, DatabaseType
+from .database_client import ConnectionPool, _classify_query, _limit_one, _split_insert_values, _TransactionState
+
+# Positional psycopg2 placeholder, rewritten to $n for PREPARE
+_PLACEHOLDER_PATTERN = re.compile(r"%s")
+
+# Target table and columns of an INSERT prefix, for COPY
+_COPY_TARGET_PATTERN = re.compile(r"^\s*INSERT\s+INTO\s+(\S+)\s*\(([^)]+)\)\s+VALUES$", re.IGNORECASE)
+
+# VALUES template made only of placeholders, so rows can be copied as-is
+_COPY_TEMPLATE_PATTERN = re.compile(r"^\(\s*%s(\s*,\s*%s)*\s*\)$")
+
+# Values whose str() is already valid PostgreSQL input text; anything else
+# (lists, dicts, Json, ...) needs psycopg2's adaptation, so skips COPY
+_COPY_SCALAR_TYPES = (str, int, float, Decimal, date, datetime_time, bytes, bytearray, memoryview)
+
+# Characters that must be escaped in COPY text format
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
 
 class PostgreSQLClient(DatabaseInterface):
     """
@@ -36,30 +64,70 @@ class PostgreSQLClient(DatabaseInterface):
         self._database = self.config.get("services.database.postgresql.database")
         self._user = self.config.get("services.database.postgresql.user")
         self._password = self.config.get("services.database.postgresql.password")
-        self._connection = None
+        self._application_name = self.config.get("services.database.postgresql.application_name", "python_library")
+        
+        # Session settings sent in the startup packet, so the server applies
+        # them without a SET round trip after connecting
+        session_settings = {
+            "search_path": self.config.get("services.database.postgresql.schema"),
+            "statement_timeout": self.config.get("services.database.postgresql.statement_timeout"),
+            "synchronous_commit": self.config.get("services.database.postgresql.synchronous_commit"),
+        }
+        self._options = " ".join(
+            f"-c {name}={value}" for name, value in session_settings.items() if value is not None
+        )
         
         # Connection pool settings
         self._min_connections = self.config.get("services.database.postgresql.pool.min_connections", 1)
         self._max_connections = self.config.get("services.database.postgresql.pool.max_connections", 5)
+        self._pool_timeout = self.config.get("services.database.postgresql.pool.timeout", 30)
+        self._idle_timeout = self.config.get("services.database.postgresql.pool.idle_timeout", 300)
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        
+        # Server-side prepared statements, an LRU of names per connection.
+        # Off by default: a statement run once pays an extra PREPARE round
+        # trip, so only enable it for workloads that repeat their queries
+        self._prepare_statements = self.config.get("services.database.postgresql.prepare_statements", False)
+        self._prepared_cache_size = self.config.get("services.database.postgresql.prepared_cache_size", 100)
+        self._prepared = weakref.WeakKeyDictionary()
+        
+        # Append LIMIT 1 to unlimited SELECTs in query_one
+        self._query_one_limit = self.config.get("services.database.postgresql.query_one_limit", False)
+        
+        # One reusable cursor per borrowed connection, dropped on release;
+        # a cursor references its connection, so a weak mapping would
+        # never let the connection go
+        self._cursors = {}
         
         # Thread-local storage for transactions
-        self._local = threading.local()
-        self._local.connection = None
-        self._local.transaction_level = 0
+        self._local = _TransactionState()
         
-        # Check if psycopg2 is available
+        # Check if psycopg2 is available, keeping the module for later calls
         try:
             import psycopg2
-            import psycopg2.pool
+            import psycopg2.extensions
             import psycopg2.extras
+            self._psycopg2 = psycopg2
             self._psycopg2_available = True
         except ImportError:
+            self._psycopg2 = None
             self._psycopg2_available = False
             self.logger.warning("psycopg2 not available. Please install with: pip install psycopg2-binary")
+            
+        # orjson parses json/jsonb columns several times faster than the
+        # standard library, so use it when it is installed
+        try:
+            import orjson
+            self._json_loads = orjson.loads
+        except ImportError:
+            self._json_loads = None
     
     def connect(self):
         """
-        Connect to the PostgreSQL database.
+        Get a connection to the PostgreSQL database from the pool.
+        
+        Connections must be handed back with release().
         
         Returns:
             Connection: Database connection.
@@ -69,29 +137,14 @@ class PostgreSQLClient(DatabaseInterface):
             ImportError: If psycopg2 is not installed.
         """
         # If already in a transaction, return the existing connection
-        if hasattr(self._local, 'connection') and self._local.connection is not None:
+        if self._local.connection is not None:
             return self._local.connection
             
         if not self._psycopg2_available:
             raise ImportError("psycopg2 module not found. Please install it with: pip install psycopg2-binary")
             
         try:
-            import psycopg2
-            import psycopg2.extras
-            
-            connection = psycopg2.connect(
-                host=self._host,
-                port=self._port,
-                database=self._database,
-                user=self._user,
-                password=self._password
-            )
-            
-            # Enable dictionary access for rows
-            connection.cursor_factory = psycopg2.extras.DictCursor
-            
-            self.logger.info(f"Connected to PostgreSQL database: {self._host}:{self._port}/{self._database}")
-            return connection
+            return self._get_pool().get_connection()
         except Exception as e:
             self.logger.error(f"PostgreSQL connection error: {str(e)}")
             raise ConnectionError(
@@ -100,14 +153,110 @@ class PostgreSQLClient(DatabaseInterface):
                 "POSTGRES-001"
             )
     
+    def _create_connection(self):
+        """
+        Open a new connection for the pool and set up its type casters.
+        
+        Returns:
+            Connection: Database connection.
+        """
+        connection = self._psycopg2.connect(
+            host=self._host,
+            port=self._port,
+            database=self._database,
+            user=self._user,
+            password=self._password,
+            application_name=self._application_name,
+            options=self._options or None
+        )
+        
+        if self._json_loads is not None:
+            extras = self._psycopg2.extras
+            extras.register_default_json(connection, loads=self._json_loads)
+            extras.register_default_jsonb(connection, loads=self._json_loads)
+            
+        return connection
+    
+    def _get_pool(self):
+        """
+        Get the connection pool, creating it on first use.
+        
+        Returns:
+            ConnectionPool: Pool of PostgreSQL connections.
+        """
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    # Borrowers wait up to pool.timeout when every connection
+                    # is in use; idle connections are kept until they have
+                    # sat unused for pool.idle_timeout
+                    self._pool = ConnectionPool(
+                        self._create_connection,
+                        min_connections=self._min_connections,
+                        max_connections=self._max_connections,
+                        timeout=self._pool_timeout,
+                        idle_timeout=self._idle_timeout
+                    )
+                    
+                    self.logger.info(f"Connected to PostgreSQL database: {self._host}:{self._port}/{self._database}")
+                    
+        return self._pool
+    
+    def _acquire(self):
+        """
+        Get the connection for the next statement.
+        
+        Returns:
+            tuple: (connection, owned), where owned is True if the
+            connection was borrowed from the pool and must be released.
+        """
+        connection = self._local.connection
+        if connection is not None:
+            return connection, False
+            
+        return self.connect(), True
+    
+    def release(self, connection):
+        """
+        Return a connection to the pool.
+        
+        Connections held by an active transaction are kept until the
+        transaction ends.
+        
+        Args:
+            connection: Connection to release.
+        """
+        if connection is None or connection is self._local.connection:
+            return
+            
+        self._cursors.pop(connection, None)
+        
+        try:
+            if connection.closed or connection.info.transaction_status == self._psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN:
+                self._pool.discard_connection(connection)
+                return
+                
+            # Roll back anything left open, so the next borrower starts clean
+            if connection.info.transaction_status != self._psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                connection.rollback()
+                
+            # Pooled connections are handed out in transactional mode
+            if connection.autocommit:
+                connection.autocommit = False
+            self._pool.return_connection(connection)
+        except Exception as e:
+            self.logger.error(f"Error releasing PostgreSQL connection: {str(e)}")
+            self._pool.discard_connection(connection)
+    
     def close(self):
         """
-        Close the database connection.
+        Close all pooled database connections.
         """
-        if self._connection is not None:
+        if self._pool is not None:
             try:
-                self._connection.close()
-                self._connection = None
+                self._pool.close_all()
+                self._pool = None
+                self._cursors.clear()
                 self.logger.info("PostgreSQL connection closed")
             except Exception as e:
                 self.logger.error(f"Error closing PostgreSQL connection: {str(e)}")
@@ -126,32 +275,24 @@ class PostgreSQLClient(DatabaseInterface):
         Raises:
             DatabaseError: If query execution fails.
         """
-        connection = None
+        connection, owned = None, False
+        in_transaction = self._local.transaction_level > 0
         
         try:
-            # Get connection (from transaction or new)
-            if hasattr(self._local, 'connection') and self._local.connection is not None:
-                connection = self._local.connection
-            else:
-                connection = self.connect()
-                self._connection = connection
-                
-            self.logger.debug(f"Executing query: {query}")
+            # Transaction connection, or one borrowed from the pool
+            connection, owned = self._acquire()
             
-            cursor = connection.cursor()
-            if parameters:
-                cursor.execute(query, parameters)
-            else:
-                cursor.execute(query)
+            # Outside a transaction the server commits the statement itself,
+            # saving the BEGIN and COMMIT round trips
+            if not in_transaction:
+                connection.autocommit = True
                 
-            affected_rows = cursor.rowcount
-            cursor.close()
+            self.logger.debug("Executing query: %s", query)
             
-            # Only commit if not in a transaction
-            if not hasattr(self._local, 'transaction_level') or self._local.transaction_level == 0:
-                connection.commit()
+            cursor = self._cursor(connection)
+            self._execute_prepared(connection, cursor, query, parameters)
                 
-            return affected_rows
+            return cursor.rowcount
         except Exception as e:
             self.logger.error(f"Query execution error: {str(e)}")
             raise DatabaseError(
@@ -159,6 +300,9 @@ class PostgreSQLClient(DatabaseInterface):
                 query=query,
                 error_code="POSTGRES-002"
             )
+        finally:
+            if owned:
+                self.release(connection)
     
     def query(self, query, parameters=None):
         """
@@ -174,50 +318,194 @@ class PostgreSQLClient(DatabaseInterface):
         Raises:
             DatabaseError: If query execution fails.
         """
-        connection = None
-        start_time = time.time()
+        connection, owned = None, False
+        # Only time queries when the timing will actually be logged
+        start_time = time.perf_counter() if self.logger.isEnabledFor(logging.DEBUG) else None
         
         try:
-            # Get connection (from transaction or new)
-            if hasattr(self._local, 'connection') and self._local.connection is not None:
-                connection = self._local.connection
-            else:
-                connection = self.connect()
-                self._connection = connection
+            # Transaction connection, or one borrowed from the pool
+            connection, owned = self._acquire()
                 
-            self.logger.debug(f"Executing query: {query}")
+            self.logger.debug("Executing query: %s", query)
+            
+            cursor = self._cursor(connection)
+            self._execute_prepared(connection, cursor, query, parameters)
+                
+            # Zip plain tuple rows with the column names once per query;
+            # RealDictCursor would build each row dictionary in Python
+            columns = tuple(column[0] for column in cursor.description)
+            result = list(map(dict, map(partial(zip, columns), cursor.fetchall())))
+            
+            if start_time is not None:
+                self.logger.debug("Query executed in %.4f seconds", time.perf_counter() - start_time)
+            
+            return result
+        except Exception as e:
+            self.logger.error(f"Query execution error: {str(e)}")
+            raise DatabaseError(
+                f"Query execution failed: {str(e)}",
+                query=query,
+                error_code="POSTGRES-003"
+            )
+        finally:
+            if owned:
+                self.release(connection)
+    
+    def _cursor(self, connection):
+        """
+        Get the reusable cursor for a connection, opening it on first use.
+        
+        Pooled connections are only used by one thread at a time, so the
+        cursor is shared by every call made while the connection is
+        borrowed, such as the statements of a transaction.
+        
+        Args:
+            connection: Database connection.
+            
+        Returns:
+            Cursor: Open cursor for the connection.
+        """
+        cursor = self._cursors.get(connection)
+        if cursor is None or cursor.closed:
+            cursor = self._cursors[connection] = connection.cursor()
+            
+        return cursor
+    
+    def _can_prepare(self, query, parameters):
+        """
+        Check whether a statement can run as a prepared statement.
+        
+        Args:
+            query: SQL query string.
+            parameters: Query parameters.
+            
+        Returns:
+            bool: True for DML with only positional %s placeholders that
+            each take a single value.
+        """
+        if not self._prepare_statements or _classify_query(query) == "OTHER":
+            return False
             
-            cursor = connection.cursor()
+        if parameters and not isinstance(parameters, (list, tuple)):
+            return False
+            
+        # psycopg2 expands tuples into (a, b, ...) for IN %s and lists into
+        # ARRAY[...]; neither is valid as a $n parameter of a PREPARE
+        if parameters and any(isinstance(value, (list, tuple)) for value in parameters):
+            return False
+            
+        placeholders = query.count("%s")
+        return placeholders == len(parameters or ()) and query.count("%") == placeholders
+    
+    def _execute_prepared(self, connection, cursor, query, parameters):
+        """
+        Execute a statement, preparing it on the server the first time.
+        
+        Prepared statement names are kept in a per-connection LRU keyed by
+        query text, so repeated queries skip parsing and planning. Queries
+        that can't be prepared run directly.
+        
+        Args:
+            connection: Connection the cursor belongs to.
+            cursor: Open database cursor.
+            query: SQL query string.
+            parameters: Query parameters.
+        """
+        if not self._can_prepare(query, parameters):
             if parameters:
                 cursor.execute(query, parameters)
             else:
                 cursor.execute(query)
-                
-            # Fetch all rows and convert to dictionaries
-            rows = cursor.fetchall()
-            result = []
+            return
             
-            for row in rows:
-                result.append(dict(row))
-                
-            cursor.close()
+        statements = self._prepared.get(connection)
+        if statements is None:
+            statements = self._prepared[connection] = OrderedDict()
             
-            execution_time = time.time() - start_time
-            self.logger.debug(f"Query executed in {execution_time:.4f} seconds")
+        name = statements.get(query)
+        if name is None:
+            name = f"p_{hashlib.blake2b(query.encode(), digest_size=8).hexdigest()}"
+            position = count(1)
+            cursor.execute(f"PREPARE {name} AS {_PLACEHOLDER_PATTERN.sub(lambda _: f'${next(position)}', query)}")
+            statements[query] = name
             
-            return result
+            if len(statements) > self._prepared_cache_size:
+                _, evicted = statements.popitem(last=False)
+                cursor.execute(f"DEALLOCATE {evicted}")
+        else:
+            statements.move_to_end(query)
+            
+        if parameters:
+            cursor.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(parameters))})", parameters)
+        else:
+            cursor.execute(f"EXECUTE {name}")
+    
+    def query_iter(self, query, parameters=None, chunk_size=1000):
+        """
+        Execute a query and stream the results one row at a time.
+        
+        Rows are pulled from a server-side (named) cursor chunk_size at a time, so large result
+        sets are never held in memory all at once.
+        
+        Args:
+            query: SQL query string.
+            parameters: Query parameters.
+            chunk_size: Number of rows to fetch per round trip.
+            
+        Yields:
+            dict: Each result row as a dictionary.
+            
+        Raises:
+            DatabaseError: If query execution fails.
+        """
+        connection, owned = None, False
+        cursor = None
+        
+        try:
+            # Transaction connection, or one borrowed from the pool
+            connection, owned = self._acquire()
+            
+            self.logger.debug("Executing streaming query: %s", query)
+            
+            # Naming the cursor makes psycopg2 keep the results on the server
+            cursor = connection.cursor(name=f"stream_{uuid.uuid4().hex}")
+            cursor.itersize = chunk_size
+            if parameters:
+                cursor.execute(query, parameters)
+            else:
+                cursor.execute(query)
+                
+            # A named cursor only has a description after the first fetch
+            rows = cursor.fetchmany(chunk_size)
+            columns = tuple(column[0] for column in cursor.description) if rows else ()
+            
+            while rows:
+                yield from map(dict, map(partial(zip, columns), rows))
+                rows = cursor.fetchmany(chunk_size)
         except Exception as e:
-            self.logger.error(f"Query execution error: {str(e)}")
+            self.logger.error(f"Streaming query execution error: {str(e)}")
             raise DatabaseError(
                 f"Query execution failed: {str(e)}",
                 query=query,
-                error_code="POSTGRES-003"
+                error_code="POSTGRES-005"
             )
+        finally:
+            if cursor is not None:
+                try:
+                    cursor.close()
+                except Exception:
+                    pass
+            if owned:
+                self.release(connection)
     
     def query_one(self, query, parameters=None):
         """
         Execute a query and return a single result.
         
+        Only the first row is turned into a dictionary. With query_one_limit
+        enabled, LIMIT 1 is also appended to SELECTs without a row limit,
+        so the server sends a single row.
+        
         Args:
             query: SQL query string.
             parameters: Query parameters.
@@ -228,13 +516,46 @@ class PostgreSQLClient(DatabaseInterface):
         Raises:
             DatabaseError: If query execution fails.
         """
-        results = self.query(query, parameters)
-        return results[0] if results else None
+        if self._query_one_limit:
+            query = _limit_one(query)
+            
+        connection, owned = None, False
+        
+        try:
+            # Transaction connection, or one borrowed from the pool
+            connection, owned = self._acquire()
+                
+            self.logger.debug("Executing query: %s", query)
+            
+            cursor = self._cursor(connection)
+            self._execute_prepared(connection, cursor, query, parameters)
+            
+            row = cursor.fetchone()
+            return None if row is None else dict(zip((column[0] for column in cursor.description), row))
+        except Exception as e:
+            self.logger.error(f"Query execution error: {str(e)}")
+            raise DatabaseError(
+                f"Query execution failed: {str(e)}",
+                query=query,
+                error_code="POSTGRES-003"
+            )
+        finally:
+            if owned:
+                self.release(connection)
     
     def executemany(self, query, parameters_list):
         """
         Execute a query multiple times with different parameters.
         
+        A single-row INSERT INTO table (cols) VALUES (%s, ...) is rewritten
+        to one multi-row INSERT per batch with execute_values, or streamed
+        with COPY FROM STDIN once there are at least copy_threshold
+        parameter sets. Other
+        statements go through execute_batch, which sends a page of
+        statements per round trip. psycopg2 cannot report per-statement
+        row counts for execute_batch, so the count for those batches is
+        the number of parameter sets sent.
+        
         Args:
             query: SQL query string.
             parameters_list: List of parameter sets.
@@ -248,34 +569,52 @@ class PostgreSQLClient(DatabaseInterface):
         if not parameters_list:
             return 0
             
-        connection = None
+        connection, owned = None, False
+        in_transaction = self._local.transaction_level > 0
         batch_size = self.config.get("services.database.postgresql.batch_size", 100)
         total_affected = 0
         
         try:
-            # Get connection (from transaction or new)
-            if hasattr(self._local, 'connection') and self._local.connection is not None:
-                connection = self._local.connection
-            else:
-                connection = self.connect()
-                self._connection = connection
+            # Transaction connection, or one borrowed from the pool
+            connection, owned = self._acquire()
                 
-            self.logger.debug(f"Executing batch query: {query} with {len(parameters_list)} parameter sets")
+            self.logger.debug("Executing batch query: %s with %d parameter sets", query, len(parameters_list))
+            
+            extras = self._psycopg2.extras
+            insert_parts = _split_insert_values(query)
+            cursor = self._cursor(connection)
             
-            cursor = connection.cursor()
+            copy_target = self._copy_target(insert_parts, parameters_list)
+            if copy_target:
+                # Large plain inserts skip SQL parsing entirely
+                table, columns = copy_target
+                cursor.copy_expert(
+                    f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT text)",
+                    self._copy_buffer(parameters_list)
+                )
+                total_affected = len(parameters_list)
+                parameters_list = ()
             
-            # Process in batches
+            # Process in batches, one round trip per batch
             for i in range(0, len(parameters_list), batch_size):
                 batch = parameters_list[i:i + batch_size]
                 
-                # Use executemany for PostgreSQL
-                cursor.executemany(query, batch)
-                total_affected += cursor.rowcount
-                
-            cursor.close()
+                if insert_parts:
+                    prefix, template = insert_parts
+                    extras.execute_values(
+                        cursor,
+                        f"{prefix} %s",
+                        batch,
+                        template=template,
+                        page_size=len(batch)
+                    )
+                    total_affected += cursor.rowcount
+                else:
+                    extras.execute_batch(cursor, query, batch, page_size=len(batch))
+                    total_affected += len(batch)
             
             # Only commit if not in a transaction
-            if not hasattr(self._local, 'transaction_level') or self._local.transaction_level == 0:
+            if not in_transaction:
                 connection.commit()
                 
             return total_affected
@@ -286,6 +625,80 @@ class PostgreSQLClient(DatabaseInterface):
                 query=query,
                 error_code="POSTGRES-004"
             )
+        finally:
+            if owned:
+                self.release(connection)
+    
+    def _copy_target(self, insert_parts, parameters_list):
+        """
+        Get the COPY target for a bulk insert, if COPY should be used.
+        
+        COPY is only used when every value is a scalar, so the rows are
+        stored exactly as execute_values would store them.
+        
+        Args:
+            insert_parts: (prefix, template) from _split_insert_values, or None.
+            parameters_list: Parameter sets to insert.
+            
+        Returns:
+            tuple: (table, columns) or None to use execute_values.
+        """
+        if not insert_parts:
+            return None
+            
+        if len(parameters_list) < self.config.get("services.database.postgresql.copy_threshold", 5000):
+            return None
+            
+        prefix, template = insert_parts
+        match = _COPY_TARGET_PATTERN.match(prefix)
+        if not match or not _COPY_TEMPLATE_PATTERN.match(template):
+            return None
+            
+        if not all(
+            value is None or isinstance(value, _COPY_SCALAR_TYPES)
+            for parameters in parameters_list
+            for value in parameters
+        ):
+            return None
+            
+        return match.groups()
+    
+    def _copy_buffer(self, parameters_list):
+        """
+        Serialize parameter sets into a COPY text-format buffer.
+        
+        Args:
+            parameters_list: List of parameter sets.
+            
+        Returns:
+            io.StringIO: Tab-separated rows with NULLs written as \\N.
+        """
+        buffer = io.StringIO()
+        
+        for parameters in parameters_list:
+            buffer.write("\t".join(self._copy_value(value) for value in parameters))
+            buffer.write("\n")
+            
+        buffer.seek(0)
+        return buffer
+    
+    def _copy_value(self, value):
+        """
+        Format one value for COPY text format.
+        
+        Args:
+            value: Python value.
+            
+        Returns:
+            str: Escaped field text.
+        """
+        if value is None:
+            return "\\N"
+            
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return "\\\\x" + bytes(value).hex()
+            
+        return str(value).translate(_COPY_ESCAPES)
     
     @contextmanager
     def transaction(self):
@@ -300,14 +713,13 @@ class PostgreSQLClient(DatabaseInterface):
         Raises:
             DatabaseError: If transaction operations fail.
         """
-        if not hasattr(self._local, 'connection') or self._local.connection is None:
+        if self._local.connection is None:
             self._local.connection = self.connect()
-            self._local.transaction_level = 0
             
         # Increment transaction level (for nested transactions)
         self._local.transaction_level += 1
         
-        self.logger.debug(f"Starting transaction (level {self._local.transaction_level})")
+        self.logger.debug("Starting transaction (level %d)", self._local.transaction_level)
         
         try:
             yield
@@ -320,7 +732,7 @@ class PostgreSQLClient(DatabaseInterface):
             # Rollback on error
             if self._local.transaction_level == 1:
                 self._local.connection.rollback()
-                self.logger.debug(f"Transaction rolled back: {str(e)}")
+                self.logger.debug("Transaction rolled back: %s", e)
             raise
         finally:
             # Decrement transaction level
@@ -328,4 +740,6 @@ class PostgreSQLClient(DatabaseInterface):
             
             # Release connection if this is the outermost transaction
             if self._local.transaction_level == 0:
-                self._local.connection = None
\ No newline at end of file
+                connection = self._local.connection
+                self._local.connection = None
+                self.release(connection)
\ No newline at end of file
@@ -1,14 +1,147 @@
+import io
 import os
 import csv
 import json
+import math
+import mmap
+import errno
+import codecs
 import shutil
+import fnmatch
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Union, List, Dict, Any, Optional, BinaryIO, TextIO
+from typing import Union, List, Dict, Any, Optional, BinaryIO, TextIO, Iterable, Iterator
 
 from core.base.base_client import BaseClient
 from core.interfaces.configurable import Configurable
 from core.interfaces.loggable import Loggable
 
+# Writes at least this large are dropped from the page cache afterwards
+_FADVISE_THRESHOLD = 8 * 1024 * 1024
+
+# Text files larger than this are memory-mapped and decoded in chunks
+_MMAP_TEXT_THRESHOLD = 1 << 20
+_MMAP_TEXT_CHUNK = 1 << 20
+
+def _as_path(path):
+    """
+    Convert a path argument to a Path, reusing it if it already is one.
+    
+    Args:
+        path: String or Path.
+        
+    Returns:
+        Path: The path.
+    """
+    return path if isinstance(path, Path) else Path(path)
+
+# In-kernel copy calls as (src_fd, dst_fd, count) -> bytes copied, best first
+_KERNEL_COPIES = tuple(
+    copy_range for available, copy_range in (
+        (hasattr(os, "copy_file_range"), lambda src, dst, count: os.copy_file_range(src, dst, count)),
+        (hasattr(os, "sendfile"), lambda src, dst, count: os.sendfile(dst, src, None, count)),
+    ) if available
+)
+
+def _copy_fd(copy_range, src_fd, dst_fd, size):
+    """
+    Copy size bytes between file descriptors with an in-kernel copy call.
+    
+    Args:
+        copy_range: Entry from _KERNEL_COPIES.
+        src_fd: Source file descriptor, positioned at the start.
+        dst_fd: Destination file descriptor, positioned at the start.
+        size: Number of bytes to copy.
+        
+    Returns:
+        bool: True if the data was copied, False if the call is unsupported
+        for these files or copied nothing, and nothing was written.
+        
+    Raises:
+        OSError: If the copy fails part way through.
+    """
+    remaining = size
+    try:
+        while remaining > 0:
+            copied = copy_range(src_fd, dst_fd, remaining)
+            if copied == 0:
+                break
+            remaining -= copied
+    except OSError:
+        # Unsupported by this kernel or filesystem pair
+        if remaining == size:
+            return False
+        raise
+        
+    # Some files report a size but yield nothing to in-kernel copies
+    return remaining != size
+
+def _join_csv_rows(rows, delimiter):
+    """
+    Join CSV rows with str.join when no value needs quoting.
+    
+    Args:
+        rows: Iterable of rows of values.
+        delimiter: Column delimiter character.
+        
+    Returns:
+        str: The CSV text as csv.writer would write it, or None if a value
+        is not a string or would need quoting.
+    """
+    lines = []
+    for row in rows:
+        try:
+            line = delimiter.join(row)
+        except TypeError:
+            return None
+            
+        # A delimiter inside a value shows up as an extra separator
+        if (line.count(delimiter) != len(row) - 1 or '"' in line or '\n' in line 
+                or '\r' in line or line == "" and len(row) == 1):
+            return None
+        lines.append(line)
+        
+    lines.append("")
+    return "\r\n".join(lines)
+
+@lru_cache(maxsize=None)
+def _is_utf8(encoding):
+    """
+    Check whether an encoding name refers to plain UTF-8.
+    
+    Args:
+        encoding: Text encoding name.
+        
+    Returns:
+        bool: True for UTF-8 aliases, False otherwise (including utf-8-sig).
+    """
+    return codecs.lookup(encoding).name == "utf-8"
+
+def _has_non_finite_float(data):
+    """
+    Check whether nested JSON data contains NaN or an infinity.
+    
+    Args:
+        data: Data to check.
+        
+    Returns:
+        bool: True if any float in the dicts, lists and tuples is not finite.
+    """
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+            
+    return False
+
 class FileClient(BaseClient, Configurable, Loggable):
     """
     Client for file system operations.
@@ -25,6 +158,121 @@ class FileClient(BaseClient, Configurable, Loggable):
         """
         self.configure(config)
         self.initialize_logger("file_client")
+        
+        # Directories already created by this client, keyed by resolved
+        # path, so repeated writes into the same tree skip the mkdir system
+        # calls; writes recreate an entry's directory if it has since gone
+        self._known_dirs = set()
+        
+        # orjson reads and writes UTF-8 bytes directly and is several times
+        # faster than the json module, so use it when it is installed
+        try:
+            import orjson
+            self._orjson = orjson
+        except ImportError:
+            self._orjson = None
+            
+        # Reusable json module codecs for the fallback paths, with encoders
+        # built once per indent
+        self._json_decoder = json.JSONDecoder()
+        self._json_encoders = {}
+    
+    def _ensure_dir(self, path: Path, cached: bool = True) -> None:
+        """
+        Create a directory and its parents unless this client already has.
+        
+        Args:
+            path: Path to the directory.
+            cached: Whether to trust the created-directory cache; False
+                always calls mkdir.
+        """
+        # abspath makes no syscalls, unlike resolve(); a stale entry reached
+        # through another spelling of the path is recovered by _retry_write
+        key = os.path.abspath(path)
+        if cached and key in self._known_dirs:
+            return
+            
+        path.mkdir(parents=True, exist_ok=True)
+        self._known_dirs.add(key)
+    
+    def _retry_write(self, directory: Path, create_dirs: bool, func, *args, **kwargs) -> Any:
+        """
+        Call a function that writes into a directory, recreating it once if it has gone.
+        
+        A directory in the created-directory cache may have been deleted
+        since, outside this client; the write then fails with
+        FileNotFoundError and is retried after the directory is recreated.
+        
+        Args:
+            directory: Directory the function writes into.
+            create_dirs: Whether the caller asked for directories to be created.
+            func: Function to call.
+            *args: Positional arguments for func.
+            **kwargs: Keyword arguments for func.
+            
+        Returns:
+            Any: The function's return value.
+        """
+        try:
+            return func(*args, **kwargs)
+        except FileNotFoundError:
+            if not create_dirs or directory.is_dir():
+                raise
+                
+        self._forget_dirs(directory)
+        self._ensure_dir(directory)
+        return func(*args, **kwargs)
+    
+    def _forget_dirs(self, path: Path) -> None:
+        """
+        Drop a directory and everything under it from the created-directory cache.
+        
+        Args:
+            path: Path to the directory.
+        """
+        key = os.path.abspath(path)
+        prefix = os.path.join(key, "")
+        self._known_dirs = {known for known in self._known_dirs if known != key and not known.startswith(prefix)}
+    
+    def _rmtree(self, path: Path) -> None:
+        """
+        Recursively delete a directory, removing its subdirectories in parallel.
+        
+        Files directly under the directory are unlinked relative to a
+        directory descriptor where the platform supports it, and each
+        subdirectory is handed to shutil.rmtree on a worker thread.
+        
+        Args:
+            path: Path to the directory.
+        """
+        if path.is_symlink():
+            # Match shutil.rmtree, which refuses to follow a symlinked root
+            raise OSError(f"Cannot call rmtree on a symbolic link: {path}")
+        
+        subdirs = []
+        use_dir_fd = os.unlink in os.supports_dir_fd
+        dir_fd = os.open(path, os.O_RDONLY) if use_dir_fd else None
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif use_dir_fd:
+                        os.unlink(entry.name, dir_fd=dir_fd)
+                    else:
+                        os.unlink(entry.path)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+        
+        if len(subdirs) > 1:
+            with ThreadPoolExecutor(max_workers=min(32, len(subdirs))) as executor:
+                # Consume the results so the first failure is raised here
+                list(executor.map(shutil.rmtree, subdirs))
+        elif subdirs:
+            shutil.rmtree(subdirs[0])
+        
+        os.rmdir(path)
     
     def read_text(self, path: Union[str, Path], encoding: str = 'utf-8') -> str:
         """
@@ -41,16 +289,47 @@ class FileClient(BaseClient, Configurable, Loggable):
             FileNotFoundError: If the file does not exist.
             IOError: If the file cannot be read.
         """
-        path = Path(path)
-        self.logger.debug(f"Reading text file: {path}")
+        path = _as_path(path)
+        self.logger.debug("Reading text file: %s", path)
         
         try:
             with open(path, 'r', encoding=encoding) as f:
+                if os.fstat(f.fileno()).st_size > _MMAP_TEXT_THRESHOLD:
+                    return self._read_text_mmap(f.fileno(), encoding)
+                    
                 return f.read()
         except Exception as e:
             self.logger.error(f"Error reading file {path}: {str(e)}")
             raise
     
+    def _read_text_mmap(self, fd: int, encoding: str) -> str:
+        """
+        Decode a memory-mapped file in chunks.
+        
+        The encoded bytes are paged in on demand rather than read into
+        memory alongside the decoded text. Newlines are translated the
+        same way as a text-mode read.
+        
+        Args:
+            fd: File descriptor opened for reading.
+            encoding: Text encoding to use.
+            
+        Returns:
+            str: The contents of the file.
+        """
+        decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder(encoding)(), translate=True)
+        
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapping:
+            if hasattr(mapping, "madvise"):
+                mapping.madvise(mmap.MADV_SEQUENTIAL)
+                
+            size = len(mapping)
+            chunks = [decoder.decode(mapping[start:start + _MMAP_TEXT_CHUNK]) 
+                      for start in range(0, size, _MMAP_TEXT_CHUNK)]
+            chunks.append(decoder.decode(b"", final=True))
+            
+        return "".join(chunks)
+    
     def write_text(self, path: Union[str, Path], content: str, 
                   encoding: str = 'utf-8', create_dirs: bool = True) -> None:
         """
@@ -65,43 +344,183 @@ class FileClient(BaseClient, Configurable, Loggable):
         Raises:
             IOError: If the file cannot be written.
         """
-        path = Path(path)
-        self.logger.debug(f"Writing text file: {path}")
+        path = _as_path(path)
+        self.logger.debug("Writing text file: %s", path)
         
         if create_dirs:
-            path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(path.parent)
             
         try:
-            with open(path, 'w', encoding=encoding) as f:
+            with self._retry_write(path.parent, create_dirs, open, path, 'w', encoding=encoding) as f:
                 f.write(content)
         except Exception as e:
             self.logger.error(f"Error writing file {path}: {str(e)}")
             raise
     
-    def read_binary(self, path: Union[str, Path]) -> bytes:
+    def read_binary(self, path: Union[str, Path], direct: bool = False, 
+                    mmap_threshold: Optional[int] = None) -> Union[bytes, memoryview]:
         """
         Read binary data from a file.
         
         Args:
             path: Path to the file.
+            direct: Read with O_DIRECT, bypassing the page cache. Intended
+                for multi-GB files that would otherwise be copied twice and
+                evict the cache. Falls back to a buffered read where
+                O_DIRECT is unsupported (e.g. tmpfs or non-Linux systems).
+            mmap_threshold: Memory-map files of at least this many bytes
+                (16 MiB is a good value) instead of copying them, so pages
+                are only read in as they are accessed.
             
         Returns:
-            bytes: The binary contents of the file.
+            Union[bytes, memoryview]: The binary contents of the file as
+            bytes. With direct=True, or for a memory-mapped file, a
+            memoryview instead: it compares equal to bytes but has no
+            decode() and cannot be concatenated with bytes, so call
+            bytes() on it where those are needed. A memory-mapped view
+            keeps the mapping open until the view is released or
+            garbage collected.
             
         Raises:
             FileNotFoundError: If the file does not exist.
             IOError: If the file cannot be read.
         """
-        path = Path(path)
-        self.logger.debug(f"Reading binary file: {path}")
+        path = _as_path(path)
+        self.logger.debug("Reading binary file: %s", path)
         
+        if direct and hasattr(os, "O_DIRECT"):
+            try:
+                content = self._read_direct(path)
+                if content is not None:
+                    return content
+            except Exception as e:
+                self.logger.error(f"Error reading binary file {path}: {str(e)}")
+                raise
+                
         try:
             with open(path, 'rb') as f:
+                if mmap_threshold is not None and os.fstat(f.fileno()).st_size >= max(mmap_threshold, 1):
+                    mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    if hasattr(mapping, "madvise"):
+                        mapping.madvise(mmap.MADV_SEQUENTIAL)
+                    return memoryview(mapping)
+                    
                 return f.read()
         except Exception as e:
             self.logger.error(f"Error reading binary file {path}: {str(e)}")
             raise
     
+    def _read_direct(self, path: Path) -> Optional[memoryview]:
+        """
+        Read a whole file with O_DIRECT into a page-aligned buffer.
+        
+        Args:
+            path: Path to the file.
+            
+        Returns:
+            memoryview: The file contents, or None if the filesystem
+            rejects O_DIRECT.
+        """
+        try:
+            fd = os.open(path, os.O_RDONLY | os.O_DIRECT)
+        except OSError as e:
+            if e.errno == errno.EINVAL:
+                return None
+            raise
+            
+        try:
+            size = os.fstat(fd).st_size
+            
+            # O_DIRECT transfers whole blocks; anonymous mmaps are page-aligned
+            block_size = max(os.fstatvfs(fd).f_bsize, mmap.PAGESIZE)
+            buffer = mmap.mmap(-1, max(-(-size // block_size) * block_size, block_size))
+            view = memoryview(buffer)
+            
+            offset = 0
+            try:
+                while offset < size:
+                    read = os.preadv(fd, [view[offset:]], offset)
+                    if read == 0:
+                        break
+                    offset += read
+            except OSError as e:
+                if e.errno == errno.EINVAL and offset == 0:
+                    return None
+                raise
+                
+            return view[:offset]
+        finally:
+            os.close(fd)
+    
+    def iter_binary(self, path: Union[str, Path], 
+                    chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        """
+        Read binary data from a file in fixed-size chunks.
+        
+        Only one chunk is held in memory at a time, so arbitrarily large
+        files can be processed with a bounded working set.
+        
+        Args:
+            path: Path to the file.
+            chunk_size: Maximum number of bytes per chunk.
+            
+        Yields:
+            bytes: The next chunk of the file.
+            
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            IOError: If the file cannot be read.
+        """
+        path = _as_path(path)
+        self.logger.debug("Streaming binary file: %s", path)
+        
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except Exception as e:
+            self.logger.error(f"Error reading binary file {path}: {str(e)}")
+            raise
+            
+        try:
+            while True:
+                chunk = os.read(fd, chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        except Exception as e:
+            self.logger.error(f"Error reading binary file {path}: {str(e)}")
+            raise
+        finally:
+            os.close(fd)
+    
+    def read_many_binary(self, paths: List[Union[str, Path]], 
+                         max_workers: Optional[int] = None) -> List[bytes]:
+        """
+        Read binary data from several files concurrently.
+        
+        File reads release the GIL, so a thread pool overlaps the open and
+        read system calls of many small files instead of paying for them
+        one after another.
+        
+        Args:
+            paths: Paths to the files.
+            max_workers: Maximum number of reader threads.
+            
+        Returns:
+            list: The binary contents of each file, in the order given.
+            
+        Raises:
+            FileNotFoundError: If a file does not exist.
+            IOError: If a file cannot be read.
+        """
+        paths = [_as_path(path) for path in paths]
+        self.logger.debug("Reading %d binary files", len(paths))
+        
+        if len(paths) < 2:
+            return [self.read_binary(path) for path in paths]
+            
+        with ThreadPoolExecutor(max_workers=max_workers or min(32, len(paths))) as executor:
+            return list(executor.map(self.read_binary, paths))
+    
     def write_binary(self, path: Union[str, Path], content: bytes, 
                     create_dirs: bool = True) -> None:
         """
@@ -115,19 +534,67 @@ class FileClient(BaseClient, Configurable, Loggable):
         Raises:
             IOError: If the file cannot be written.
         """
-        path = Path(path)
-        self.logger.debug(f"Writing binary file: {path}")
+        path = _as_path(path)
+        self.logger.debug("Writing binary file: %s", path)
         
         if create_dirs:
-            path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(path.parent)
             
         try:
-            with open(path, 'wb') as f:
-                f.write(content)
+            # Unbuffered, so the content goes straight to write() without
+            # passing through a BufferedWriter
+            with self._retry_write(path.parent, create_dirs, open, path, 'wb', buffering=0) as f:
+                view = memoryview(content)
+                while view:
+                    view = view[f.write(view):]
+                
+                # Large write-once artifacts shouldn't evict hotter pages
+                if len(content) >= _FADVISE_THRESHOLD and hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
         except Exception as e:
             self.logger.error(f"Error writing binary file {path}: {str(e)}")
             raise
     
+    def write_many(self, parent: Union[str, Path], files: Dict[str, bytes], 
+                   create_dirs: bool = True) -> None:
+        """
+        Write several binary files into one directory.
+        
+        The directory is opened once and each file is created relative to
+        it, so the kernel does not walk the full path for every file.
+        
+        Args:
+            parent: Path to the directory.
+            files: Mapping of file names, relative to parent, to binary content.
+            create_dirs: Whether to create the directory if it doesn't exist.
+            
+        Raises:
+            IOError: If a file cannot be written.
+        """
+        parent = _as_path(parent)
+        self.logger.debug("Writing %d files to: %s", len(files), parent)
+        
+        if create_dirs:
+            self._ensure_dir(parent)
+            
+        dir_fd = None
+        if os.open in os.supports_dir_fd:
+            dir_fd = self._retry_write(parent, create_dirs, os.open, parent, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+            opener = lambda name, flags: os.open(name, flags, 0o666, dir_fd=dir_fd)
+        else:
+            opener = lambda name, flags: os.open(parent / name, flags, 0o666)
+            
+        try:
+            for name, content in files.items():
+                with self._retry_write(parent, create_dirs, open, name, 'wb', opener=opener) as f:
+                    f.write(content)
+        except Exception as e:
+            self.logger.error(f"Error writing files to {parent}: {str(e)}")
+            raise
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+    
     def read_json(self, path: Union[str, Path], encoding: str = 'utf-8') -> Dict[str, Any]:
         """
         Read JSON data from a file.
@@ -143,25 +610,93 @@ class FileClient(BaseClient, Configurable, Loggable):
             FileNotFoundError: If the file does not exist.
             json.JSONDecodeError: If the file contains invalid JSON.
         """
-        path = Path(path)
-        self.logger.debug(f"Reading JSON file: {path}")
+        path = _as_path(path)
+        self.logger.debug("Reading JSON file: %s", path)
         
         try:
+            if self._orjson is not None and _is_utf8(encoding):
+                # Parse the raw bytes, skipping the text decode step
+                with open(path, 'rb') as f:
+                    return self._loads_json(f.read(), encoding)
+                    
             with open(path, 'r', encoding=encoding) as f:
-                return json.load(f)
+                return self._json_decoder.decode(f.read())
         except json.JSONDecodeError as e:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
             self.logger.error(f"Invalid JSON in file {path}: {str(e)}")
             raise
         except Exception as e:
             self.logger.error(f"Error reading JSON file {path}: {str(e)}")
             raise
     
+    def read_many_json(self, paths: List[Union[str, Path]], encoding: str = 'utf-8', 
+                       max_workers: Optional[int] = None) -> List[Any]:
+        """
+        Read JSON data from several files, overlapping the file reads.
+        
+        The files are read concurrently with read_many_binary and then
+        parsed from the raw bytes, with orjson when it is installed.
+        
+        Args:
+            paths: Paths to the files.
+            encoding: Text encoding of the files.
+            max_workers: Maximum number of reader threads.
+            
+        Returns:
+            list: The parsed JSON data of each file, in the order given.
+            
+        Raises:
+            FileNotFoundError: If a file does not exist.
+            json.JSONDecodeError: If a file contains invalid JSON.
+        """
+        paths = [_as_path(path) for path in paths]
+        blobs = self.read_many_binary(paths, max_workers=max_workers)
+        
+        results = []
+        for path, blob in zip(paths, blobs):
+            try:
+                results.append(self._loads_json(blob, encoding))
+            except json.JSONDecodeError as e:
+                self.logger.error(f"Invalid JSON in file {path}: {str(e)}")
+                raise
+        return results
+    
+    def _loads_json(self, blob: bytes, encoding: str) -> Any:
+        """
+        Parse JSON from raw bytes, with orjson when it is installed.
+        
+        orjson is stricter than the json module: it rejects NaN and
+        Infinity literals, integers beyond 64 bits and lone surrogates.
+        Such documents are parsed again with the json module.
+        
+        Args:
+            blob: Encoded JSON document.
+            encoding: Text encoding of the document.
+            
+        Returns:
+            Any: The parsed JSON data.
+            
+        Raises:
+            json.JSONDecodeError: If the document is invalid JSON.
+        """
+        if self._orjson is not None and _is_utf8(encoding):
+            try:
+                return self._orjson.loads(blob)
+            except self._orjson.JSONDecodeError:
+                pass
+                
+        return self._json_decoder.decode(blob.decode(encoding))
+    
     def write_json(self, path: Union[str, Path], data: Dict[str, Any], 
                   encoding: str = 'utf-8', indent: int = 2, 
                   create_dirs: bool = True) -> None:
         """
         Write JSON data to a file.
         
+        UTF-8 files with an indent of 2 or None are serialized with orjson
+        when it is installed; anything else, and data orjson would change
+        (such as NaN and infinite floats), goes through the json module.
+        
         Args:
             path: Path to the file.
             data: Data to serialize to JSON.
@@ -173,21 +708,49 @@ class FileClient(BaseClient, Configurable, Loggable):
             TypeError: If the data cannot be serialized to JSON.
             IOError: If the file cannot be written.
         """
-        path = Path(path)
-        self.logger.debug(f"Writing JSON file: {path}")
+        path = _as_path(path)
+        self.logger.debug("Writing JSON file: %s", path)
         
         if create_dirs:
-            path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(path.parent)
             
         try:
-            with open(path, 'w', encoding=encoding) as f:
-                json.dump(data, f, indent=indent)
+            content = None
+            if self._orjson is not None and indent in (None, 2) and _is_utf8(encoding):
+                orjson = self._orjson
+                try:
+                    content = orjson.dumps(
+                        data,
+                        option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+                    )
+                except orjson.JSONEncodeError:
+                    # e.g. integers beyond 64 bits, which the json module handles
+                    content = None
+                    
+                # orjson writes NaN and infinities as null; keep them as the
+                # json module's NaN/Infinity instead. Only output containing
+                # null can be affected, so other data skips the walk
+                if content is not None and b"null" in content and _has_non_finite_float(data):
+                    content = None
+                    
+            if content is not None:
+                with self._retry_write(path.parent, create_dirs, open, path, 'wb') as f:
+                    f.write(content)
+            else:
+                encoder = self._json_encoders.get(indent)
+                if encoder is None:
+                    encoder = self._json_encoders[indent] = json.JSONEncoder(indent=indent)
+                    
+                # Encode in one piece rather than json.dump's chunked writes
+                content = encoder.encode(data)
+                with self._retry_write(path.parent, create_dirs, open, path, 'w', encoding=encoding) as f:
+                    f.write(content)
         except Exception as e:
             self.logger.error(f"Error writing JSON file {path}: {str(e)}")
             raise
     
     def read_csv(self, path: Union[str, Path], delimiter: str = ',', 
-                encoding: str = 'utf-8') -> List[List[str]]:
+                encoding: str = 'utf-8', engine: str = 'python') -> List[List[str]]:
         """
         Read data from a CSV file.
         
@@ -195,16 +758,31 @@ class FileClient(BaseClient, Configurable, Loggable):
             path: Path to the file.
             delimiter: Column delimiter character.
             encoding: Text encoding to use.
+            engine: "python" for the csv module, or "polars" or "pyarrow"
+                to parse with that library's multithreaded reader before
+                building the rows.
             
         Returns:
             list: A list of rows, where each row is a list of values.
             
         Raises:
             FileNotFoundError: If the file does not exist.
+            ImportError: If engine is "polars" or "pyarrow" and that
+                library is not installed.
             csv.Error: If the file contains invalid CSV.
         """
-        path = Path(path)
-        self.logger.debug(f"Reading CSV file: {path}")
+        path = _as_path(path)
+        
+        if engine == 'polars':
+            # Every column is read as text, matching the csv module
+            df = self.read_csv_arrow(path, delimiter=delimiter, has_header=False,
+                                     encoding=encoding, infer_schema_length=0)
+            return [list(row) for row in df.fill_null("").rows()]
+            
+        if engine == 'pyarrow':
+            return self._read_csv_pyarrow(path, delimiter, encoding)
+            
+        self.logger.debug("Reading CSV file: %s", path)
         
         try:
             with open(path, 'r', newline='', encoding=encoding) as f:
@@ -214,12 +792,148 @@ class FileClient(BaseClient, Configurable, Loggable):
             self.logger.error(f"Error reading CSV file {path}: {str(e)}")
             raise
     
+    def _read_csv_pyarrow(self, path: Path, delimiter: str, encoding: str) -> List[List[str]]:
+        """
+        Read CSV rows with pyarrow's multithreaded C++ parser.
+        
+        Every column is read as text, matching the csv module. pyarrow
+        needs each column's type up front, so the column count is taken
+        from the first row.
+        
+        Args:
+            path: Path to the file.
+            delimiter: Column delimiter character.
+            encoding: Text encoding of the file.
+            
+        Returns:
+            list: A list of rows, where each row is a list of values.
+            
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        try:
+            import pyarrow
+            import pyarrow.csv as pacsv
+        except ImportError:
+            raise ImportError("pyarrow module not found. Please install it with: pip install pyarrow")
+            
+        self.logger.debug("Reading CSV file with pyarrow: %s", path)
+        
+        try:
+            with open(path, 'r', newline='', encoding=encoding) as f:
+                first_row = next(csv.reader(f, delimiter=delimiter), None)
+            if not first_row:
+                return [] if first_row is None else self.read_csv(path, delimiter, encoding)
+                
+            names = [f"f{i}" for i in range(len(first_row))]
+            table = pacsv.read_csv(
+                path,
+                read_options=pacsv.ReadOptions(column_names=names, encoding=encoding),
+                parse_options=pacsv.ParseOptions(delimiter=delimiter, newlines_in_values=True),
+                convert_options=pacsv.ConvertOptions(column_types=dict.fromkeys(names, pyarrow.string()))
+            )
+        except Exception as e:
+            self.logger.error(f"Error reading CSV file {path}: {str(e)}")
+            raise
+            
+        return [list(row) for row in zip(*(column.to_pylist() for column in table.columns))]
+    
+    def iter_csv(self, path: Union[str, Path], delimiter: str = ',', 
+                 encoding: str = 'utf-8', skip_header: bool = False, 
+                 buffer_size: int = 1024 * 1024) -> Iterator[List[str]]:
+        """
+        Read rows from a CSV file one at a time.
+        
+        Only the read buffer and the current row are held in memory, so
+        large files can be streamed into a database or another file.
+        
+        Args:
+            path: Path to the file.
+            delimiter: Column delimiter character.
+            encoding: Text encoding to use.
+            skip_header: Whether to skip the first row.
+            buffer_size: Size of the file read buffer in bytes.
+            
+        Yields:
+            list: The next row, as a list of values.
+            
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            csv.Error: If the file contains invalid CSV.
+        """
+        path = _as_path(path)
+        self.logger.debug("Streaming CSV file: %s", path)
+        
+        try:
+            f = open(path, 'r', newline='', encoding=encoding, buffering=buffer_size)
+        except Exception as e:
+            self.logger.error(f"Error reading CSV file {path}: {str(e)}")
+            raise
+            
+        with f:
+            reader = csv.reader(f, delimiter=delimiter)
+            if skip_header:
+                next(reader, None)
+            yield from reader
+    
+    def read_csv_arrow(self, path: Union[str, Path], delimiter: str = ',', 
+                       has_header: bool = True, encoding: str = 'utf-8', 
+                       **kwargs) -> Any:
+        """
+        Read a CSV file into a polars DataFrame.
+        
+        The file is parsed column by column into Arrow memory without
+        creating a Python object per cell, so callers that can work with
+        the DataFrame directly should prefer this over read_csv.
+        
+        Args:
+            path: Path to the file.
+            delimiter: Column delimiter character.
+            has_header: Whether the first row holds the column names.
+            encoding: Text encoding to use.
+            **kwargs: Extra arguments for polars.read_csv.
+            
+        Returns:
+            polars.DataFrame: The parsed data.
+            
+        Raises:
+            ImportError: If polars is not installed.
+            FileNotFoundError: If the file does not exist.
+        """
+        try:
+            import polars
+        except ImportError:
+            raise ImportError("polars module not found. Please install it with: pip install polars")
+            
+        path = _as_path(path)
+        self.logger.debug("Reading CSV file with polars: %s", path)
+        
+        try:
+            return polars.read_csv(
+                path,
+                separator=delimiter,
+                has_header=has_header,
+                encoding="utf8" if _is_utf8(encoding) else encoding,
+                rechunk=False,
+                low_memory=False,
+                n_threads=os.cpu_count(),
+                **kwargs
+            )
+        except Exception as e:
+            self.logger.error(f"Error reading CSV file {path}: {str(e)}")
+            raise
+    
     def write_csv(self, path: Union[str, Path], rows: List[List[str]], 
                  headers: Optional[List[str]] = None, delimiter: str = ',', 
-                 encoding: str = 'utf-8', create_dirs: bool = True) -> None:
+                 encoding: str = 'utf-8', create_dirs: bool = True, 
+                 fast: bool = False) -> None:
         """
         Write data to a CSV file.
         
+        Every cell is formatted in Python; for tables of more than about
+        10,000 rows prefer write_csv_arrow with a polars DataFrame or
+        pyarrow Table.
+        
         Args:
             path: Path to the file.
             rows: Data rows to write.
@@ -227,33 +941,132 @@ class FileClient(BaseClient, Configurable, Loggable):
             delimiter: Column delimiter character.
             encoding: Text encoding to use.
             create_dirs: Whether to create parent directories if they don't exist.
+            fast: Join rows with str.join instead of the csv module when every
+                value is a string that needs no quoting; the output is the
+                same either way.
             
         Raises:
             IOError: If the file cannot be written.
         """
-        path = Path(path)
-        self.logger.debug(f"Writing CSV file: {path}")
+        path = _as_path(path)
+        self.logger.debug("Writing CSV file: %s", path)
         
         if create_dirs:
-            path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(path.parent)
+            
+        content = None
+        if fast:
+            # Rows are walked twice if a value turns out to need quoting
+            rows = rows if isinstance(rows, list) else list(rows)
+            content = _join_csv_rows(chain([headers], rows) if headers else rows, delimiter)
             
         try:
-            with open(path, 'w', newline='', encoding=encoding) as f:
-                writer = csv.writer(f, delimiter=delimiter)
-                
-                if headers:
-                    writer.writerow(headers)
+            if content is not None:
+                with self._retry_write(path.parent, create_dirs, open, path, 'w', newline='', 
+                                       encoding=encoding, buffering=1 << 20) as f:
+                    f.write(content)
+                return
                 
+            with self._retry_write(path.parent, create_dirs, open, path, 'w', newline='', encoding=encoding) as f:
+                csv.writer(f, delimiter=delimiter).writerows(
+                    chain([headers], rows) if headers else rows
+                )
+        except Exception as e:
+            self.logger.error(f"Error writing CSV file {path}: {str(e)}")
+            raise
+    
+    def write_csv_dicts(self, path: Union[str, Path], rows: Iterable[Dict[str, Any]], 
+                        headers: List[str], delimiter: str = ',', 
+                        encoding: str = 'utf-8', create_dirs: bool = True) -> None:
+        """
+        Write dictionary rows to a CSV file.
+        
+        Values are taken from each row by header name and written straight
+        through csv.DictWriter, without building intermediate list rows.
+        Missing keys are written as empty values and extra keys are ignored.
+        
+        Args:
+            path: Path to the file.
+            rows: Data rows, as dictionaries keyed by header.
+            headers: Column headers, in output order.
+            delimiter: Column delimiter character.
+            encoding: Text encoding to use.
+            create_dirs: Whether to create parent directories if they don't exist.
+            
+        Raises:
+            IOError: If the file cannot be written.
+        """
+        path = _as_path(path)
+        self.logger.debug("Writing CSV file: %s", path)
+        
+        if create_dirs:
+            self._ensure_dir(path.parent)
+            
+        try:
+            with self._retry_write(path.parent, create_dirs, open, path, 'w', newline='', 
+                                   encoding=encoding, buffering=1 << 20) as f:
+                writer = csv.DictWriter(f, headers, delimiter=delimiter, extrasaction='ignore')
+                writer.writeheader()
                 writer.writerows(rows)
         except Exception as e:
             self.logger.error(f"Error writing CSV file {path}: {str(e)}")
             raise
     
+    def write_csv_arrow(self, path: Union[str, Path], data: Any, delimiter: str = ',', 
+                        create_dirs: bool = True) -> None:
+        """
+        Write a polars DataFrame or pyarrow Table to a CSV file.
+        
+        Columns are formatted in native code and streamed straight to the
+        file, with no Python loop over rows or cells. The header row is
+        taken from the column names and the file is UTF-8 encoded.
+        
+        Args:
+            path: Path to the file.
+            data: polars.DataFrame or pyarrow.Table to write.
+            delimiter: Column delimiter character.
+            create_dirs: Whether to create parent directories if they don't exist.
+            
+        Raises:
+            ImportError: If data is not a DataFrame and pyarrow is not installed.
+            IOError: If the file cannot be written.
+        """
+        path = _as_path(path)
+        self.logger.debug("Writing columnar CSV file: %s", path)
+        
+        if create_dirs:
+            self._ensure_dir(path.parent)
+            
+        # polars DataFrames write themselves; anything else is an Arrow table
+        if hasattr(data, "write_csv"):
+            try:
+                self._retry_write(path.parent, create_dirs, data.write_csv, path, separator=delimiter)
+            except Exception as e:
+                self.logger.error(f"Error writing CSV file {path}: {str(e)}")
+                raise
+            return
+            
+        try:
+            import pyarrow.csv as pacsv
+        except ImportError:
+            raise ImportError("pyarrow module not found. Please install it with: pip install pyarrow")
+            
+        try:
+            self._retry_write(path.parent, create_dirs, pacsv.write_csv, data, path, 
+                              write_options=pacsv.WriteOptions(delimiter=delimiter))
+        except Exception as e:
+            self.logger.error(f"Error writing CSV file {path}: {str(e)}")
+            raise
+    
     def copy(self, source: Union[str, Path], destination: Union[str, Path], 
             create_dirs: bool = True) -> None:
         """
         Copy a file from source to destination.
         
+        Where the platform supports it the data is copied inside the kernel
+        (see _fast_copy); otherwise shutil.copy2 is used. File metadata is
+        copied either way.
+        
         Args:
             source: Source file path.
             destination: Destination file path.
@@ -263,19 +1076,68 @@ class FileClient(BaseClient, Configurable, Loggable):
             FileNotFoundError: If the source file does not exist.
             IOError: If the file cannot be copied.
         """
-        source = Path(source)
-        destination = Path(destination)
-        self.logger.debug(f"Copying file: {source} to {destination}")
+        source = _as_path(source)
+        destination = _as_path(destination)
+        self.logger.debug("Copying file: %s to %s", source, destination)
         
         if create_dirs:
-            destination.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(destination.parent)
             
         try:
-            shutil.copy2(source, destination)
+            if not self._retry_write(destination.parent, create_dirs, self._fast_copy, source, destination):
+                shutil.copy2(source, destination)
         except Exception as e:
             self.logger.error(f"Error copying file {source} to {destination}: {str(e)}")
             raise
     
+    def _fast_copy(self, source: Path, destination: Path) -> bool:
+        """
+        Copy a file's data without passing it through user space.
+        
+        os.copy_file_range is tried first, since it can clone the blocks on
+        copy-on-write filesystems; os.sendfile covers kernels or filesystem
+        pairs where it is unsupported. Metadata is copied as shutil.copy2
+        would.
+        
+        Args:
+            source: Source file path.
+            destination: Destination file or directory path.
+            
+        Returns:
+            bool: True if the file was copied, False if the caller should
+            fall back to shutil.copy2.
+            
+        Raises:
+            shutil.SameFileError: If source and destination are the same
+                file, including hard links to it.
+        """
+        if not source.is_file():
+            return False
+            
+        if destination.is_dir():
+            destination = destination / source.name
+            
+        # Opening the destination truncates it, which would wipe the source
+        if os.path.exists(destination) and os.path.samefile(source, destination):
+            raise shutil.SameFileError(f"{source} and {destination} are the same file")
+            
+        with open(source, 'rb') as src:
+            # Pseudo-files such as /proc entries report a size of 0 but
+            # still have content, so only a read loop copies them
+            size = os.fstat(src.fileno()).st_size
+            if size == 0:
+                return False
+                
+            with open(destination, 'wb') as dst:
+                for copy_range in _KERNEL_COPIES:
+                    if _copy_fd(copy_range, src.fileno(), dst.fileno(), size):
+                        break
+                else:
+                    return False
+                
+        shutil.copystat(source, destination)
+        return True
+    
     def move(self, source: Union[str, Path], destination: Union[str, Path], 
             create_dirs: bool = True) -> None:
         """
@@ -290,15 +1152,18 @@ class FileClient(BaseClient, Configurable, Loggable):
             FileNotFoundError: If the source file does not exist.
             IOError: If the file cannot be moved.
         """
-        source = Path(source)
-        destination = Path(destination)
-        self.logger.debug(f"Moving file: {source} to {destination}")
+        source = _as_path(source)
+        destination = _as_path(destination)
+        self.logger.debug("Moving file: %s to %s", source, destination)
         
         if create_dirs:
-            destination.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(destination.parent)
+            
+        if source.is_dir():
+            self._forget_dirs(source)
             
         try:
-            shutil.move(source, destination)
+            self._retry_write(destination.parent, create_dirs, shutil.move, source, destination)
         except Exception as e:
             self.logger.error(f"Error moving file {source} to {destination}: {str(e)}")
             raise
@@ -314,8 +1179,8 @@ class FileClient(BaseClient, Configurable, Loggable):
             FileNotFoundError: If the file does not exist.
             IOError: If the file cannot be deleted.
         """
-        path = Path(path)
-        self.logger.debug(f"Deleting file: {path}")
+        path = _as_path(path)
+        self.logger.debug("Deleting file: %s", path)
         
         try:
             path.unlink()
@@ -333,11 +1198,11 @@ class FileClient(BaseClient, Configurable, Loggable):
         Raises:
             IOError: If the directory cannot be created.
         """
-        path = Path(path)
-        self.logger.debug(f"Creating directory: {path}")
+        path = _as_path(path)
+        self.logger.debug("Creating directory: %s", path)
         
         try:
-            path.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(path, cached=False)
         except Exception as e:
             self.logger.error(f"Error creating directory {path}: {str(e)}")
             raise
@@ -347,20 +1212,25 @@ class FileClient(BaseClient, Configurable, Loggable):
         """
         Delete a directory.
         
+        Recursive deletes remove the top-level subdirectories in parallel,
+        so large trees on slow or network file systems are unlinked with
+        several requests in flight.
+        
         Args:
             path: Path to the directory.
             recursive: Whether to recursively delete the directory contents.
-            
+        
         Raises:
             FileNotFoundError: If the directory does not exist.
             IOError: If the directory cannot be deleted.
         """
-        path = Path(path)
-        self.logger.debug(f"Deleting directory: {path}")
+        path = _as_path(path)
+        self.logger.debug("Deleting directory: %s", path)
+        self._forget_dirs(path)
         
         try:
             if recursive:
-                shutil.rmtree(path)
+                self._rmtree(path)
             else:
                 path.rmdir()
         except Exception as e:
@@ -382,11 +1252,37 @@ class FileClient(BaseClient, Configurable, Loggable):
         Raises:
             FileNotFoundError: If the directory does not exist.
         """
-        path = Path(path)
-        self.logger.debug(f"Listing directory: {path} with pattern: {pattern}")
+        path = _as_path(path)
+        self.logger.debug("Listing directory: %s with pattern: %s", path, pattern)
         
         try:
-            return list(path.glob(pattern))
+            # Patterns spanning directories still need a full glob
+            if "**" in pattern or "/" in pattern or os.sep in pattern:
+                return list(path.glob(pattern))
+                
+            return [path / name for name in self.scandir_names(path, pattern)]
         except Exception as e:
             self.logger.error(f"Error listing directory {path}: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+    
+    def scandir_names(self, path: Union[str, Path], pattern: str = "*") -> List[str]:
+        """
+        List the entry names in a directory without building Path objects.
+        
+        A single os.scandir pass reads the names straight from the
+        directory, with no stat call per entry.
+        
+        Args:
+            path: Path to the directory.
+            pattern: fnmatch pattern for filtering names.
+            
+        Returns:
+            list: Names of the matching directory entries.
+            
+        Raises:
+            FileNotFoundError: If the directory does not exist.
+        """
+        with os.scandir(path) as entries:
+            names = [entry.name for entry in entries]
+            
+        return names if pattern == "*" else fnmatch.filter(names, pattern)
\ No newline at end of file
@@ -1,10 +1,29 @@
+import os
 from setuptools import setup, find_packages
 
+# Build with PYTHON_LIBRARY_CYTHON=1 to compile the database client hot
+# paths with Cython; the pure Python modules are used otherwise
+ext_modules = []
+if os.environ.get("PYTHON_LIBRARY_CYTHON") == "1":
+       try:
+              from Cython.Build import cythonize
+       except ImportError:
+              raise ImportError("Cython module not found. Please install it with: pip install cython")
+
+       ext_modules = cythonize(
+              [
+                     "services/database/postgresql_client.py",
+                     "services/database/mysql_client.py",
+              ],
+              compiler_directives={"language_level": "3", "binding": True},
+       )
+
 setup(
        name="python_library",
        version="1.0",
        packages=find_packages(),
+       ext_modules=ext_modules,
        description="A collection of Python scripts",
        author="Ben Lacey",
        author_email="ben.lacey57@gmail.com",
-   )
\ No newline at end of file
+   )
@@ -65,12 +65,15 @@ python sphinx_setup.py serve
 ```
 python sphinx_setup.py git-hooks
 ```
+"""
 
 import os
 import sys
 import shutil
+import logging
 import argparse
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Configuration
@@ -81,24 +84,115 @@ SOURCE_DIR = PROJECT_ROOT / "src"
 STATIC_DIR = DOCS_DIR / "_static"
 TEMPLATES_DIR = DOCS_DIR / "_templates"
 
+# Directories never searched for component READMEs (hidden ones are skipped too)
+IGNORED_DIRS = {'_build', 'node_modules', '__pycache__', 'dist', 'build'}
+
+# Progress messages go through one stderr handler, configured in main()
+logger = logging.getLogger('sphinx_setup')
+
+# Body of each placeholder documentation page, filled in per page title
+PLACEHOLDER_TEMPLATE = '''{title}
+{underline}
+
+.. toctree::
+   :maxdepth: 2
+
+Introduction
+-----------
+This section covers {title_lower}.
+
+Features
+--------
+* Feature 1
+* Feature 2
+* Feature 3
+
+Usage Examples
+-------------
+
+Basic Usage
+~~~~~~~~~~
+
+.. code-block:: python
+
+    # Example code
+    from pylib import example
+    
+    # Use the library
+    result = example.function()
+
+Advanced Usage
+~~~~~~~~~~~~~
+
+.. code-block:: python
+
+    # Advanced example
+    from pylib import advanced
+    
+    # Configure options
+    config = advanced.Config(option1=True)
+    
+    # Use advanced features
+    result = advanced.process(data, config)
+
+API Reference
+------------
+See the :ref:`api_reference` for detailed API information.
+'''
+
 def create_directory(path):
     """Create directory if it doesn't exist."""
     path.mkdir(parents=True, exist_ok=True)
-    print(f"Created directory: {path}")
+    logger.info("Created directory: %s", path)
 
-def run_command(cmd, cwd=None):
-    """Run a command and print output."""
-    print(f"Running: {' '.join(cmd)}")
+def run_command(cmd, cwd=None, capture=True):
+    """
+    Run a command, logging its output only if it fails.
+    
+    Pass capture=False for long-running commands whose output should be
+    shown as it is written.
+    """
+    logger.debug("Running: %s", ' '.join(cmd))
     try:
-        subprocess.run(cmd, check=True, cwd=cwd)
+        subprocess.run(cmd, check=True, cwd=cwd, capture_output=capture, text=True)
         return True
     except subprocess.CalledProcessError as e:
-        print(f"Error running command: {e}")
+        logger.error("Error running command: %s", e)
+        if e.stdout:
+            logger.error("%s", e.stdout.rstrip())
+        if e.stderr:
+            logger.error("%s", e.stderr.rstrip())
         return False
 
+def write_placeholder(placeholder):
+    """Write a (path, content) placeholder file and return its path."""
+    file_path, content = placeholder
+    file_path.write_text(content)
+    return file_path
+
+def load_sphinx_build():
+    """
+    Import sphinx-build's entry point for running builds in-process.
+    
+    This script is itself named sphinx.py, so its directory is taken off
+    sys.path while the real package is imported.
+    
+    Returns:
+        callable: sphinx.cmd.build.main, or None if Sphinx can't be imported.
+    """
+    saved_path = sys.path[:]
+    sys.path[:] = [p for p in sys.path if Path(p or '.').resolve() != PROJECT_ROOT.resolve()]
+    try:
+        from sphinx.cmd.build import main as sphinx_main
+        return sphinx_main
+    except ImportError:
+        return None
+    finally:
+        sys.path[:] = saved_path
+
 def setup_docs():
     """Set up initial Sphinx documentation structure."""
-    print("Setting up Sphinx documentation...")
+    logger.info("Setting up Sphinx documentation...")
     
     # Create necessary directories
     create_directory(DOCS_DIR)
@@ -108,12 +202,12 @@ def setup_docs():
     # Create logo placeholder
     logo_path = STATIC_DIR / "logo.png"
     if not logo_path.exists():
-        print(f"Note: Add your logo to {logo_path}")
+        logger.info("Note: Add your logo to %s", logo_path)
         
     # Create favicon placeholder
     favicon_path = STATIC_DIR / "favicon.ico"
     if not favicon_path.exists():
-        print(f"Note: Add your favicon to {favicon_path}")
+        logger.info("Note: Add your favicon to %s", favicon_path)
     
     # Create custom CSS file
     css_path = STATIC_DIR / "custom.css"
@@ -157,7 +251,7 @@ table.docutils {
     background-color: #ffedcc;
 }
 """)
-        print(f"Created: {css_path}")
+        logger.info("Created: %s", css_path)
     
     # Create conf.py
     conf_path = DOCS_DIR / "conf.py"
@@ -244,7 +338,7 @@ language = 'en'
 pygments_style = 'sphinx'
 todo_include_todos = True
 ''')
-        print(f"Created: {conf_path}")
+        logger.info("Created: %s", conf_path)
         
     # Create index.rst
     index_path = DOCS_DIR / "index.rst"
@@ -301,7 +395,7 @@ Indices and tables
 * :ref:`modindex`
 * :ref:`search`
 ''')
-        print(f"Created: {index_path}")
+        logger.info("Created: %s", index_path)
     
     # Create placeholder documentation files
     doc_files = [
@@ -323,93 +417,68 @@ Indices and tables
         "testing.rst"
     ]
     
+    placeholders = []
     for doc_file in doc_files:
         file_path = DOCS_DIR / doc_file
         if not file_path.exists():
             title = doc_file.replace('.rst', '').replace('_', ' ').title()
-            with open(file_path, 'w') as f:
-                f.write(f'''{title}
-{'=' * len(title)}
-
-.. toctree::
-   :maxdepth: 2
-
-Introduction
------------
-This section covers {title.lower()}.
-
-Features
---------
-* Feature 1
-* Feature 2
-* Feature 3
-
-Usage Examples
--------------
-
-Basic Usage
-~~~~~~~~~~
-
-.. code-block:: python
-
-    # Example code
-    from pylib import example
+            placeholders.append((file_path, PLACEHOLDER_TEMPLATE.format_map({
+                'title': title,
+                'underline': '=' * len(title),
+                'title_lower': title.lower(),
+            })))
     
-    # Use the library
-    result = example.function()
-
-Advanced Usage
-~~~~~~~~~~~~~
-
-.. code-block:: python
-
-    # Advanced example
-    from pylib import advanced
+    # Write the placeholders concurrently so their disk writes overlap
+    if placeholders:
+        with ThreadPoolExecutor(max_workers=min(16, len(placeholders))) as executor:
+            for file_path in executor.map(write_placeholder, placeholders):
+                logger.info("Created placeholder: %s", file_path)
     
-    # Configure options
-    config = advanced.Config(option1=True)
-    
-    # Use advanced features
-    result = advanced.process(data, config)
+    logger.info("Sphinx documentation structure set up successfully!")
 
-API Reference
-------------
-See the :ref:`api_reference` for detailed API information.
-''')
-            print(f"Created placeholder: {file_path}")
+def build_docs(clean=False, use_subprocess=False):
+    """
+    Build Sphinx documentation.
     
-    print("Sphinx documentation structure set up successfully!")
-
-def build_docs(clean=False):
-    """Build Sphinx documentation."""
+    Sphinx runs in this process, so repeated builds reuse the already
+    imported Sphinx and extension modules; use_subprocess runs the
+    sphinx-build command instead.
+    """
     if clean:
         clean_docs()
     
-    print("Building documentation...")
-    return run_command(['sphinx-build', '-b', 'html', DOCS_DIR, BUILD_DIR / 'html'])
+    logger.info("Building documentation...")
+    args = ['-b', 'html', '-j', 'auto', str(DOCS_DIR), str(BUILD_DIR / 'html')]
+    
+    sphinx_main = None if use_subprocess else load_sphinx_build()
+    if sphinx_main is None:
+        return run_command(['sphinx-build'] + args)
+        
+    logger.debug("Running: sphinx-build %s", ' '.join(args))
+    return sphinx_main(args) == 0
 
 def clean_docs():
     """Clean documentation build files."""
-    print("Cleaning documentation build files...")
+    logger.info("Cleaning documentation build files...")
     if BUILD_DIR.exists():
         shutil.rmtree(BUILD_DIR)
-        print(f"Removed: {BUILD_DIR}")
+        logger.info("Removed: %s", BUILD_DIR)
     
     autoapi_dir = DOCS_DIR / 'autoapi'
     if autoapi_dir.exists():
         shutil.rmtree(autoapi_dir)
-        print(f"Removed: {autoapi_dir}")
+        logger.info("Removed: %s", autoapi_dir)
 
 def serve_docs():
     """Serve documentation locally."""
     html_dir = BUILD_DIR / 'html'
     if not html_dir.exists():
-        print("Documentation not built yet. Building...")
+        logger.info("Documentation not built yet. Building...")
         if not build_docs():
             return
     
-    print(f"Serving documentation at http://localhost:8000")
-    run_command(['python', '-m', 'http.server', '8000'], cwd=html_dir)
+    logger.info("Serving documentation at http://localhost:8000")
+    run_command(['python', '-m', 'http.server', '8000'], cwd=html_dir, capture=False)
 
 def setup_git_hooks():
     """Set up Git pre-push hook to regenerate documentation."""
@@ -417,7 +486,7 @@ def setup_git_hooks():
     hooks_dir = git_dir / 'hooks'
     
     if not git_dir.exists():
-        print("Git repository not found. Initialize Git first.")
+        logger.error("Git repository not found. Initialize Git first.")
         return False
     
     create_directory(hooks_dir)
@@ -435,20 +504,22 @@ echo "Documentation updated and added to commit."
     
     # Make the hook executable
     os.chmod(pre_push_hook, 0o755)
-    print(f"Git pre-push hook set up at: {pre_push_hook}")
+    logger.info("Git pre-push hook set up at: %s", pre_push_hook)
     return True
 
 def create_readme_index():
     """Create a README_INDEX.md file with links to component READMEs."""
-    print("Creating README index...")
+    logger.info("Creating README index...")
     
     # Find all README files in the project
     readme_files = []
-    for path in PROJECT_ROOT.rglob('README.md'):
-        if path.name == 'README.md' and path != PROJECT_ROOT / 'README.md':
-            relative_path = path.relative_to(PROJECT_ROOT)
-            component_name = path.parent.name
-            readme_files.append((component_name, str(relative_path)))
+    for root, dirnames, filenames in os.walk(PROJECT_ROOT):
+        # Prune in place so os.walk never descends into ignored trees
+        dirnames[:] = [d for d in dirnames if d not in IGNORED_DIRS and not d.startswith('.')]
+        if 'README.md' in filenames and root != str(PROJECT_ROOT):
+            relative_path = os.path.relpath(os.path.join(root, 'README.md'), PROJECT_ROOT)
+            readme_files.append((os.path.basename(root), relative_path))
+    readme_files.sort()
     
     # Create index file
     index_path = PROJECT_ROOT / 'README_INDEX.md'
@@ -472,7 +543,7 @@ This file provides links to documentation for all PyLib components.
         # Write grouped links
         for directory, items in sorted(components.items()):
             f.write(f"### {directory.title()}\n\n")
-            for name, path in sorted(items):
+            for name, path in items:
                 f.write(f"* [{name}]({path})\n")
             f.write("\n")
         
@@ -483,7 +554,7 @@ For complete documentation, please see the [generated documentation](docs/_build
 or run `python sphinx_setup.py serve` to view it in your browser.
 ''')
     
-    print(f"README index created at: {index_path}")
+    logger.info("README index created at: %s", index_path)
     return True
 
 def main():
@@ -498,6 +569,7 @@ def main():
     # Build command
     build_parser = subparsers.add_parser('build', help='Build documentation')
     build_parser.add_argument('--clean', action='store_true', help='Clean before building')
+    build_parser.add_argument('--subprocess', action='store_true', help='Run sphinx-build as a separate process')
     
     # Clean command
     subparsers.add_parser('clean', help='Clean documentation build files')
@@ -513,12 +585,17 @@ def main():
     
     args = parser.parse_args()
     
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    
     if args.command == 'setup':
         setup_docs()
         if args.git_hooks:
             setup_git_hooks()
     elif args.command == 'build':
-        build_docs(clean=args.clean)
+        build_docs(clean=args.clean, use_subprocess=args.subprocess)
     elif args.command == 'clean':
         clean_docs()
     elif args.command == 'serve':
@@ -0,0 +1,19 @@
+import pytest
+
+def pytest_addoption(parser):
+    """Add the --runslow option."""
+    parser.addoption("--runslow", action="store_true", default=False, help="run tests marked as slow")
+
+def pytest_configure(config):
+    """Register the slow marker."""
+    config.addinivalue_line("markers", "slow: test takes over a second; skipped unless --runslow is given")
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests unless --runslow is given."""
+    if config.getoption("--runslow"):
+        return
+        
+    skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
@@ -1,25 +1,44 @@
-test_refined_components.py
-
 import os
+import json
 import pytest
-import tempfile
-import threading
+from concurrent.futures import ThreadPoolExecutor
 import time
 from pathlib import Path
 
+from core.config.config_manager import ConfigManager
+from core.exceptions import LibraryError
+from services.storage.file_client import FileClient
+from services.cache.caching_service import CachingService
+from utils.console.console_service import ConsoleService
+
+PRODUCTS_SCHEMA = """
+    CREATE TABLE products (
+        id INTEGER PRIMARY KEY,
+        name TEXT,
+        price REAL,
+        category TEXT
+    )
+"""
+
+PRODUCT_ROWS = [
+    ["Product 1", "19.99", "Electronics"],
+    ["Product 2", "29.99", "Books"],
+    ["Product 3", "39.99", "Electronics"],
+    ["Product 4", "49.99", "Clothing"]
+]
+
 class TestRefinedComponents:
-    """Integration test for refined components with enhanced features."""
+    """
+    Integration test for refined components with enhanced features.
     
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for testing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield temp_dir
+    Each test builds its own components in its own temporary directory,
+    so the tests can run in any order and on any pytest-xdist worker.
+    """
     
     @pytest.fixture
-    def config_dir(self, temp_dir):
+    def config_dir(self, tmp_path):
         """Create a test configuration directory."""
-        config_dir = Path(temp_dir) / "config"
+        config_dir = tmp_path / "config"
         config_dir.mkdir()
         
         # Create base config
@@ -31,7 +50,9 @@ class TestRefinedComponents:
             "services": {
                 "database": {
                     "type": "sqlite",
-                    "connection": str(Path(temp_dir) / "test.db"),
+                    # File-backed, so threads borrow pooled connections;
+                    # :memory: would share a single connection
+                    "connection": str(tmp_path / "components.db"),
                     "pool": {
                         "min_connections": 2,
                         "max_connections": 5
@@ -40,7 +61,7 @@ class TestRefinedComponents:
                 "cache": {
                     "type": "file",
                     "file": {
-                        "directory": str(Path(temp_dir) / "cache")
+                        "directory": str(tmp_path / "cache")
                     },
                     "compression": {
                         "enabled": True,
@@ -53,44 +74,61 @@ class TestRefinedComponents:
             }
         }
         
-        # Write config file
-        with open(config_dir / "base.json", "w") as f:
-            import json
-            json.dump(base_config, f)
-        
-        # Create test environment config
-        with open(config_dir / "test.json", "w") as f:
-            json.dump({
-                "app": {
-                    "name": "Test App - Test Environment"
-                }
-            }, f)
+        # Write config files
+        (config_dir / "base.json").write_text(json.dumps(base_config))
+        (config_dir / "test.json").write_text(json.dumps({
+            "app": {
+                "name": "Test App - Test Environment"
+            }
+        }))
         
         # Create .env file
-        with open(config_dir / ".env.test", "w") as f:
-            f.write("DB_CACHE_ENABLED=true\n")
-            f.write("MAX_THREADS=4\n")
+        (config_dir / ".env.test").write_text("DB_CACHE_ENABLED=true\nMAX_THREADS=4\n")
         
         return config_dir
     
-    def test_all_components(self, temp_dir, config_dir):
-        """Test all enhanced components working together."""
-        from core.config import ConfigManager
-        from core.exceptions import LibraryError
-        from services.storage import FileClient
-        from services.database import DatabaseClient
-        from services.cache import CachingService
-        from utils.console import ConsoleService
-        
-        # Initialize components with enhanced features
-        
-        # 1. Configuration with encryption
-        config = ConfigManager(
-            config_dir=config_dir, 
+    @pytest.fixture
+    def config(self, config_dir):
+        """Load the test configuration with encryption enabled."""
+        return ConfigManager(
+            config_dir=config_dir,
             environment="test",
             encryption_key="test_encryption_key"
         )
-        
+    
+    @pytest.fixture
+    def db_client(self, config):
+        """Create a database client on an empty database."""
+        # Only the database tests need the client, so skip just those when
+        # it cannot be imported
+        database_client = pytest.importorskip("services.database.database_client", exc_type=ImportError)
+        
+        db_client = database_client.DatabaseClient(config)
+        yield db_client
+        db_client.close()
+    
+    @pytest.fixture
+    def products_db(self, db_client):
+        """Create a database client with an empty products table."""
+        db_client.execute(PRODUCTS_SCHEMA)
+        return db_client
+    
+    @pytest.fixture
+    def cache(self, config):
+        """Create a file cache with compression."""
+        cache = CachingService(config)
+        yield cache
+        cache.clear()
+    
+    @pytest.fixture
+    def executor(self):
+        """Create a thread pool for concurrent operations."""
+        executor = ThreadPoolExecutor(max_workers=4)
+        yield executor
+        executor.shutdown()
+    
+    def test_config(self, config):
+        """Test configuration loading with encryption."""
         # Verify config loading
         assert config.get("app.name") == "Test App - Test Environment"
         assert config.get("db.cache.enabled") is True  # From .env.test
@@ -107,94 +145,72 @@ class TestRefinedComponents:
         # But should decrypt to the same value
         decrypted = config.get_encrypted("credentials.encrypted_api_key")
         assert decrypted == api_key
-        
-        # 2. Database with connection pooling
-        db_client = DatabaseClient(config)
-        
-        # Create schema
-        db_client.execute("""
-            CREATE TABLE products (
-                id INTEGER PRIMARY KEY,
-                name TEXT,
-                price REAL,
-                category TEXT
-            )
-        """)
-        
-        # 3. File operations
+    
+    def test_db_schema(self, db_client):
+        """Test creating the schema through the pooled database client."""
+        db_client.execute(PRODUCTS_SCHEMA)
+        assert db_client.query("SELECT * FROM products") == []
+    
+    def test_file_io(self, config, tmp_path):
+        """Test writing the product data as CSV and reading it back."""
         file_client = FileClient(config)
         
         # Create some test data
-        products_csv = Path(temp_dir) / "products.csv"
-        file_client.write_csv(
-            products_csv,
-            [
-                ["Product 1", "19.99", "Electronics"],
-                ["Product 2", "29.99", "Books"],
-                ["Product 3", "39.99", "Electronics"],
-                ["Product 4", "49.99", "Clothing"]
-            ],
-            headers=["name", "price", "category"]
-        )
+        products_csv = tmp_path / "products.csv"
+        file_client.write_csv(products_csv, PRODUCT_ROWS, headers=["name", "price", "category"])
         
-        # Read the CSV
+        # Read the CSV back once; the import uses the rows in memory
         csv_data = file_client.read_csv(products_csv)
-        assert len(csv_data) == 5  # 4 rows + header
-        
-        # 4. Multithreaded database operations with connection pooling
+        assert csv_data[0] == ["name", "price", "category"]
+        assert csv_data[1:] == PRODUCT_ROWS
+    
+    def test_threaded_import(self, products_db, executor):
+        """Test multithreaded database operations with connection pooling."""
         def import_products():
-            # Skip header row
-            for row in csv_data[1:]:
-                try:
-                    with db_client.transaction():
-                        db_client.execute(
-                            "INSERT INTO products (name, price, category) VALUES (?, ?, ?)",
-                            row
-                        )
-                except Exception as e:
-                    print(f"Error importing: {e}")
-        
-        # Create threads to test connection pooling
-        threads = []
-        for _ in range(2):
-            thread = threading.Thread(target=import_products)
-            threads.append(thread)
-            thread.start()
-            
-        # Wait for all threads to finish
-        for thread in threads:
-            thread.join()
-            
-        # Verify data was imported
-        products = db_client.query("SELECT * FROM products")
-        assert len(products) == 8  # 4 products * 2 threads
+            # Insert all rows as one batch
+            with products_db.transaction():
+                products_db.executemany(
+                    "INSERT INTO products (name, price, category) VALUES (?, ?, ?)",
+                    PRODUCT_ROWS
+                )
         
-        # 5. Caching with compression
-        cache = CachingService(config)
+        # Run two imports at once to test connection pooling
+        list(executor.map(lambda _: import_products(), range(2)))
         
-        # Function that should be cached
+        # Verify data was imported
+        products = products_db.query("SELECT * FROM products")
+        assert len(products) == 8  # 4 products * 2 threads
+    
+    def test_cache(self, products_db, cache):
+        """Test caching query results with compression."""
+        products_db.executemany(
+            "INSERT INTO products (name, price, category) VALUES (?, ?, ?)",
+            PRODUCT_ROWS
+        )
         call_count = 0
         
+        # Function that should be cached
         def expensive_query():
             nonlocal call_count
             call_count += 1
-            return db_client.query("SELECT * FROM products WHERE category = 'Electronics'")
+            return products_db.query("SELECT * FROM products WHERE category = 'Electronics'")
         
         # First call should hit the database
         electronics = cache.get_or_set("electronics_products", expensive_query, ttl=60)
-        assert len(electronics) == 4  # 2 products * 2 threads
+        assert len(electronics) == 2
         assert call_count == 1
         
         # Second call should use cache
         electronics = cache.get_or_set("electronics_products", expensive_query, ttl=60)
-        assert len(electronics) == 4
+        assert len(electronics) == 2
         assert call_count == 1  # Count shouldn't increase
         
         # Test cache stats
-        stats = cache._backend.get_stats()
+        stats = cache.get_stats()
         assert stats["hits"] >= 1
-        
-        # 6. Exception handling
+    
+    def test_exception(self, db_client):
+        """Test database errors surface as library errors."""
         try:
             # Try an operation that should fail
             db_client.execute("SELECT * FROM nonexistent_table")
@@ -203,22 +219,17 @@ class TestRefinedComponents:
             # Should be the specific DatabaseError
             assert e.error_code.startswith("DB-")
             assert "nonexistent_table" in str(e)
+    
+    def test_batch(self, products_db):
+        """Test batched operations."""
+        batch_data = [[f"Batch Product {i}", 10.99, "Batch"] for i in range(100)]
         
-        # 7. Test batched operations
-        batch_data = []
-        for i in range(100):
-            batch_data.append([f"Batch Product {i}", 10.99, "Batch"])
-            
         # Execute as batch
-        db_client.executemany(
+        products_db.executemany(
             "INSERT INTO products (name, price, category) VALUES (?, ?, ?)",
             batch_data
         )
         
         # Verify batch insert
-        batch_count = db_client.query_one("SELECT COUNT(*) as count FROM products WHERE category = 'Batch'")
+        batch_count = products_db.query_one("SELECT COUNT(*) as count FROM products WHERE category = 'Batch'")
         assert batch_count["count"] == 100
-        
-        # Clean up
-        db_client.close()
-        cache.clear()
\ No newline at end of file
@@ -3,6 +3,15 @@ import pytest
 import tempfile
 from pathlib import Path
 
+from core.config.config_manager import ConfigManager
+from services.storage.file_client import FileClient
+from services.cache.caching_service import CachingService
+from utils.console.console_service import ConsoleService
+
+database_client = pytest.importorskip("services.database.database_client", exc_type=ImportError)
+
+DatabaseClient = database_client.DatabaseClient
+
 class TestPhase2Integration:
     """Integration test for Phase 2 components."""
     
@@ -14,18 +23,14 @@ class TestPhase2Integration:
     
     def test_file_database_cache_integration(self, temp_dir):
         """Test integration between FileClient, DatabaseClient, and CachingService."""
-        from core.config.config_manager import ConfigManager
-        from services.storage.file_client import FileClient
-        from services.database.database_client import DatabaseClient
-        from services.cache.caching_service import CachingService
-        from utils.console.console_service import ConsoleService
-        
         # Set up configuration
         config = ConfigManager()
-        config.set("services.database.type", "sqlite")
-        config.set("services.database.connection", ":memory:")
-        config.set("services.cache.type", "file")
-        config.set("services.cache.file.directory", os.path.join(temp_dir, "cache"))
+        config.update_many({
+            "services": {
+                "database": {"type": "sqlite", "connection": ":memory:"},
+                "cache": {"type": "file", "file": {"directory": os.path.join(temp_dir, "cache")}}
+            }
+        })
         
         # Initialize components
         file_client = FileClient(config)
@@ -54,11 +59,10 @@ class TestPhase2Integration:
             )
         """)
         
-        for item in test_data:
-            db_client.execute(
-                "INSERT INTO items (id, name, value) VALUES (?, ?, ?)",
-                [item["id"], item["name"], item["value"]]
-            )
+        db_client.executemany(
+            "INSERT INTO items (id, name, value) VALUES (?, ?, ?)",
+            [(item["id"], item["name"], item["value"]) for item in test_data]
+        )
         
         # 3. Query the database through the cache
         def fetch_items():
@@ -81,11 +85,9 @@ class TestPhase2Integration:
         # 4. Export results to CSV
         csv_file = os.path.join(temp_dir, "items.csv")
         
-        # Convert dict rows to list rows
+        # Write the dict rows directly
         headers = ["id", "name", "value"]
-        rows = [[str(item[h]) for h in headers] for item in cached_items]
-        
-        file_client.write_csv(csv_file, rows, headers=headers)
+        file_client.write_csv_dicts(csv_file, cached_items, headers=headers)
         
         # 5. Read CSV back
         csv_data = file_client.read_csv(csv_file)
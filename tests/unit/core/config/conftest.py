@@ -0,0 +1,62 @@
+import json
+import pytest
+
+# Config file contents, serialized once at import
+CONFIG_FILES = {
+    # Base config
+    "base.json": json.dumps({
+        "app": {
+            "name": "BaseApp",
+            "version": "1.0.0"
+        },
+        "database": {
+            "host": "localhost",
+            "port": 5432,
+            "credentials": {
+                "encrypted": False
+            }
+        }
+    }).encode(),
+    
+    # Test environment config
+    "test.json": json.dumps({
+        "app": {
+            "name": "TestApp"
+        },
+        "database": {
+            "name": "test_db"
+        }
+    }).encode(),
+    
+    # Prod environment config
+    "prod.json": json.dumps({
+        "app": {
+            "name": "ProdApp"
+        },
+        "database": {
+            "name": "prod_db"
+        }
+    }).encode(),
+    
+    # Local config
+    "local.json": json.dumps({
+        "database": {
+            "user": "dev_user",
+            "password": "dev_password"
+        }
+    }).encode(),
+    
+    # .env files
+    ".env.test": b"ENV_VAR1=test_value\nENV_VAR2=123\nFEATURE_FLAG=true\n",
+    ".env.local": b"LOCAL_VAR=local_value\nENV_VAR1=local_override\n",
+}
+
+@pytest.fixture(scope="session")
+def config_dir(tmp_path_factory):
+    """Create a temporary config directory with test files, shared by the session."""
+    config_path = tmp_path_factory.mktemp("config")
+    
+    for name, content in CONFIG_FILES.items():
+        (config_path / name).write_bytes(content)
+    
+    return config_path
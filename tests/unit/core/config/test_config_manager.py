@@ -4,89 +4,14 @@ import pytest
 import tempfile
 from pathlib import Path
 
+from core.config.config_manager import ConfigManager
 from core.exceptions import ConfigurationError
 
 class TestConfigManager:
     """Test suite for ConfigManager."""
     
-    @pytest.fixture
-    def config_dir(self, tmp_path):
-        """Create a temporary config directory with test files."""
-        # Create base config
-        base_config = {
-            "app": {
-                "name": "BaseApp",
-                "version": "1.0.0"
-            },
-            "database": {
-                "host": "localhost",
-                "port": 5432,
-                "credentials": {
-                    "encrypted": False
-                }
-            }
-        }
-        
-        # Create test environment config
-        test_config = {
-            "app": {
-                "name": "TestApp"
-            },
-            "database": {
-                "name": "test_db"
-            }
-        }
-        
-        # Create prod environment config
-        prod_config = {
-            "app": {
-                "name": "ProdApp"
-            },
-            "database": {
-                "name": "prod_db"
-            }
-        }
-        
-        # Create local config
-        local_config = {
-            "database": {
-                "user": "dev_user",
-                "password": "dev_password"
-            }
-        }
-        
-        # Create directory and files
-        config_path = tmp_path / "config"
-        config_path.mkdir()
-        
-        with open(config_path / "base.json", "w") as f:
-            json.dump(base_config, f)
-            
-        with open(config_path / "test.json", "w") as f:
-            json.dump(test_config, f)
-            
-        with open(config_path / "prod.json", "w") as f:
-            json.dump(prod_config, f)
-            
-        with open(config_path / "local.json", "w") as f:
-            json.dump(local_config, f)
-            
-        # Create .env files
-        with open(config_path / ".env.test", "w") as f:
-            f.write("ENV_VAR1=test_value\n")
-            f.write("ENV_VAR2=123\n")
-            f.write("FEATURE_FLAG=true\n")
-            
-        with open(config_path / ".env.local", "w") as f:
-            f.write("LOCAL_VAR=local_value\n")
-            f.write("ENV_VAR1=local_override\n")
-            
-        return config_path
-    
     def test_hierarchical_config_loading(self, config_dir, monkeypatch):
         """Test loading of configuration in hierarchical order."""
-        from core.config import ConfigManager
-        
         # Set environment to test
         monkeypatch.setenv("PYTHON_ENV", "test")
         
@@ -110,24 +35,19 @@ class TestConfigManager:
         assert config.get("database.name") == "test_db"
         assert config.get("database.user") == "dev_user"
     
-    def test_environment_specific_loading(self, config_dir):
+    @pytest.mark.parametrize("environment,expected_app_name,expected_db_name", [
+        ("test", "TestApp", "test_db"),
+        ("prod", "ProdApp", "prod_db"),
+    ])
+    def test_environment_specific_loading(self, config_dir, environment, 
+                                          expected_app_name, expected_db_name):
         """Test loading configuration specific to an environment."""
-        from core.config import ConfigManager
-        
-        # Test environment
-        config_test = ConfigManager(config_dir=config_dir, environment="test")
-        assert config_test.get("app.name") == "TestApp"
-        assert config_test.get("database.name") == "test_db"
-        
-        # Prod environment
-        config_prod = ConfigManager(config_dir=config_dir, environment="prod")
-        assert config_prod.get("app.name") == "ProdApp"
-        assert config_prod.get("database.name") == "prod_db"
+        config = ConfigManager(config_dir=config_dir, environment=environment)
+        assert config.get("app.name") == expected_app_name
+        assert config.get("database.name") == expected_db_name
     
     def test_environment_detection(self, config_dir, monkeypatch):
         """Test environment detection from PYTHON_ENV variable."""
-        from core.config import ConfigManager
-        
         # Set environment variable
         monkeypatch.setenv("PYTHON_ENV", "test")
         
@@ -140,8 +60,6 @@ class TestConfigManager:
     
     def test_dotenv_loading(self, config_dir):
         """Test loading configuration from .env files."""
-        from core.config import ConfigManager
-        
         # Load with test environment
         config = ConfigManager(config_dir=config_dir, environment="test")
         
@@ -156,10 +74,27 @@ class TestConfigManager:
         assert config.get("env.var1") == "test_value"
         assert config.get("env.var2") == 123
     
+    def test_update_many(self):
+        """Test merging nested values into the configuration."""
+        config = ConfigManager()
+        config.set("services.database.type", "sqlite")
+        config.set("services.database.pool.max_connections", 5)
+        
+        config.update_many({
+            "services": {
+                "database": {"connection": ":memory:", "pool": {"max_connections": 10}},
+                "cache": {"type": "memory"}
+            }
+        })
+        
+        # Existing sections are merged rather than replaced
+        assert config.get("services.database.type") == "sqlite"
+        assert config.get("services.database.connection") == ":memory:"
+        assert config.get("services.database.pool.max_connections") == 10
+        assert config.get("services.cache.type") == "memory"
+    
     def test_invalid_json_handling(self, tmp_path):
         """Test handling of invalid JSON files."""
-        from core.config import ConfigManager
-        
         # Create invalid JSON file
         invalid_path = tmp_path / "invalid.json"
         with open(invalid_path, "w") as f:
@@ -175,8 +110,6 @@ class TestConfigManager:
     
     def test_missing_file_handling(self, tmp_path):
         """Test handling of missing files."""
-        from core.config import ConfigManager
-        
         missing_path = tmp_path / "nonexistent.json"
         
         # Loading a missing file should return False, not raise an error
@@ -187,8 +120,6 @@ class TestConfigManager:
     
     def test_type_conversion_from_env(self, monkeypatch):
         """Test automatic type conversion from environment variables."""
-        from core.config import ConfigManager
-        
         # Set various typed environment variables
         monkeypatch.setenv("INT_VAL", "8080")
         monkeypatch.setenv("BOOL_TRUE", "true")
@@ -220,8 +151,6 @@ class TestConfigManager:
     
     def test_encryption_decryption(self):
         """Test encryption and decryption of sensitive values."""
-        from core.config import ConfigManager
-        
         # Initialize with encryption key
         config = ConfigManager(encryption_key="test_encryption_key")
         
@@ -241,6 +170,9 @@ class TestConfigManager:
         retrieved = config.get_encrypted("database.password")
         assert retrieved == password
         
+        # Repeated reads return the same value
+        assert config.get_encrypted("database.password") == password
+        
         # Verify stored value is encrypted
         raw_value = config.get("database.password")
         assert raw_value != password
@@ -0,0 +1,29 @@
+import logging
+import pytest
+
+from core.logging.log_manager import LogManager
+
+@pytest.fixture(scope="session")
+def log_factory(tmp_path_factory):
+    """
+    Create file-backed loggers in one session log directory.
+    
+    Each call returns (logger, log_file) for a logger name; the loggers'
+    handlers are closed once at the end of the session.
+    """
+    log_dir = tmp_path_factory.mktemp("logs")
+    created = {}
+    
+    def make(name, level=logging.INFO):
+        log_file = log_dir / f"{name}.log"
+        if name not in created:
+            created[name] = LogManager.get_logger(name, log_file, level=level)
+        return created[name], log_file
+    
+    yield make
+    
+    for name, logger in created.items():
+        for handler in logger.handlers[:]:
+            handler.close()
+            logger.removeHandler(handler)
+        LogManager._loggers.pop(name, None)
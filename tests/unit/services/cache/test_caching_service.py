@@ -1,83 +1,120 @@
-import os
-import time
 import pytest
-import tempfile
 from pathlib import Path
-import random
-import string
+from types import SimpleNamespace
+import os
 
+from core.config.config_manager import ConfigManager
 from core.exceptions import CacheError
+from services.cache import caching_service
+from services.cache.caching_service import CachingService
+
+class CachedObject:
+    """Custom class stored in the cache; module level so pickle can find it."""
+    
+    __slots__ = ("name",)
+    
+    def __init__(self, name):
+        self.name = name
+        
+    def __eq__(self, other):
+        return isinstance(other, CachedObject) and self.name == other.name
 
 class TestCachingService:
     """Test suite for CachingService."""
     
+    @pytest.fixture(scope="module")
+    def memory_cache_config(self):
+        """Create the memory backend configuration once per module."""
+        config = ConfigManager()
+        config.update_many({
+            "services": {
+                "cache": {
+                    "type": "memory",
+                    "compression": {
+                        "enabled": True,
+                        "threshold": 100  # Low threshold for testing
+                    },
+                    "memory": {
+                        "max_size": 10  # Small size to test eviction
+                    }
+                }
+            }
+        })
+        return config
+    
     @pytest.fixture
-    def memory_cache(self):
+    def memory_cache(self, memory_cache_config):
         """Create a CachingService with memory backend."""
-        from services.cache import CachingService
-        from core.config import ConfigManager
-        
-        config = ConfigManager()
-        config.set("services.cache.type", "memory")
-        config.set("services.cache.compression.enabled", True)
-        config.set("services.cache.compression.threshold", 100)  # Low threshold for testing
-        config.set("services.cache.memory.max_size", 10)  # Small size to test eviction
-        
-        return CachingService(config)
+        # A fresh service per test keeps the hit, miss and eviction counts exact
+        return CachingService(memory_cache_config)
     
     @pytest.fixture
-    def file_cache(self):
+    def advance_clock(self, monkeypatch):
+        """Replace the cache's clock with one that only moves when advanced."""
+        clock = SimpleNamespace(now=1000.0)
+        monkeypatch.setattr(caching_service, "time", SimpleNamespace(time=lambda: clock.now))
+        
+        def advance(seconds):
+            clock.now += seconds
+        return advance
+    
+    @pytest.fixture
+    def file_cache(self, tmp_path):
         """Create a CachingService with file backend."""
-        from services.cache import CachingService
-        from core.config import ConfigManager
-        
-        temp_dir = tempfile.mkdtemp()
-        
         config = ConfigManager()
-        config.set("services.cache.type", "file")
-        config.set("services.cache.file.directory", temp_dir)
-        config.set("services.cache.file.max_size_mb", 1)  # 1MB max size
-        config.set("services.cache.compression.enabled", True)
-        
-        cache = CachingService(config)
-        
-        yield cache
+        config.update_many({
+            "services": {
+                "cache": {
+                    "type": "file",
+                    "file": {
+                        "directory": str(tmp_path),
+                        "max_size_mb": 0.1  # ~100KB max size
+                    },
+                    "compression": {
+                        "enabled": True
+                    }
+                }
+            }
+        })
         
-        # Cleanup
-        cache.clear()
-        os.rmdir(temp_dir)
+        return CachingService(config)
+    
+    @pytest.fixture(params=["memory", "file"])
+    def cache(self, request):
+        """Create a CachingService for each backend in turn."""
+        return request.getfixturevalue(f"{request.param}_cache")
     
-    def test_set_get_basic(self, memory_cache):
+    def test_set_get_basic(self, cache):
         """Test basic set and get operations."""
         # Set a value
-        memory_cache.set("test_key", "test_value")
+        cache.set("test_key", "test_value")
         
         # Get the value
-        value = memory_cache.get("test_key")
+        value = cache.get("test_key")
         assert value == "test_value"
         
         # Get a non-existent key
-        value = memory_cache.get("non_existent_key")
+        value = cache.get("non_existent_key")
         assert value is None
         
         # Get with default value
-        value = memory_cache.get("non_existent_key", "default_value")
+        value = cache.get("non_existent_key", "default_value")
         assert value == "default_value"
     
-    def test_set_get_with_ttl(self, memory_cache):
+    def test_set_get_with_ttl(self, cache, advance_clock):
         """Test TTL (time-to-live) functionality."""
         # Set with short TTL
-        memory_cache.set("ttl_key", "ttl_value", ttl=1)
+        cache.set("ttl_key", "ttl_value", ttl=1)
         
         # Get immediately
-        value = memory_cache.get("ttl_key")
+        value = cache.get("ttl_key")
         assert value == "ttl_value"
         
-        # Wait for TTL to expire
-        time.sleep(1.1)
+        # Move past the TTL
+        advance_clock(1.1)
         
         # Get after TTL expiration
-        value = memory_cache.get("ttl_key")
+        value = cache.get("ttl_key")
         assert value is None
     
     def test_set_get_complex_data(self, memory_cache):
@@ -93,77 +130,70 @@ class TestCachingService:
         assert memory_cache.get("list_key") == list_data
         
         # Custom class
-        class TestClass:
-            def __init__(self, name):
-                self.name = name
-                
-            def __eq__(self, other):
-                return isinstance(other, TestClass) and self.name == other.name
-                
-        obj = TestClass("test_object")
+        obj = CachedObject("test_object")
         memory_cache.set("obj_key", obj)
         
         retrieved = memory_cache.get("obj_key")
         assert retrieved == obj
         assert retrieved.name == "test_object"
     
-    def test_delete(self, memory_cache):
+    def test_delete(self, cache):
         """Test delete operation."""
         # Set values
-        memory_cache.set("key1", "value1")
-        memory_cache.set("key2", "value2")
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
         
         # Verify values exist
-        assert memory_cache.get("key1") == "value1"
-        assert memory_cache.get("key2") == "value2"
+        assert cache.get("key1") == "value1"
+        assert cache.get("key2") == "value2"
         
         # Delete one key
-        result = memory_cache.delete("key1")
+        result = cache.delete("key1")
         
         # Verify only that key is gone
         assert result is True
-        assert memory_cache.get("key1") is None
-        assert memory_cache.get("key2") == "value2"
+        assert cache.get("key1") is None
+        assert cache.get("key2") == "value2"
         
         # Delete non-existent key
-        result = memory_cache.delete("nonexistent")
+        result = cache.delete("nonexistent")
         assert result is False
     
-    def test_clear(self, memory_cache):
+    def test_clear(self, cache):
         """Test clear operation."""
         # Set values
-        memory_cache.set("key1", "value1")
-        memory_cache.set("key2", "value2")
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
         
         # Verify values exist
-        assert memory_cache.get("key1") == "value1"
-        assert memory_cache.get("key2") == "value2"
+        assert cache.get("key1") == "value1"
+        assert cache.get("key2") == "value2"
         
         # Clear cache
-        memory_cache.clear()
+        cache.clear()
         
         # Verify all keys are gone
-        assert memory_cache.get("key1") is None
-        assert memory_cache.get("key2") is None
+        assert cache.get("key1") is None
+        assert cache.get("key2") is None
     
-    def test_has_key(self, memory_cache):
+    def test_has_key(self, cache, advance_clock):
         """Test has_key operation."""
         # Set a value
-        memory_cache.set("test_key", "test_value")
+        cache.set("test_key", "test_value")
         
         # Check existing key
-        assert memory_cache.has_key("test_key") is True
+        assert cache.has_key("test_key") is True
         
         # Check non-existent key
-        assert memory_cache.has_key("non_existent_key") is False
+        assert cache.has_key("non_existent_key") is False
         
         # Set with TTL and check after expiration
-        memory_cache.set("ttl_key", "ttl_value", ttl=1)
-        assert memory_cache.has_key("ttl_key") is True
+        cache.set("ttl_key", "ttl_value", ttl=1)
+        assert cache.has_key("ttl_key") is True
         
-        time.sleep(1.1)
+        advance_clock(1.1)
         
-        assert memory_cache.has_key("ttl_key") is False
+        assert cache.has_key("ttl_key") is False
     
     def test_file_backend(self, file_cache):
         """Test file-based cache backend."""
@@ -184,7 +214,7 @@ class TestCachingService:
         file_cache.clear()
         assert file_cache.get("file_key2") is None
     
-    def test_get_or_set(self, memory_cache):
+    def test_get_or_set(self, cache, advance_clock):
         """Test get_or_set operation."""
         call_count = 0
         
@@ -195,31 +225,31 @@ class TestCachingService:
             return f"computed_value_{call_count}"
         
         # First call should compute the value
-        value = memory_cache.get_or_set("compute_key", compute_value)
+        value = cache.get_or_set("compute_key", compute_value)
         assert value == "computed_value_1"
         assert call_count == 1
         
         # Second call should return the cached value
-        value = memory_cache.get_or_set("compute_key", compute_value)
+        value = cache.get_or_set("compute_key", compute_value)
         assert value == "computed_value_1"  # Still the original value
         assert call_count == 1  # Function not called again
         
         # After expiration, should recompute
-        memory_cache.set("compute_key", "old_value", ttl=1)
-        time.sleep(1.1)
+        cache.set("compute_key", "old_value", ttl=1)
+        advance_clock(1.1)
         
-        value = memory_cache.get_or_set("compute_key", compute_value)
+        value = cache.get_or_set("compute_key", compute_value)
         assert value == "computed_value_2"  # New computed value
         assert call_count == 2  # Function called again
     
-    def test_error_handling(self, memory_cache):
+    def test_error_handling(self, cache):
         """Test error handling in cache operations."""
         # Test error in compute function
         def failing_compute():
             raise ValueError("Compute function failed")
             
         with pytest.raises(CacheError) as exc_info:
-            memory_cache.get_or_set("error_key", failing_compute)
+            cache.get_or_set("error_key", failing_compute)
             
         assert "Failed to compute cache value" in str(exc_info.value)
         assert exc_info.value.cache_key == "error_key"
@@ -244,15 +274,10 @@ class TestCachingService:
     
     def test_file_eviction(self, file_cache):
         """Test size-based eviction in file cache."""
-        # Generate large data to trigger eviction
-        def generate_data(size_kb):
-            # Generate random string data of specified size
-            return ''.join(random.choice(string.ascii_letters) for _ in range(size_kb * 1024))
-            
         # Add files until we trigger eviction
         for i in range(5):
-            # Each file is about 200KB
-            file_cache.set(f"large_key{i}", generate_data(200))
+            # Each file is about 30KB of random bytes, which do not compress
+            file_cache.set(f"large_key{i}", os.urandom(30 * 1024))
             
         # Get stats
         stats = file_cache._backend.get_stats()
@@ -0,0 +1,27 @@
+import os
+import pytest
+
+from core.config.config_manager import ConfigManager
+
+@pytest.fixture
+def postgres_config():
+    """Point the PostgreSQL clients at the server in POSTGRES_TEST_*, or skip without one."""
+    host = os.environ.get("POSTGRES_TEST_HOST")
+    if not host:
+        pytest.skip("POSTGRES_TEST_HOST is not set")
+        
+    config = ConfigManager()
+    config.update_many({
+        "services": {
+            "database": {
+                "postgresql": {
+                    "host": host,
+                    "port": int(os.environ.get("POSTGRES_TEST_PORT", 5432)),
+                    "database": os.environ.get("POSTGRES_TEST_DATABASE", "postgres"),
+                    "user": os.environ.get("POSTGRES_TEST_USER", "postgres"),
+                    "password": os.environ.get("POSTGRES_TEST_PASSWORD")
+                }
+            }
+        }
+    })
+    return config
@@ -0,0 +1,96 @@
+import uuid
+import asyncio
+import pytest
+
+pytest.importorskip("asyncpg")
+async_postgresql_client = pytest.importorskip("services.database.async_postgresql_client", exc_type=ImportError)
+
+from core.exceptions import DatabaseError
+
+AsyncPostgreSQLClient = async_postgresql_client.AsyncPostgreSQLClient
+
+class TestAsyncPostgreSQLClient:
+    """Test suite for AsyncPostgreSQLClient, run against POSTGRES_TEST_HOST."""
+    
+    @pytest.fixture
+    def run(self, postgres_config):
+        """Run a coroutine against a client and a fresh table, cleaning both up."""
+        def run(test):
+            async def main():
+                client = AsyncPostgreSQLClient(postgres_config)
+                table = f"async_test_{uuid.uuid4().hex}"
+                await client.execute(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY, name TEXT)")
+                
+                try:
+                    await test(client, table)
+                finally:
+                    await client.execute(f"DROP TABLE {table}")
+                    await client.close()
+                    
+            asyncio.run(main())
+            
+        return run
+    
+    def test_execute_and_query(self, run):
+        """Test basic execute and query round trips."""
+        async def test(client, table):
+            assert await client.execute(f"INSERT INTO {table} (id, name) VALUES ($1, $2)", [1, "Alice"]) == 1
+            assert await client.executemany(
+                f"INSERT INTO {table} (id, name) VALUES ($1, $2)",
+                [(2, "Bob"), (3, "Carol")]
+            ) == 2
+            
+            rows = await client.query(f"SELECT name FROM {table} ORDER BY id")
+            assert [row["name"] for row in rows] == ["Alice", "Bob", "Carol"]
+            assert (await client.query_one(f"SELECT name FROM {table} WHERE id = $1", [2]))["name"] == "Bob"
+            
+        run(test)
+    
+    def test_transaction_with_concurrent_tasks(self, run):
+        """Test that tasks gathered inside a transaction share its connection safely."""
+        async def test(client, table):
+            async with client.transaction():
+                await asyncio.gather(*(
+                    client.execute(f"INSERT INTO {table} (id, name) VALUES ($1, $2)", [i, f"Name {i}"])
+                    for i in range(10)
+                ))
+                
+            assert (await client.query_one(f"SELECT COUNT(*) AS count FROM {table}"))["count"] == 10
+            
+        run(test)
+    
+    def test_transaction_rollback(self, run):
+        """Test that failures roll back the transaction, and nested blocks only their savepoint."""
+        async def test(client, table):
+            with pytest.raises(ValueError):
+                async with client.transaction():
+                    await client.execute(f"INSERT INTO {table} (id, name) VALUES (1, 'Rolled back')")
+                    raise ValueError("Test exception")
+                    
+            async with client.transaction():
+                await client.execute(f"INSERT INTO {table} (id, name) VALUES (2, 'Kept')")
+                with pytest.raises(ValueError):
+                    async with client.transaction():
+                        await client.execute(f"INSERT INTO {table} (id, name) VALUES (3, 'Savepoint')")
+                        raise ValueError("Test exception")
+                        
+            rows = await client.query(f"SELECT name FROM {table} ORDER BY id")
+            assert [row["name"] for row in rows] == ["Kept"]
+            
+        run(test)
+    
+    def test_errors_raised_as_database_error(self, run):
+        """Test that failed statements and transactions raise DatabaseError."""
+        async def test(client, table):
+            with pytest.raises(DatabaseError):
+                await client.query("SELECT * FROM missing_table")
+                
+            # A deferred constraint is only checked, and fails, at COMMIT
+            await client.execute(
+                f"ALTER TABLE {table} ADD CONSTRAINT {table}_name UNIQUE (name) DEFERRABLE INITIALLY DEFERRED"
+            )
+            with pytest.raises(DatabaseError):
+                async with client.transaction():
+                    await client.execute(f"INSERT INTO {table} (id, name) VALUES (1, 'Same'), (2, 'Same')")
+                    
+        run(test)
@@ -1,34 +1,95 @@
 import pytest
+import asyncio
 import sqlite3
 import threading
 import time
 from unittest.mock import MagicMock, patch
 
+from core.config.config_manager import ConfigManager
 from core.exceptions import DatabaseError, ConnectionError
 
+database_client = pytest.importorskip("services.database.database_client", exc_type=ImportError)
+
+DatabaseClient = database_client.DatabaseClient
+ConnectionPool = database_client.ConnectionPool
+_limit_one = database_client._limit_one
+
 class TestDatabaseClient:
     """Test suite for DatabaseClient."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def config(self):
         """Create a mock configuration for testing."""
-        from core.config import ConfigManager
-        
         config = ConfigManager()
-        config.set("services.database.type", "sqlite")
-        config.set("services.database.connection", ":memory:")
-        config.set("services.database.pool.min_connections", 2)
-        config.set("services.database.pool.max_connections", 5)
+        config.update_many({
+            "services": {
+                "database": {
+                    "type": "sqlite",
+                    "connection": ":memory:",
+                    "pool": {
+                        "min_connections": 2,
+                        "max_connections": 5
+                    }
+                }
+            }
+        })
         return config
     
+    @pytest.fixture(scope="module")
+    def shared_client(self, config):
+        """Create one in-memory DatabaseClient shared by the module's tests."""
+        client = DatabaseClient(config)
+        yield client
+        client.close()
+    
     @pytest.fixture
-    def db_client(self, config):
-        """Create a DatabaseClient instance for testing."""
-        from services.database import DatabaseClient
+    def db_client(self, shared_client):
+        """Hand each test the shared client and drop the tables it created."""
+        yield shared_client
+        
+        tables = shared_client.query(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+        )
+        for table in tables:
+            shared_client.execute(f'DROP TABLE "{table["name"]}"')
+    
+    @pytest.fixture
+    def own_client(self, config):
+        """Create a dedicated DatabaseClient for tests that close it."""
         client = DatabaseClient(config)
         yield client
         client.close()
     
+    @pytest.fixture
+    def file_client_db(self, tmp_path):
+        """
+        Build DatabaseClients on a file-backed SQLite database in tmp_path.
+        
+        Call it with an optional connection string and any extra
+        services.database settings, e.g. sqlite={"thread_readers": True}.
+        """
+        clients = []
+        
+        def make(connection=None, **opts):
+            config = ConfigManager()
+            config.update_many({
+                "services": {
+                    "database": {
+                        "type": "sqlite",
+                        "connection": connection or str(tmp_path / "test.db"),
+                        **opts
+                    }
+                }
+            })
+            client = DatabaseClient(config)
+            clients.append(client)
+            return client
+            
+        yield make
+        
+        for client in clients:
+            client.close()
+    
     def test_connection_pooling(self, db_client):
         """Test database connection pooling."""
         # Get multiple connections
@@ -47,8 +108,9 @@ class TestDatabaseClient:
             conn = db_client.connect()
             connections.append(conn)
             
-        # All connections should be different
-        assert len(set(connections)) == 3
+        # In-memory SQLite shares one connection so all threads see the
+        # same database
+        assert len(set(connections)) == 1
         
         # Release all connections
         for conn in connections:
@@ -71,7 +133,8 @@ class TestDatabaseClient:
         assert rows[0]["name"] == "Test 1"
         assert rows[1]["name"] == "Test 2"
     
-    def test_executemany(self, db_client):
+    @pytest.mark.parametrize("batch_size", [None, 2])
+    def test_executemany(self, db_client, batch_size):
         """Test executing multiple queries in batch."""
         # Create a table
         db_client.execute("CREATE TABLE batch_test (id INTEGER PRIMARY KEY, name TEXT)")
@@ -88,7 +151,8 @@ class TestDatabaseClient:
         # Execute batch insert
         affected = db_client.executemany(
             "INSERT INTO batch_test (name) VALUES (?)",
-            batch_data
+            batch_data,
+            batch_size=batch_size
         )
         
         # Check affected rows
@@ -98,6 +162,32 @@ class TestDatabaseClient:
         rows = db_client.query("SELECT * FROM batch_test ORDER BY id")
         assert len(rows) == 5
         assert rows[2]["name"] == "Item 3"
+        
+        # Named parameters are not rewritten into multi-row VALUES
+        affected = db_client.executemany(
+            "INSERT INTO batch_test (name) VALUES (:name)",
+            [{"name": "Item 6"}, {"name": "Item 7"}],
+            batch_size=batch_size
+        )
+        assert affected == 2
+        
+        rows = db_client.query("SELECT * FROM batch_test ORDER BY id")
+        assert [row["name"] for row in rows[5:]] == ["Item 6", "Item 7"]
+    
+    def test_bulk_load(self, db_client):
+        """Test bulk loading rows from a generator."""
+        db_client.execute("CREATE TABLE bulk_test (id INTEGER PRIMARY KEY, name TEXT)")
+        
+        rows = ((i, f"Item {i}") for i in range(25))
+        assert db_client.bulk_load("bulk_test", ["id", "name"], rows, chunk_size=10) == 25
+        
+        count = db_client.query_one("SELECT COUNT(*) as count FROM bulk_test")
+        assert count["count"] == 25
+        
+        # Names are interpolated into the SQL, so only identifiers are accepted
+        with pytest.raises(DatabaseError) as exc_info:
+            db_client.bulk_load("bulk_test; DROP TABLE bulk_test", ["id"], [(1,)])
+        assert exc_info.value.error_code == "DB-011"
     
     def test_query_one(self, db_client):
         """Test querying a single row."""
@@ -115,6 +205,31 @@ class TestDatabaseClient:
         # Query non-existent row
         row = db_client.query_one("SELECT * FROM single_test WHERE id = 999")
         assert row is None
+
+    def test_limit_one(self):
+        """Test that LIMIT 1 is only appended to unlimited SELECTs."""
+        assert _limit_one("SELECT * FROM t WHERE x = ?;") == "SELECT * FROM t WHERE x = ? LIMIT 1"
+        assert _limit_one("SELECT * FROM t LIMIT 5") == "SELECT * FROM t LIMIT 5"
+        assert _limit_one("SELECT * FROM t FETCH FIRST 2 ROWS ONLY") == "SELECT * FROM t FETCH FIRST 2 ROWS ONLY"
+        assert _limit_one("DELETE FROM t RETURNING id") == "DELETE FROM t RETURNING id"
+
+    def test_query_chunks(self, db_client):
+        """Test streaming query results as column-oriented chunks."""
+        # Create and populate table
+        db_client.execute("CREATE TABLE chunk_test (id INTEGER PRIMARY KEY, name TEXT)")
+        db_client.executemany(
+            "INSERT INTO chunk_test (name) VALUES (?)",
+            [[f"Item {i}"] for i in range(5)]
+        )
+        
+        # Stream in chunks of two rows
+        chunks = list(db_client.query_chunks("SELECT * FROM chunk_test ORDER BY id", chunk_size=2))
+        
+        # Check chunk layout
+        assert len(chunks) == 3
+        assert chunks[0]["id"] == (1, 2)
+        assert chunks[0]["name"] == ("Item 0", "Item 1")
+        assert chunks[2]["name"] == ("Item 4",)
     
     def test_transaction(self, db_client):
         """Test transaction support."""
@@ -123,8 +238,10 @@ class TestDatabaseClient:
         
         # Start transaction
         with db_client.transaction():
-            db_client.execute("INSERT INTO test_transaction (name) VALUES (?)", ["Transaction 1"])
-            db_client.execute("INSERT INTO test_transaction (name) VALUES (?)", ["Transaction 2"])
+            db_client.executemany(
+                "INSERT INTO test_transaction (name) VALUES (?)",
+                [["Transaction 1"], ["Transaction 2"]]
+            )
         
         # Check data was committed
         rows = db_client.query("SELECT * FROM test_transaction ORDER BY id")
@@ -187,11 +304,9 @@ class TestDatabaseClient:
         assert final_check[2]["value"] == "Outer 2"
         assert final_check[3]["value"] == "Outer 3"
     
+    @pytest.mark.slow
     def test_connection_error_handling(self):
         """Test handling of connection errors."""
-        from services.database import DatabaseClient
-        from core.config import ConfigManager
-        
         # Configure with invalid connection
         config = ConfigManager()
         config.set("services.database.type", "sqlite")
@@ -209,6 +324,149 @@ class TestDatabaseClient:
         # Clean up
         db.close()
     
+    def test_sqlite_reader_pool(self, file_client_db):
+        """Test that file-backed SQLite reads use a read-only pool."""
+        db = file_client_db()
+        
+        # Writes go through the single writer connection
+        db.execute("CREATE TABLE reader_test (id INTEGER PRIMARY KEY, name TEXT)")
+        db.execute("INSERT INTO reader_test (name) VALUES (?)", ["Written"])
+        
+        # Reads see committed writes
+        rows = db.query("SELECT * FROM reader_test")
+        assert len(rows) == 1
+        assert rows[0]["name"] == "Written"
+        
+        # While this thread holds the writer in a transaction, another
+        # thread's read runs on a reader and sees only committed rows
+        results = []
+        with db.transaction():
+            db.execute("INSERT INTO reader_test (name) VALUES (?)", ["Uncommitted"])
+            
+            reader = threading.Thread(target=lambda: results.append(db.query("SELECT * FROM reader_test")))
+            reader.start()
+            reader.join(timeout=5)
+            assert not reader.is_alive()
+            
+        assert [row["name"] for row in results[0]] == ["Written"]
+        assert len(db.query("SELECT * FROM reader_test")) == 2
+    
+    def test_async_queries(self, file_client_db):
+        """Test the async query methods."""
+        db = file_client_db()
+        db.execute("CREATE TABLE async_test (id INTEGER PRIMARY KEY, name TEXT)")
+        
+        async def run():
+            await db.async_executemany(
+                "INSERT INTO async_test (name) VALUES (?)",
+                [["Item 1"], ["Item 2"]]
+            )
+            rows, count = await asyncio.gather(
+                db.async_query("SELECT * FROM async_test ORDER BY id"),
+                db.async_query_one("SELECT COUNT(*) as count FROM async_test")
+            )
+            return rows, count
+            
+        rows, count = asyncio.run(run())
+        assert rows[1]["name"] == "Item 2"
+        assert count["count"] == 2
+    
+    def test_memory_database_shared_across_threads(self, db_client):
+        """Test that other threads see the same in-memory database."""
+        db_client.execute("CREATE TABLE shared_test (id INTEGER PRIMARY KEY, name TEXT)")
+
+        def insert_row():
+            db_client.execute("INSERT INTO shared_test (name) VALUES (?)", ["Threaded"])
+
+        threads = [threading.Thread(target=insert_row) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        count = db_client.query_one("SELECT COUNT(*) as count FROM shared_test")
+        assert count["count"] == 3
+
+    def test_memory_uri_database(self, file_client_db):
+        """Test that in-memory URI databases open as URIs on one shared connection."""
+        db = file_client_db("file:uri_test?mode=memory&cache=shared")
+        
+        # Every borrower gets the same connection
+        conn1 = db.connect()
+        conn2 = db.connect()
+        assert conn1 is conn2
+        db.release(conn2)
+        db.release(conn1)
+        
+        db.execute("CREATE TABLE uri_test (id INTEGER PRIMARY KEY, name TEXT)")
+        db.execute("INSERT INTO uri_test (name) VALUES (?)", ["Memory"])
+        assert db.query_one("SELECT name FROM uri_test")["name"] == "Memory"
+    
+    def test_thread_reader_connections(self, file_client_db):
+        """Test that each thread reads on its own connection when enabled."""
+        db = file_client_db(sqlite={"thread_readers": True})
+        db.execute("CREATE TABLE reader_test (id INTEGER PRIMARY KEY, name TEXT)")
+        db.execute("INSERT INTO reader_test (name) VALUES (?)", ["Reader"])
+        
+        connections = []
+        barrier = threading.Barrier(3)
+        
+        def read():
+            assert db.query_one("SELECT name FROM reader_test")["name"] == "Reader"
+            connections.append(db.get_thread_connection())
+            
+            # Keep every thread alive until all have read
+            barrier.wait()
+            
+        threads = [threading.Thread(target=read) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+            
+        assert len({id(conn) for conn in connections}) == 3
+        assert db.get_thread_connection() is db.get_thread_connection()
+        
+        # Reader connections reject writes
+        with pytest.raises(sqlite3.OperationalError):
+            db.get_thread_connection().execute("INSERT INTO reader_test (name) VALUES ('Rejected')")
+            
+        db.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            connections[0].execute("SELECT 1")
+    
+    def test_pool_reaps_idle_connections(self):
+        """Test that idle connections above the minimum are closed."""
+        pool = ConnectionPool(
+            lambda: sqlite3.connect(":memory:"),
+            min_connections=1,
+            max_connections=3,
+            idle_timeout=0
+        )
+
+        connections = [pool.get_connection() for _ in range(3)]
+        assert len(set(connections)) == 3
+
+        time.sleep(0.01)
+        for conn in connections:
+            pool.return_connection(conn)
+
+        # Only the minimum number of connections should remain open
+        closed = 0
+        for conn in connections:
+            try:
+                conn.execute("SELECT 1")
+            except sqlite3.ProgrammingError:
+                closed += 1
+        assert closed == 2
+        
+        # The survivor is handed out again
+        conn = pool.get_connection()
+        assert conn in connections
+        pool.return_connection(conn)
+
+        pool.close_all()
+
     def test_query_error_handling(self, db_client):
         """Test handling of query errors."""
         # Execute invalid query
@@ -218,9 +476,9 @@ class TestDatabaseClient:
         assert "Query execution failed" in str(exc_info.value)
         assert exc_info.value.error_code == "DB-004"
     
-    def test_connection_reuse_in_context(self, db_client):
+    def test_connection_reuse_in_context(self, own_client):
         """Test connection reuse when using context manager."""
-        with db_client as client:
+        with own_client as client:
             # First query should get a connection
             client.execute("CREATE TABLE context_test (id INTEGER PRIMARY KEY, value TEXT)")
             client.execute("INSERT INTO context_test (value) VALUES (?)", ["Test"])
@@ -232,10 +490,9 @@ class TestDatabaseClient:
     
     def test_concurrent_access(self, db_client):
         """Test concurrent database access."""
-        # Skip for SQLite memory database which doesn't support true concurrency
-        if ":memory:" in db_client.config.get("services.database.connection", ""):
-            pytest.skip("In-memory SQLite doesn't support concurrent access")
-            
+        # The in-memory database is one shared connection, and a transaction
+        # holds it, so each read-increment-write runs without interleaving
+        
         # Set up a test table
         db_client.execute("CREATE TABLE concurrent_test (id INTEGER PRIMARY KEY, counter INTEGER)")
         db_client.execute("INSERT INTO concurrent_test (id, counter) VALUES (1, 0)")
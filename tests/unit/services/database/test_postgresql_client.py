@@ -0,0 +1,61 @@
+import uuid
+import pytest
+from datetime import date
+from decimal import Decimal
+
+pytest.importorskip("psycopg2")
+postgresql_client = pytest.importorskip("services.database.postgresql_client", exc_type=ImportError)
+
+from psycopg2.extras import Json
+
+PostgreSQLClient = postgresql_client.PostgreSQLClient
+
+# Scalar rows can be sent with COPY; rows with arrays or JSON cannot
+SCALAR_ROWS = [
+    (1, "tab\there\nnew line \\ backslash", Decimal("1.50"), True, date(2024, 1, 2), b"\x00\xff", None, None),
+    (2, None, None, None, None, None, None, None),
+]
+MIXED_ROWS = [
+    (1, "text", Decimal("2.25"), False, date(2024, 3, 4), b"\x01", [1, 2], Json({"key": [1, "a"]})),
+    (2, None, None, None, None, None, [], Json({})),
+]
+
+class TestPostgreSQLClient:
+    """Test suite for PostgreSQLClient, run against POSTGRES_TEST_HOST."""
+    
+    @pytest.fixture
+    def client(self, postgres_config):
+        """Create a PostgreSQLClient for the test server."""
+        client = PostgreSQLClient(postgres_config)
+        yield client
+        client.close()
+    
+    @pytest.mark.parametrize("rows", [SCALAR_ROWS, MIXED_ROWS], ids=["scalar", "mixed"])
+    def test_copy_matches_execute_values(self, client, rows):
+        """Test that executemany stores the same data above and below copy_threshold."""
+        results = []
+        
+        for threshold in (1, len(rows) + 1):
+            client.config.set("services.database.postgresql.copy_threshold", threshold)
+            table = f"copy_test_{uuid.uuid4().hex}"
+            client.execute(
+                f"CREATE TABLE {table} (id INTEGER, name TEXT, amount NUMERIC, flag BOOLEAN, "
+                f"day DATE, data BYTEA, tags INTEGER[], meta JSONB)"
+            )
+            
+            try:
+                client.executemany(
+                    f"INSERT INTO {table} (id, name, amount, flag, day, data, tags, meta) "
+                    f"VALUES (%s, %s, %s, %s, %s, %s, %s, %s)",
+                    rows
+                )
+                results.append([
+                    {key: bytes(value) if isinstance(value, memoryview) else value for key, value in row.items()}
+                    for row in client.query(f"SELECT * FROM {table} ORDER BY id")
+                ])
+            finally:
+                client.execute(f"DROP TABLE {table}")
+                
+        assert results[0] == results[1]
+        assert results[0][0]["name"] == rows[0][1]
+        assert results[0][0]["data"] == rows[0][5]
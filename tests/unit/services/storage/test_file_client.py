@@ -2,17 +2,19 @@ import os
 import pytest
 import json
 import csv
+import math
+import shutil
 from pathlib import Path
 
+from core.config.config_manager import ConfigManager
+from services.storage.file_client import FileClient
+
 class TestFileClient:
     """Test suite for FileClient."""
     
     @pytest.fixture
     def file_client(self):
         """Create a FileClient instance for testing."""
-        from services.storage.file_client import FileClient
-        from core.config.config_manager import ConfigManager
-        
         config = ConfigManager()
         return FileClient(config)
     
@@ -37,6 +39,17 @@ class TestFileClient:
         content = file_client.read_text(test_file)
         assert content == test_content
     
+    def test_read_large_text_file(self, file_client, test_dir):
+        """Test reading a text file large enough to be memory-mapped."""
+        test_file = test_dir / "large.txt"
+        
+        # Multi-byte characters and CRLF pairs straddle the chunk boundaries
+        line = "caf\u00e9 \u2603 line\r\n"
+        test_file.write_bytes((line * 100000).encode('utf-8'))
+        
+        content = file_client.read_text(test_file)
+        assert content == "caf\u00e9 \u2603 line\n" * 100000
+    
     def test_read_write_binary_file(self, file_client, test_dir):
         """Test reading and writing binary files."""
         # Define test file
@@ -50,6 +63,67 @@ class TestFileClient:
         content = file_client.read_binary(test_file)
         assert content == test_content
     
+    def test_read_binary_direct(self, file_client, test_dir):
+        """Test reading a binary file with O_DIRECT."""
+        test_file = test_dir / "direct.bin"
+        test_content = os.urandom(10000)
+        test_file.write_bytes(test_content)
+        
+        # Falls back to a buffered read where O_DIRECT is unsupported
+        content = file_client.read_binary(test_file, direct=True)
+        assert bytes(content) == test_content
+    
+    def test_read_binary_mmap(self, file_client, test_dir):
+        """Test memory-mapping binary files above a size threshold."""
+        test_file = test_dir / "mapped.bin"
+        test_content = os.urandom(10000)
+        test_file.write_bytes(test_content)
+        
+        content = file_client.read_binary(test_file, mmap_threshold=4096)
+        assert isinstance(content, memoryview)
+        assert bytes(content) == test_content
+        
+        # Smaller files are still read into bytes
+        assert file_client.read_binary(test_file, mmap_threshold=1 << 20) == test_content
+    
+    def test_iter_binary(self, file_client, test_dir):
+        """Test streaming a binary file in chunks."""
+        test_file = test_dir / "stream.bin"
+        test_content = os.urandom(10000)
+        test_file.write_bytes(test_content)
+        
+        chunks = list(file_client.iter_binary(test_file, chunk_size=4096))
+        assert [len(chunk) for chunk in chunks] == [4096, 4096, 1808]
+        assert b"".join(chunks) == test_content
+    
+    def test_read_many_binary(self, file_client, test_dir):
+        """Test reading several binary files at once."""
+        paths = []
+        for i in range(5):
+            path = test_dir / f"file_{i}.bin"
+            path.write_bytes(bytes([i]) * (i + 1))
+            paths.append(path)
+            
+        # Results come back in the order the paths were given
+        contents = file_client.read_many_binary(paths)
+        assert contents == [bytes([i]) * (i + 1) for i in range(5)]
+        
+        with pytest.raises(FileNotFoundError):
+            file_client.read_many_binary(paths + [test_dir / "missing.bin"])
+    
+    def test_write_many(self, file_client, test_dir):
+        """Test writing several files into one directory."""
+        shard_dir = test_dir / "shards"
+        files = {f"shard_{i}.csv": f"id\n{i}\n".encode() for i in range(4)}
+        file_client.write_many(shard_dir, files)
+        
+        for name, content in files.items():
+            assert (shard_dir / name).read_bytes() == content
+            
+        # Existing files are truncated
+        file_client.write_many(shard_dir, {"shard_0.csv": b"id\n"})
+        assert (shard_dir / "shard_0.csv").read_bytes() == b"id\n"
+    
     def test_read_write_json_file(self, file_client, test_dir):
         """Test reading and writing JSON files."""
         # Define test file
@@ -63,6 +137,52 @@ class TestFileClient:
         data = file_client.read_json(test_file)
         assert data == test_data
     
+    def test_json_fallback_formats(self, file_client, test_dir):
+        """Test JSON that orjson cannot write is still written correctly."""
+        test_file = test_dir / "fallback.json"
+        test_data = {"big": 2 ** 70, "nested": {"key": "value"}}
+        
+        # Integers beyond 64 bits and non-2 indents go through the json module
+        file_client.write_json(test_file, test_data, indent=4)
+        assert test_file.read_text().startswith('{\n    "big"')
+        assert file_client.read_json(test_file) == test_data
+        
+        # Non-UTF-8 files are encoded and decoded by the json module
+        file_client.write_json(test_file, {"city": "Zürich"}, encoding="latin-1")
+        assert file_client.read_json(test_file, encoding="latin-1") == {"city": "Zürich"}
+        
+        # Invalid JSON still raises the standard decode error
+        test_file.write_text("{invalid")
+        with pytest.raises(json.JSONDecodeError):
+            file_client.read_json(test_file)
+    
+    def test_json_non_finite_round_trip(self, file_client, test_dir):
+        """Test that NaN and infinities survive a write and read."""
+        test_file = test_dir / "non_finite.json"
+        test_data = {"nan": float("nan"), "values": [float("inf"), -float("inf"), 1.5, None]}
+        
+        file_client.write_json(test_file, test_data)
+        assert "NaN" in test_file.read_text()
+        
+        for data in (file_client.read_json(test_file), file_client.read_many_json([test_file])[0]):
+            assert math.isnan(data["nan"])
+            assert data["values"] == [float("inf"), -float("inf"), 1.5, None]
+    
+    def test_read_many_json(self, file_client, test_dir):
+        """Test reading several JSON files at once."""
+        paths = []
+        for i in range(3):
+            path = test_dir / f"config_{i}.json"
+            file_client.write_json(path, {"shard": i, "name": f"Shard {i}"})
+            paths.append(path)
+            
+        assert file_client.read_many_json(paths) == [{"shard": i, "name": f"Shard {i}"} for i in range(3)]
+        assert file_client.read_many_json(paths, encoding="latin-1")[2] == {"shard": 2, "name": "Shard 2"}
+        
+        paths[1].write_text("{invalid")
+        with pytest.raises(json.JSONDecodeError):
+            file_client.read_many_json(paths)
+    
     def test_read_write_csv_file(self, file_client, test_dir):
         """Test reading and writing CSV files."""
         # Define test file
@@ -86,6 +206,77 @@ class TestFileClient:
         # Check data (excluding headers)
         assert data[1:] == rows
     
+    def test_iter_csv(self, file_client, test_dir):
+        """Test streaming rows from a CSV file."""
+        test_file = test_dir / "stream.csv"
+        rows = [["Alice", "30"], ["Bob", "25"]]
+        file_client.write_csv(test_file, rows, headers=["name", "age"])
+        
+        assert list(file_client.iter_csv(test_file)) == [["name", "age"]] + rows
+        assert list(file_client.iter_csv(test_file, skip_header=True, buffer_size=16)) == rows
+        
+        with pytest.raises(FileNotFoundError):
+            next(file_client.iter_csv(test_dir / "missing.csv"))
+    
+    def test_write_csv_dicts(self, file_client, test_dir):
+        """Test writing dictionary rows to a CSV file."""
+        test_file = test_dir / "dicts.csv"
+        rows = [
+            {"name": "Alice", "age": 30, "city": "New York"},
+            {"name": "Bob", "age": 25},
+        ]
+        file_client.write_csv_dicts(test_file, rows, headers=["name", "age"])
+        
+        # Extra keys are ignored and values are written in header order
+        assert file_client.read_csv(test_file) == [["name", "age"], ["Alice", "30"], ["Bob", "25"]]
+        
+        file_client.write_csv_dicts(test_file, rows, headers=["name", "city"])
+        assert file_client.read_csv(test_file)[2] == ["Bob", ""]
+    
+    def test_write_csv_fast(self, file_client, test_dir):
+        """Test that the fast CSV writer matches the csv module."""
+        headers = ["id", "name"]
+        
+        for rows in ([["1", "Alice"], ["2", "Bob"]], [["1", "Smith, John"], ["2", 'Say "hi"']]):
+            fast_file = test_dir / "fast.csv"
+            slow_file = test_dir / "slow.csv"
+            file_client.write_csv(fast_file, rows, headers=headers, fast=True)
+            file_client.write_csv(slow_file, rows, headers=headers)
+            assert fast_file.read_bytes() == slow_file.read_bytes()
+    
+    def test_read_csv_polars_engine(self, file_client, test_dir):
+        """Test that the polars engine returns the same rows as the csv module."""
+        pytest.importorskip("polars")
+        
+        test_file = test_dir / "engine.csv"
+        file_client.write_csv(test_file, [["1", "Alice", ""], ["2", "Bob", "x"]], headers=["id", "name", "note"])
+        
+        assert file_client.read_csv(test_file, engine="polars") == file_client.read_csv(test_file)
+        
+        df = file_client.read_csv_arrow(test_file)
+        assert df.columns == ["id", "name", "note"]
+        assert df.height == 2
+    
+    def test_read_csv_pyarrow_engine(self, file_client, test_dir):
+        """Test that the pyarrow engine returns the same rows as the csv module."""
+        pytest.importorskip("pyarrow")
+        
+        test_file = test_dir / "pyarrow_engine.csv"
+        file_client.write_csv(test_file, [["007", "Alice", ""], ["2", "Bob", "line 1\nline 2"]], headers=["id", "name", "note"])
+        
+        assert file_client.read_csv(test_file, engine="pyarrow") == file_client.read_csv(test_file)
+    
+    def test_write_csv_arrow(self, file_client, test_dir):
+        """Test writing a pyarrow Table to CSV."""
+        pa = pytest.importorskip("pyarrow")
+        
+        test_file = test_dir / "arrow.csv"
+        table = pa.table({"id": [1, 2], "name": ["Alice", "Bob"]})
+        file_client.write_csv_arrow(test_file, table, delimiter=";")
+        
+        rows = file_client.read_csv(test_file, delimiter=";")
+        assert rows == [["id", "name"], ["1", "Alice"], ["2", "Bob"]]
+    
     def test_file_operations(self, file_client, test_dir):
         """Test file operations like copy, move, delete."""
         # Create a test file
@@ -97,6 +288,13 @@ class TestFileClient:
         file_client.copy(source_file, dest_file)
         assert dest_file.exists()
         assert file_client.read_text(dest_file) == "Test content"
+        assert dest_file.stat().st_mtime == source_file.stat().st_mtime
+        
+        # Copy into a directory keeps the file name
+        copy_dir = test_dir / "copies"
+        copy_dir.mkdir()
+        file_client.copy(source_file, copy_dir)
+        assert file_client.read_text(copy_dir / "source.txt") == "Test content"
         
         # Move file
         moved_file = test_dir / "moved.txt"
@@ -108,6 +306,49 @@ class TestFileClient:
         file_client.delete(moved_file)
         assert not moved_file.exists()
     
+    def test_write_after_directory_removed(self, file_client, test_dir, monkeypatch):
+        """Test that writes recreate cached directories deleted since."""
+        monkeypatch.chdir(test_dir)
+        nested = test_dir / "cached" / "nested"
+        file_client.write_text(nested / "first.txt", "First")
+        
+        # Deleted outside the client
+        shutil.rmtree(test_dir / "cached")
+        file_client.write_text(nested / "second.txt", "Second")
+        assert (nested / "second.txt").read_text() == "Second"
+        
+        # Deleted through the client using a relative spelling of the path
+        file_client.delete_directory(Path("cached"))
+        file_client.write_binary(nested / "third.bin", b"Third")
+        assert (nested / "third.bin").read_bytes() == b"Third"
+        
+        shutil.rmtree(test_dir / "cached")
+        file_client.create_directory(nested)
+        assert nested.is_dir()
+    
+    def test_copy_same_file(self, file_client, test_dir):
+        """Test that copying a file onto itself fails without truncating it."""
+        source_file = test_dir / "source.txt"
+        file_client.write_text(source_file, "Test content")
+        
+        link_file = test_dir / "link.txt"
+        os.link(source_file, link_file)
+        
+        for destination in (source_file, link_file):
+            with pytest.raises(shutil.SameFileError):
+                file_client.copy(source_file, destination)
+            assert file_client.read_text(source_file) == "Test content"
+    
+    def test_copy_pseudo_file(self, file_client, test_dir):
+        """Test copying a /proc file that reports a size of 0."""
+        source_file = Path("/proc/version")
+        if not source_file.is_file():
+            pytest.skip("/proc is not available")
+            
+        dest_file = test_dir / "version.txt"
+        file_client.copy(source_file, dest_file)
+        assert dest_file.read_bytes() == source_file.read_bytes() != b""
+    
     def test_directory_operations(self, file_client, test_dir):
         """Test directory operations."""
         # Create directory
@@ -124,6 +365,18 @@ class TestFileClient:
         assert len(files) == 1
         assert files[0].name == "test.txt"
         
-        # Delete directory
+        # Filter by pattern, including patterns that span directories
+        file_client.write_text(new_dir / "other.log", "Log content")
+        file_client.write_text(new_dir / "sub" / "deep.txt", "Deep content")
+        assert [f.name for f in file_client.list_directory(new_dir, "*.txt")] == ["test.txt"]
+        assert sorted(file_client.scandir_names(new_dir)) == ["other.log", "sub", "test.txt"]
+        assert sorted(f.name for f in file_client.list_directory(new_dir, "**/*.txt")) == ["deep.txt", "test.txt"]
+        
+        # Delete directory, including several subdirectories
+        file_client.write_text(new_dir / "sub2" / "nested" / "deeper.txt", "Deeper content")
         file_client.delete_directory(new_dir)
-        assert not new_dir.exists()
\ No newline at end of file
+        assert not new_dir.exists()
+        
+        # Writing again recreates the deleted directory
+        file_client.write_text(new_dir / "nested" / "again.txt", "Test content")
+        assert (new_dir / "nested" / "again.txt").exists()
@@ -1,11 +1,47 @@
 import json
+import os
+import sys
+import time
 from typing import Any, List, Dict, Optional, Union, Iterable
 from contextlib import contextmanager
+from functools import lru_cache
 
 from core.base.base_service import BaseService
 from core.interfaces.configurable import Configurable
 from core.interfaces.loggable import Loggable
 
+@lru_cache(maxsize=None)
+def _load_rich():
+    """
+    Import the Rich components once per process.
+    
+    Returns:
+        dict: Rich classes by name, or None if Rich is not installed.
+    """
+    try:
+        from rich.console import Console
+        from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
+        from rich.table import Table
+        from rich.syntax import Syntax
+        from rich.panel import Panel
+        from rich.markdown import Markdown
+        from rich.rule import Rule
+    except ImportError:
+        return None
+        
+    return {
+        "Console": Console,
+        "Progress": Progress,
+        "BarColumn": BarColumn,
+        "TextColumn": TextColumn,
+        "TimeRemainingColumn": TimeRemainingColumn,
+        "Table": Table,
+        "Syntax": Syntax,
+        "Panel": Panel,
+        "Markdown": Markdown,
+        "Rule": Rule
+    }
+
 class ConsoleService(BaseService, Configurable, Loggable):
     """
     Service for enhanced console output using Rich library.
@@ -23,36 +59,23 @@ class ConsoleService(BaseService, Configurable, Loggable):
         self.configure(config)
         self.initialize_logger("console_service")
         
-        # Import Rich components
-        try:
-            from rich.console import Console
-            from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
-            from rich.table import Table
-            from rich.syntax import Syntax
-            from rich.panel import Panel
-            from rich.markdown import Markdown
-            from rich.rule import Rule
-            
-            self._rich_available = True
-            self._console = Console()
-            self._rich_modules = {
-                "Console": Console,
-                "Progress": Progress,
-                "BarColumn": BarColumn,
-                "TextColumn": TextColumn,
-                "TimeRemainingColumn": TimeRemainingColumn,
-                "Table": Table,
-                "Syntax": Syntax,
-                "Panel": Panel,
-                "Markdown": Markdown,
-                "Rule": Rule
-            }
-            
+        # Rich components are imported once and shared by every instance
+        self._rich_modules = _load_rich()
+        self._rich_available = self._rich_modules is not None
+        
+        if self._rich_available:
+            self._console = self._rich_modules["Console"]()
             self.logger.info("Rich library loaded successfully")
-        except ImportError:
-            self._rich_available = False
+        else:
             self._console = None
             self.logger.warning("Rich library not available. Install with: pip install rich")
+            
+        # orjson serializes several times faster than the json module
+        try:
+            import orjson
+            self._orjson = orjson
+        except ImportError:
+            self._orjson = None
     
     def print(self, *args, style: Optional[str] = None, **kwargs) -> None:
         """
@@ -84,8 +107,9 @@ class ConsoleService(BaseService, Configurable, Loggable):
                 print("\t".join(headers))
                 print("-" * (sum(len(h) for h in headers) + len(headers) * 2))
             
-            for row in data:
-                print("\t".join(str(cell) for cell in row))
+            # One write for the whole table rather than one print per row
+            if data:
+                print("\n".join("\t".join(map(str, row)) for row in data))
             return
             
         Table = self._rich_modules["Table"]
@@ -96,9 +120,9 @@ class ConsoleService(BaseService, Configurable, Loggable):
             for header in headers:
                 table.add_column(header)
                 
-        # Add rows
+        # Add rows; str() returns str cells unchanged, so map costs no copy
         for row in data:
-            table.add_row(*[str(cell) for cell in row])
+            table.add_row(*map(str, row))
             
         self._console.print(table)
     
@@ -110,17 +134,17 @@ class ConsoleService(BaseService, Configurable, Loggable):
             data: Data to format as JSON.
             title: Optional title.
         """
-        if not self._rich_available:
+        if self._plain_output():
             # Fallback to simple JSON printing
             if title:
                 print(f"=== {title} ===")
-            print(json.dumps(data, indent=2))
+            print(self._format_json(data))
             return
             
         Syntax = self._rich_modules["Syntax"]
         Panel = self._rich_modules["Panel"]
         
-        json_str = json.dumps(data, indent=2)
+        json_str = self._format_json(data)
         syntax = Syntax(json_str, "json", theme="monokai", word_wrap=True)
         
         if title:
@@ -129,6 +153,44 @@ class ConsoleService(BaseService, Configurable, Loggable):
         else:
             self._console.print(syntax)
     
+    def _plain_output(self) -> bool:
+        """
+        Check whether to skip Rich rendering.
+        
+        Highlighting and markdown rendering are wasted when output is
+        redirected to a file or pipe, so plain text is written instead.
+        
+        Returns:
+            bool: True if Rich is unavailable or output is not a terminal
+                or notebook.
+        """
+        if not self._rich_available:
+            return True
+            
+        return not self._console.is_terminal and not self._console.is_jupyter
+    
+    def _format_json(self, data: Any) -> str:
+        """
+        Serialize data as JSON indented by two spaces.
+        
+        Uses orjson when it is installed, falling back to the json module
+        for data orjson rejects, such as integers beyond 64 bits.
+        
+        Args:
+            data: Data to serialize.
+            
+        Returns:
+            str: The formatted JSON.
+        """
+        if self._orjson is not None:
+            orjson = self._orjson
+            try:
+                return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+            except orjson.JSONEncodeError:
+                pass
+                
+        return json.dumps(data, indent=2)
+    
     def print_markdown(self, markdown_text: str) -> None:
         """
         Print markdown text with formatting.
@@ -136,7 +198,7 @@ class ConsoleService(BaseService, Configurable, Loggable):
         Args:
             markdown_text: Markdown formatted text.
         """
-        if not self._rich_available:
+        if self._plain_output():
             # Fallback to simple text printing
             print(markdown_text)
             return
@@ -207,14 +269,34 @@ class ConsoleService(BaseService, Configurable, Loggable):
             task_id = progress.add_task(description, total=total)
             
             class ProgressWrapper:
+                # Rich redraws at most ten times a second, so advances are
+                # coalesced and forwarded at a similar rate
+                FLUSH_INTERVAL = 0.05
+                
                 def __init__(self, progress, task_id):
                     self.progress = progress
                     self.task_id = task_id
+                    self._pending = 0
+                    self._last_flush = time.monotonic()
                     
                 def advance(self, amount=1):
-                    self.progress.update(self.task_id, advance=amount)
+                    self._pending += amount
+                    now = time.monotonic()
+                    if now - self._last_flush >= self.FLUSH_INTERVAL:
+                        self.flush(now)
+                        
+                def flush(self, now=None):
+                    if self._pending:
+                        self.progress.update(self.task_id, advance=self._pending)
+                        self._pending = 0
+                    self._last_flush = time.monotonic() if now is None else now
                     
-            yield ProgressWrapper(progress, task_id)
+            wrapper = ProgressWrapper(progress, task_id)
+            try:
+                yield wrapper
+            finally:
+                # Show the final count before the bar is closed
+                wrapper.flush()
     
     @contextmanager
     def status(self, message: str) -> None:
@@ -240,9 +322,13 @@ class ConsoleService(BaseService, Configurable, Loggable):
         """
         if self._rich_available:
             self._console.clear()
-        else:
-            import os
-            os.system('cls' if os.name == 'nt' else 'clear')
+        elif sys.stdout.isatty():
+            # Legacy Windows consoles don't understand ANSI escapes
+            if os.name == 'nt' and not any(key in os.environ for key in ('WT_SESSION', 'ANSICON', 'TERM')):
+                os.system('cls')
+            else:
+                sys.stdout.write("\x1b[2J\x1b[H")
+                sys.stdout.flush()
     
     def get_console(self) -> Any:
         """